@@ -0,0 +1,115 @@
+"""
+Micro-benchmark of the logging overhead of the MCP Orchestrator.
+
+This script measures the time of a context gathering call with multi-megabyte
+payloads when the orchestrator logs at INFO level, with and without its
+hot-path debug logging, and compares it with the cost of eagerly formatting
+the payloads as the log messages used to.
+
+Run it from the repository root, optionally with -O to also remove the
+hot-path log calls at compile time:
+
+    python -m benchmarks.bench_logging
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+# A query and a context the size of a screenshot
+PAYLOAD = "x" * (4 * 1024 * 1024)
+ITERATIONS = 2000
+
+
+class StaticMCP:
+    """An MCP answering immediately with a fixed context."""
+    
+    def __init__(self, context: str):
+        """
+        Initialize the StaticMCP.
+        
+        Args:
+            context: The context to return.
+        """
+        self.context = context
+    
+    async def get_context(self, query_data: Any) -> str:
+        """Return the fixed context."""
+        return self.context
+    
+    async def update_context(self, response_data: Any) -> None:
+        """Ignore the update."""
+
+
+async def measure(orchestrator: McpOrchestrator) -> float:
+    """
+    Measure the mean time of a gather and update cycle.
+    
+    Args:
+        orchestrator: The orchestrator to measure.
+    
+    Returns:
+        The mean time per cycle in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await orchestrator.gather_and_combine_context(PAYLOAD)
+        await orchestrator.propagate_update(PAYLOAD)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def measure_eager_formatting() -> float:
+    """
+    Measure the formatting cost of the former f-string log messages.
+    
+    Returns:
+        The mean time per cycle in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        f"Gathering context with query: {PAYLOAD}"
+        f"Propagating update with response: {PAYLOAD}"
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def main():
+    """Run the benchmark and print the results."""
+    logger = logging.getLogger("bench_logging")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    
+    mcps = [StaticMCP("context") for _ in range(3)]
+    strategy = SimpleConcatenationStrategy()
+    
+    cases: Dict[str, Callable[[], McpOrchestrator]] = {
+        "INFO, hot-path logging on": lambda: McpOrchestrator(
+            mcps, strategy, logger=logger
+        ),
+        "INFO, hot-path logging off": lambda: McpOrchestrator(
+            mcps, strategy, logger=logger, hot_path_logging=False
+        ),
+    }
+    
+    results: List[str] = []
+    for name, create in cases.items():
+        orchestrator = create()
+        await measure(orchestrator)  # Warm up
+        results.append(f"{name:<32} {await measure(orchestrator):10.1f} us/cycle")
+    
+    results.append(
+        f"{'eager payload formatting alone':<32} "
+        f"{measure_eager_formatting():10.1f} us/cycle"
+    )
+    
+    print(f"Payload size: {len(PAYLOAD)} characters, debug code compiled: {__debug__}")
+    for line in results:
+        print(line)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
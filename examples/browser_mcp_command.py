@@ -10,6 +10,7 @@ import sys
 from typing import Optional
 
 from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.executors import run_in_executor
 from mcp_orchestrator.orchestrator import ErrorPolicy
 from mcp_orchestrator.strategies import SimpleConcatenationStrategy
 
@@ -17,13 +18,18 @@ from mcp_orchestrator.strategies import SimpleConcatenationStrategy
 class NodeBrowserMCP:
     """
     A Browser MCP implementation that uses a Node.js script to send commands.
+    
+    The methods block until the script exits, so the MCP must be adapted
+    with run_in_executor before it is given to an orchestrator.
     """
     
+    supports_update_context = False
+    
     def __init__(self):
         """Initialize the NodeBrowserMCP."""
         self.logger = logging.getLogger(__name__)
     
-    async def get_context(self, query_data: str) -> str:
+    def get_context(self, query_data: str) -> str:
         """
         Send a command to the browser using the Node.js script.
         
@@ -53,7 +59,7 @@ class NodeBrowserMCP:
         self.logger.info(f"Command executed successfully: {stdout}")
         return f"Command sent to browser: {query_data}\nOutput: {stdout}"
     
-    async def update_context(self, response_data: str) -> None:
+    def update_context(self, response_data: str) -> None:
         """Update method (not implemented)."""
         pass
 
@@ -74,8 +80,8 @@ async def main():
     
     logger.info(f"Sending command to Browser MCP: {args.command}")
     
-    # Create the Browser MCP instance
-    browser_mcp = NodeBrowserMCP()
+    # Create the Browser MCP instance, running the script off the event loop
+    browser_mcp = run_in_executor(NodeBrowserMCP(), max_workers=2)
     
     # Create the orchestrator
     orchestrator = McpOrchestrator(
@@ -86,8 +92,11 @@ async def main():
     )
     
     # Execute the command
-    result = await orchestrator.gather_and_combine_context(args.command)
-    logger.info(f"Result: {result}")
+    try:
+        result = await orchestrator.gather_and_combine_context(args.command)
+        logger.info(f"Result: {result}")
+    finally:
+        browser_mcp.close()
 
 
 if __name__ == "__main__":
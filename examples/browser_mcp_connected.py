@@ -27,6 +27,8 @@ class ConnectedBrowserMCP:
     in the browser.
     """
 
+    supports_update_context = False
+
     def __init__(self):
         """Initialize the ConnectedBrowserMCP."""
         self.logger = logging.getLogger(__name__)
@@ -22,6 +22,8 @@ class BrowserMCP:
     It requires the Browser MCP server to be installed and running.
     """
     
+    supports_update_context = False
+    
     def __init__(self, server_process: Optional[subprocess.Popen] = None):
         """
         Initialize the BrowserMCP.
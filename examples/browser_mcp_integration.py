@@ -77,6 +77,8 @@ class RealBrowserMCP:
     This MCP communicates with the Browser MCP server using HTTP requests.
     """
     
+    supports_update_context = False
+    
     def __init__(self, server_process: Optional[subprocess.Popen] = None):
         """
         Initialize the RealBrowserMCP.
@@ -220,6 +222,8 @@ class MockBrowserMCP:
     or communicating with a browser.
     """
     
+    supports_update_context = False
+    
     def __init__(self):
         """Initialize the MockBrowserMCP."""
         self.logger = logging.getLogger(__name__)
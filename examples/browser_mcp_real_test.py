@@ -27,6 +27,8 @@ class RealBrowserMCP:
     This MCP communicates with an already running Browser MCP server.
     """
     
+    supports_update_context = False
+    
     def __init__(self, base_url: str = "http://localhost:3000"):
         """
         Initialize the RealBrowserMCP.
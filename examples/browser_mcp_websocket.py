@@ -168,6 +168,8 @@ class WebSocketBrowserMCP:
     This MCP communicates with the Browser MCP server using WebSockets.
     """
     
+    supports_update_context = False
+    
     def __init__(self, client: BrowserMCPWebSocketClient):
         """
         Initialize the WebSocketBrowserMCP.
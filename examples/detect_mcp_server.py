@@ -8,7 +8,6 @@ and using various protocols.
 import asyncio
 import json
 import logging
-import socket
 import sys
 import time
 from typing import Dict, List, Optional, Tuple
@@ -37,18 +36,17 @@ async def check_tcp_port(host: str, port: int, timeout: float = 1.0) -> bool:
         True if the port is open, False otherwise.
     """
     try:
-        # Create a socket object
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-
-        # Connect to the server
-        result = sock.connect_ex((host, port))
-
-        # Close the socket
-        sock.close()
-
-        # If result is 0, the port is open
-        return result == 0
+        # Connect to the server without blocking the event loop
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+
+        # Close the connection
+        writer.close()
+        await writer.wait_closed()
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
     except Exception as e:
         logger.debug(f"Error checking TCP port {port}: {e}")
         return False
@@ -12,6 +12,7 @@ from typing import Any, Dict
 
 from mcp_orchestrator import McpOrchestrator
 from mcp_orchestrator.orchestrator import ErrorPolicy
+from mcp_orchestrator.routing import KeyRouter
 from mcp_orchestrator.strategies import SimpleConcatenationStrategy, DictionaryMergeStrategy
 from mcp_orchestrator.strategies.dictionary import MergePolicy
 
@@ -137,40 +138,36 @@ async def example_multiple_mcps():
             
             return result
     
-    # Initialize orchestrator with custom strategy
+    # Initialize orchestrator with custom strategy and a router that
+    # gives each MCP the sub-query stored under its key
     orchestrator = McpOrchestrator(
         mcps=[memory_mcp, vector_mcp, api_mcp],
         strategy=CustomCombinationStrategy(),
         error_policy=ErrorPolicy.CONTINUE,
         logger=logger,
+        router=KeyRouter({0: "memory", 1: "vector", 2: "api"}),
     )
     
-    # Prepare queries for each MCP
-    memory_query = "example"  # For memory MCP
-    vector_query = "Python"   # For vector MCP
-    api_query = {"endpoint": "news"}  # For API MCP
+    # Each MCP expects a different query shape, so the query holds one
+    # sub-query per MCP and the router hands each MCP its own sub-query
+    query = {
+        "memory": "example",          # For memory MCP
+        "vector": "Python",           # For vector MCP
+        "api": {"endpoint": "news"},  # For API MCP
+    }
     
-    # We need to handle different query types for different MCPs
-    # This is a simple approach - in a real application, you might want
-    # to implement a more sophisticated query routing mechanism
-    
-    # Gather context from memory MCP
-    memory_context = await memory_mcp.get_context(memory_query)
-    
-    # Gather context from vector MCP
-    vector_context = await vector_mcp.get_context(vector_query)
+    combined_context = await orchestrator.gather_and_combine_context(query)
     
-    # Gather context from API MCP
-    api_context = await api_mcp.get_context(api_query)
+    logger.info("Combined context from multiple MCPs:")
+    print(json.dumps(combined_context, indent=2))
+    print("\n" + "="*50 + "\n")
     
-    # Manually combine contexts using the strategy
-    combined_context = orchestrator.strategy.combine([
-        memory_context,
-        vector_context,
-        api_context,
-    ])
+    # MCPs without a sub-query are skipped instead of being called
+    combined_context = await orchestrator.gather_and_combine_context(
+        {"vector": "asyncio"}
+    )
     
-    logger.info("Combined context from multiple MCPs:")
+    logger.info("Combined context from the vector MCP only:")
     print(json.dumps(combined_context, indent=2))
     print("\n" + "="*50 + "\n")
 
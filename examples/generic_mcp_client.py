@@ -36,6 +36,18 @@ class GenericMCPClient:
         """
         self.base_url = base_url
         self.logger = logging.getLogger(__name__)
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    async def start(self) -> None:
+        """Open the HTTP session shared by all requests."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+    
+    async def aclose(self) -> None:
+        """Close the HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
     
     async def get_context(self, query: str) -> Dict[str, Any]:
         """
@@ -48,25 +60,25 @@ class GenericMCPClient:
             The context from the MCP server.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.base_url}/context"
-                payload = {"query": query}
-                
-                self.logger.debug(f"Sending request to {url} with payload: {payload}")
+            await self.start()
+            url = f"{self.base_url}/context"
+            payload = {"query": query}
+            
+            self.logger.debug(f"Sending request to {url} with payload: {payload}")
+            
+            async with self.session.post(url, json=payload, timeout=10) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    self.logger.warning(f"Error from server: {error_text}")
+                    return {
+                        "status": "error",
+                        "error": f"Server returned status {response.status}: {error_text}",
+                        "query": query,
+                    }
                 
-                async with session.post(url, json=payload, timeout=10) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        self.logger.warning(f"Error from server: {error_text}")
-                        return {
-                            "status": "error",
-                            "error": f"Server returned status {response.status}: {error_text}",
-                            "query": query,
-                        }
-                    
-                    result = await response.json()
-                    self.logger.debug(f"Received response: {result}")
-                    return result
+                result = await response.json()
+                self.logger.debug(f"Received response: {result}")
+                return result
         except Exception as e:
             self.logger.error(f"Error in get_context: {e}")
             return {
@@ -84,6 +96,8 @@ class GenericMCP:
     the Model Context Protocol specification.
     """
     
+    supports_update_context = False
+    
     def __init__(self, client: GenericMCPClient):
         """
         Initialize the GenericMCP.
@@ -94,6 +108,14 @@ class GenericMCP:
         self.client = client
         self.logger = logging.getLogger(__name__)
     
+    async def start(self) -> None:
+        """Open the client's connection before the orchestrator takes traffic."""
+        await self.client.start()
+    
+    async def aclose(self) -> None:
+        """Close the client's connection when the orchestrator is closed."""
+        await self.client.aclose()
+    
     async def get_context(self, query_data: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Get context from the MCP server.
@@ -140,6 +162,8 @@ class BrowserMCPAdapter:
     This adapter translates between the Browser MCP API and the MCP Orchestrator protocol.
     """
     
+    supports_update_context = False
+    
     def __init__(self):
         """Initialize the BrowserMCPAdapter."""
         self.logger = logging.getLogger(__name__)
@@ -208,31 +232,31 @@ async def run_generic_mcp_example():
         logger.info("Using Browser MCP adapter")
         
         # Initialize the orchestrator with the Browser MCP
+        # The orchestrator starts its MCPs on entry and closes them on exit
         strategy = SimpleConcatenationStrategy()
-        orchestrator = McpOrchestrator(
+        async with McpOrchestrator(
             mcps=[browser_mcp],
             strategy=strategy,
             error_policy=ErrorPolicy.CONTINUE,
             logger=logger,
-        )
-        
-        # Define browser automation commands to execute
-        commands = [
-            "Go to google.com",
-            "Search for 'Browser MCP'",
-            "Take a screenshot of the current page",
-            "Extract all links from the current page",
-        ]
-        
-        # Execute each command and get the results
-        for command in commands:
-            logger.info(f"Executing command: {command}")
-            result = await orchestrator.gather_and_combine_context(command)
-            logger.info(f"Result: {result}")
-            print("\n" + "="*50 + "\n")
+        ) as orchestrator:
+            # Define browser automation commands to execute
+            commands = [
+                "Go to google.com",
+                "Search for 'Browser MCP'",
+                "Take a screenshot of the current page",
+                "Extract all links from the current page",
+            ]
             
-            # Wait a bit between commands
-            await asyncio.sleep(1)
+            # Execute each command and get the results
+            for command in commands:
+                logger.info(f"Executing command: {command}")
+                result = await orchestrator.gather_and_combine_context(command)
+                logger.info(f"Result: {result}")
+                print("\n" + "="*50 + "\n")
+                
+                # Wait a bit between commands
+                await asyncio.sleep(1)
     
     except Exception as e:
         logger.error(f"Error in Generic MCP example: {e}")
@@ -4,7 +4,32 @@ MCP Orchestrator Framework
 A generic and extensible Python framework for orchestrating multiple Model Context Protocols (MCPs).
 """
 
-from mcp_orchestrator.protocols import MCP, ContextCombinationStrategy
+from mcp_orchestrator.protocols import (
+    MCP,
+    BatchMCP,
+    BatchUpdateMCP,
+    CompletionPolicy,
+    ContextAccumulator,
+    ContextCombinationStrategy,
+    HealthCheckMCP,
+    IncrementalCombinationStrategy,
+    LifecycleMCP,
+    LoadBalancer,
+    QueryRouter,
+)
 from mcp_orchestrator.orchestrator import McpOrchestrator
 
-__all__ = ["MCP", "ContextCombinationStrategy", "McpOrchestrator"]
+__all__ = [
+    "MCP",
+    "BatchMCP",
+    "BatchUpdateMCP",
+    "CompletionPolicy",
+    "ContextAccumulator",
+    "ContextCombinationStrategy",
+    "HealthCheckMCP",
+    "IncrementalCombinationStrategy",
+    "LifecycleMCP",
+    "LoadBalancer",
+    "McpOrchestrator",
+    "QueryRouter",
+]
@@ -0,0 +1,262 @@
+"""
+Admission control for the MCP Orchestrator framework.
+
+This module contains a controller limiting the number of requests the
+orchestrator serves at once, so that load beyond its capacity is shed at
+the entry point instead of fanning out to every MCP and timing out there.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from mcp_orchestrator.exceptions import McpOverloadedError
+from mcp_orchestrator.limits import ConcurrencyLimiter
+
+
+class AdmissionController:
+    """
+    A first-in, first-out limiter of concurrent requests that sheds load.
+    
+    Requests beyond the limit wait in a queue, which may be bounded.
+    Requests that would have to wait and cannot meet their deadline are
+    rejected rather than served late: on arrival, when the remaining time is
+    shorter than the expected latency plus the expected wait, and while
+    waiting, as soon as the remaining time becomes shorter than the expected
+    latency. Requests finding a free slot are always admitted, so that the
+    expected latency is measured again once load drops. It also falls back
+    toward the lowest recent latency while no request is in flight.
+    
+    With adaptive limits, the limit follows an additive increase,
+    multiplicative decrease rule: it grows by about one for each limit's
+    worth of requests completing within the latency target, and shrinks by
+    the backoff factor, at most once per expected latency, when a request
+    exceeds the target or times out. The target defaults to a multiple of
+    the lowest latency observed recently.
+    """
+    
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        max_queue: Optional[int] = None,
+        adaptive: bool = False,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.9,
+        latency_weight: float = 0.1,
+        idle_half_life: float = 1.0,
+    ):
+        """
+        Initialize the AdmissionController.
+        
+        Args:
+            max_in_flight: The maximum number of concurrent requests, which
+                           is also the upper bound of adaptive limits.
+            max_queue: Optional maximum number of waiting requests. Requests
+                       arriving when the queue is full are rejected.
+            adaptive: Whether the limit adapts to the observed latency.
+            min_limit: The lower bound of adaptive limits.
+            initial_limit: Optional initial adaptive limit. Defaults to
+                           max_in_flight.
+            target_latency: Optional latency in seconds above which the
+                            adaptive limit shrinks. Defaults to the latency
+                            tolerance times the lowest recent latency.
+            latency_tolerance: The multiple of the lowest recent latency used
+                               as default latency target.
+            backoff: The factor applied to the adaptive limit when it
+                     shrinks, between 0 and 1.
+            latency_weight: The weight of each new sample in the expected
+                            latency, between 0 and 1.
+            idle_half_life: The time in seconds without requests in flight
+                            after which the excess of the expected latency
+                            over the lowest recent latency halves.
+        
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        if not 0 < min_limit <= max_in_flight:
+            raise ValueError("min_limit must be positive and at most max_in_flight")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be in (0, 1)")
+        if latency_tolerance < 1:
+            raise ValueError("latency_tolerance must be at least 1")
+        if idle_half_life <= 0:
+            raise ValueError("idle_half_life must be positive")
+        
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.adaptive = adaptive
+        self.min_limit = min_limit
+        self.target_latency = target_latency
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.latency_weight = latency_weight
+        self.idle_half_life = idle_half_life
+        self.limit = float(
+            min(max(initial_limit or max_in_flight, min_limit), max_in_flight)
+        )
+        
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "deadline": 0}
+        self.latency: Optional[float] = None
+        self.min_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._idle_since: Optional[float] = None
+        self._slots = ConcurrencyLimiter(int(self.limit))
+    
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently admitted."""
+        return self._slots.in_flight
+    
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests currently waiting."""
+        return self._slots.queue_depth
+    
+    async def acquire(self, deadline: Optional[float] = None) -> None:
+        """
+        Wait until a request may run.
+        
+        Every successful call must be followed by exactly one call to
+        release.
+        
+        Args:
+            deadline: Optional deadline of the request in event loop time.
+        
+        Raises:
+            McpOverloadedError: If the queue is full or the deadline cannot
+                                be met.
+        """
+        slots = self._slots
+        if slots.in_flight < slots.limit and not slots.queue_depth:
+            self._end_idle()
+            await slots.acquire()
+            self.admitted += 1
+            return
+        
+        if self.max_queue is not None and slots.queue_depth >= self.max_queue:
+            self._reject("queue_full", "too many requests queued")
+        if deadline is None:
+            await slots.acquire()
+            self.admitted += 1
+            return
+        
+        remaining = deadline - asyncio.get_running_loop().time()
+        if not self._can_meet(remaining, slots.queue_depth + 1):
+            self._reject("deadline", "deadline cannot be met")
+        try:
+            # Give up once the request could no longer finish in time
+            await asyncio.wait_for(
+                slots.acquire(), max(remaining - (self.latency or 0.0), 0.0)
+            )
+        except asyncio.TimeoutError:
+            pass
+        else:
+            self.admitted += 1
+            return
+        self._reject("deadline", "deadline cannot be met")
+    
+    def release(
+        self, latency: Optional[float] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Free the slot of a finished request, handing it to waiting requests.
+        
+        Args:
+            latency: Optional latency of the request in seconds, used for
+                     deadline estimates and adaptive limits. Latencies cut
+                     short by a deadline should not be given, since they
+                     measure the deadline rather than the request.
+            error: Optional error that ended the request. Timeouts count as
+                   a sign of overload, and their latency is ignored.
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            self._record(None, error)
+        elif latency is not None:
+            self._record(latency, error)
+        
+        self._slots.set_limit(int(self.limit))
+        self._slots.release()
+        if not self._slots.in_flight:
+            self._idle_since = time.monotonic()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current state and counters of the controller.
+        
+        Returns:
+            A dictionary with the limit, in-flight and waiting requests,
+            admission and rejection counts and the expected latency.
+        """
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "latency": self.latency,
+            "min_latency": self.min_latency,
+        }
+    
+    def _can_meet(self, remaining: float, position: int) -> bool:
+        """Check that a request can finish in time, behind the waiting ones."""
+        if remaining <= 0:
+            return False
+        if self.latency is None:
+            return True
+        expected_wait = self.latency * position / max(int(self.limit), 1)
+        return remaining >= self.latency + expected_wait
+    
+    def _end_idle(self) -> None:
+        """Let the expected latency fall back after a period without requests."""
+        if self._idle_since is None:
+            return
+        idle = time.monotonic() - self._idle_since
+        self._idle_since = None
+        if self.latency is not None and self.min_latency is not None:
+            excess = self.latency - self.min_latency
+            if excess > 0:
+                self.latency = self.min_latency + excess * 0.5 ** (idle / self.idle_half_life)
+    
+    def _reject(self, reason: str, message: str) -> None:
+        """Count and raise the rejection of a request."""
+        self.rejected[reason] += 1
+        raise McpOverloadedError(message)
+    
+    def _record(self, latency: Optional[float], error: Optional[BaseException]) -> None:
+        """Update the expected latency and the adaptive limit."""
+        if latency is not None:
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.latency_weight * (latency - self.latency)
+            # Let the lowest latency rise slowly, so it follows lasting changes
+            if self.min_latency is None or latency < self.min_latency:
+                self.min_latency = latency
+            else:
+                self.min_latency *= 1.001
+        
+        if not self.adaptive:
+            return
+        
+        target = self.target_latency
+        if target is None and self.min_latency is not None:
+            target = self.min_latency * self.latency_tolerance
+        overloaded = isinstance(error, asyncio.TimeoutError) or (
+            latency is not None and target is not None and latency > target
+        )
+        if not overloaded:
+            self.limit = min(self.limit + 1 / self.limit, float(self.max_in_flight))
+            return
+        
+        now = time.monotonic()
+        if now - self._last_decrease >= (self.latency or 0.0):
+            self._last_decrease = now
+            self.limit = max(self.limit * self.backoff, float(self.min_limit))
@@ -0,0 +1,526 @@
+"""
+Context caching for the MCP Orchestrator framework.
+
+This module contains a cache of MCP contexts keyed by (MCP, query), with
+per-MCP time-to-live and size-bounded LRU eviction, and the backends that
+store the entries: an in-process backend and a local on-disk backend.
+"""
+
+import concurrent.futures
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any, Dict, Mapping, Optional, Protocol, Set, Tuple, runtime_checkable,
+)
+
+from mcp_orchestrator.keys import normalize_query
+
+
+# Maximum depth explored when estimating the size of a context
+_MAX_SIZE_DEPTH = 4
+
+
+def _approximate_size(value: Any, depth: int = 0) -> int:
+    """
+    Estimate the memory used by a value, in bytes.
+    
+    Args:
+        value: The value to measure.
+        depth: The current nesting depth, used to bound the traversal.
+    
+    Returns:
+        The approximate size of the value and the values it contains.
+    """
+    size = sys.getsizeof(value)
+    if depth >= _MAX_SIZE_DEPTH:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            _approximate_size(k, depth + 1) + _approximate_size(v, depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_approximate_size(item, depth + 1) for item in value)
+    return size
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Protocol defining the storage interface used by ContextCache.
+    
+    Backends store entries keyed by MCP index and normalized query, expire
+    them after their time-to-live and evict the least recently used entries
+    when they exceed their size limits.
+    
+    Backends whose calls block, such as on-disk ones, may expose an executor
+    attribute holding a single-worker executor. The orchestrator then runs
+    their calls in that executor, in the order it makes them, instead of on
+    the event loop.
+    """
+    
+    def get(self, index: int, query_key: str) -> Tuple[bool, Any]:
+        """
+        Look up an entry.
+        
+        Args:
+            index: The index of the MCP.
+            query_key: The normalized query.
+        
+        Returns:
+            A tuple of (found, context). Expired entries are not found.
+        """
+        ...
+    
+    def set(self, index: int, query_key: str, context: Any, ttl: float) -> None:
+        """
+        Store an entry.
+        
+        Args:
+            index: The index of the MCP.
+            query_key: The normalized query.
+            context: The context to store.
+            ttl: The time-to-live of the entry in seconds.
+        """
+        ...
+    
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """
+        Remove the entries of an MCP, or all entries.
+        
+        Args:
+            index: The index of the MCP, or None to remove all entries.
+        """
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    An in-process cache backend.
+    
+    Entries are kept in memory in least-recently-used order. Contexts are
+    stored by reference, so callers must not mutate cached contexts.
+    """
+    
+    def __init__(
+        self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the MemoryCacheBackend.
+        
+        Args:
+            max_entries: Optional maximum number of entries.
+            max_bytes: Optional maximum approximate size of all entries in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[float, int, Any]]" = OrderedDict()
+        self._keys: Dict[int, Set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, index: int, query_key: str) -> Tuple[bool, Any]:
+        """
+        Look up an entry, marking it as recently used.
+        
+        Args:
+            index: The index of the MCP.
+            query_key: The normalized query.
+        
+        Returns:
+            A tuple of (found, context). Expired entries are not found.
+        """
+        key = (index, query_key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        
+        expires_at, _, context = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return False, None
+        
+        self._entries.move_to_end(key)
+        return True, context
+    
+    def set(self, index: int, query_key: str, context: Any, ttl: float) -> None:
+        """
+        Store an entry, evicting least recently used entries if needed.
+        
+        Args:
+            index: The index of the MCP.
+            query_key: The normalized query.
+            context: The context to store.
+            ttl: The time-to-live of the entry in seconds.
+        """
+        key = (index, query_key)
+        if key in self._entries:
+            self._remove(key)
+        
+        size = _approximate_size(context) + sys.getsizeof(query_key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        
+        self._entries[key] = (time.monotonic() + ttl, size, context)
+        self._keys.setdefault(index, set()).add(query_key)
+        self.size += size
+        
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.size > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+    
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """
+        Remove the entries of an MCP, or all entries.
+        
+        Args:
+            index: The index of the MCP, or None to remove all entries.
+        """
+        if index is None:
+            self._entries.clear()
+            self._keys.clear()
+            self.size = 0
+            return
+        
+        for query_key in list(self._keys.get(index, ())):
+            self._remove((index, query_key))
+    
+    def _remove(self, key: Tuple[int, str]) -> None:
+        """
+        Remove a single entry.
+        
+        Args:
+            key: The (index, query_key) of the entry.
+        """
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+        keys = self._keys[key[0]]
+        keys.discard(key[1])
+        if not keys:
+            del self._keys[key[0]]
+
+
+class DiskCacheBackend:
+    """
+    A local on-disk cache backend using SQLite.
+    
+    Contexts are pickled, so they must be picklable. Entries survive process
+    restarts and can be shared by processes on the same machine.
+    
+    Calls block on SQLite, so the backend owns a single-worker executor in
+    which the orchestrator runs them. Lookups do not write: the access times
+    used for eviction are recorded in memory and written in batches, and
+    expired entries are removed when entries are stored.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = None,
+        access_batch_size: int = 100,
+    ):
+        """
+        Initialize the DiskCacheBackend.
+        
+        Args:
+            path: The path of the SQLite database file.
+            max_entries: Optional maximum number of entries.
+            max_bytes: Optional maximum size of all pickled entries in bytes.
+            access_batch_size: The number of recorded access times that
+                               triggers writing them, if no entry is stored
+                               before.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.access_batch_size = access_batch_size
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            1, thread_name_prefix="mcp-cache"
+        )
+        self._lock = threading.Lock()
+        self._accessed: Dict[Tuple[int, str], float] = {}
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " mcp INTEGER NOT NULL,"
+            " query TEXT NOT NULL,"
+            " context BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (mcp, query))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self._connection.commit()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    
+    def get(self, index: int, query_key: str) -> Tuple[bool, Any]:
+        """
+        Look up an entry, marking it as recently used.
+        
+        Args:
+            index: The index of the MCP.
+            query_key: The normalized query.
+        
+        Returns:
+            A tuple of (found, context). Expired entries are not found.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT context, expires_at FROM entries WHERE mcp = ? AND query = ?",
+                (index, query_key),
+            ).fetchone()
+            if row is None or row[1] <= now:
+                return False, None
+            
+            self._accessed[(index, query_key)] = now
+            if len(self._accessed) >= self.access_batch_size:
+                self._flush_accessed()
+                self._connection.commit()
+        
+        return True, pickle.loads(row[0])
+    
+    def set(self, index: int, query_key: str, context: Any, ttl: float) -> None:
+        """
+        Store an entry, evicting least recently used entries if needed.
+        
+        Args:
+            index: The index of the MCP.
+            query_key: The normalized query.
+            context: The context to store. Must be picklable.
+            ttl: The time-to-live of the entry in seconds.
+        """
+        blob = pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.max_bytes is not None and len(blob) > self.max_bytes:
+            return
+        
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (index, query_key, blob, len(blob), now + ttl, now),
+            )
+            self._accessed.pop((index, query_key), None)
+            self._flush_accessed()
+            self._evict()
+            self._connection.commit()
+    
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """
+        Remove the entries of an MCP, or all entries.
+        
+        Args:
+            index: The index of the MCP, or None to remove all entries.
+        """
+        with self._lock:
+            self._flush_accessed()
+            if index is None:
+                self._connection.execute("DELETE FROM entries")
+            else:
+                self._connection.execute("DELETE FROM entries WHERE mcp = ?", (index,))
+            self._connection.commit()
+    
+    def close(self) -> None:
+        """Write the recorded access times and close the database connection."""
+        self.executor.shutdown(wait=True)
+        with self._lock:
+            self._flush_accessed()
+            self._connection.commit()
+            self._connection.close()
+    
+    def _flush_accessed(self) -> None:
+        """Write the access times recorded by lookups."""
+        if self._accessed:
+            self._connection.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE mcp = ? AND query = ?",
+                [(at, index, key) for (index, key), at in self._accessed.items()],
+            )
+            self._accessed.clear()
+    
+    def _evict(self) -> None:
+        """Remove expired entries, then least recently used ones over the limits."""
+        self._connection.execute(
+            "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+        )
+        if self.max_entries is not None:
+            self._connection.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                " SELECT rowid FROM entries ORDER BY accessed_at DESC"
+                " LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            total = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            
+            evicted = []
+            for rowid, size in self._connection.execute(
+                "SELECT rowid, size FROM entries ORDER BY accessed_at"
+            ):
+                if total <= self.max_bytes:
+                    break
+                evicted.append((rowid,))
+                total -= size
+            self._connection.executemany(
+                "DELETE FROM entries WHERE rowid = ?", evicted
+            )
+
+
+class ContextCache:
+    """
+    A cache of MCP contexts keyed by (MCP, query).
+    
+    The cache applies a time-to-live per MCP, counts hits and misses, and
+    delegates storage and eviction to a pluggable backend.
+    
+    Each MCP has a generation that changes whenever its entries are
+    invalidated. Callers capture it before fetching a context and pass it
+    when caching the result, so that a context fetched before an update is
+    not cached after the update invalidated the MCP's entries.
+    """
+    
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = 60.0,
+        mcp_ttls: Optional[Mapping[int, Optional[float]]] = None,
+    ):
+        """
+        Initialize the ContextCache.
+        
+        Args:
+            backend: The backend storing the entries. Defaults to a
+                     MemoryCacheBackend with its default limits.
+            ttl: The default time-to-live of entries in seconds, or None to
+                 not cache MCPs without their own time-to-live.
+            mcp_ttls: Optional mapping of MCP index to its time-to-live in
+                      seconds. None disables caching for that MCP.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.mcp_ttls = dict(mcp_ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.mcp_hits: Dict[int, int] = {}
+        self.mcp_misses: Dict[int, int] = {}
+        self._generation = 0
+        self._mcp_generations: Dict[int, int] = {}
+    
+    def generation(self, index: int) -> int:
+        """
+        Get the generation of an MCP's entries.
+        
+        Args:
+            index: The index of the MCP.
+        
+        Returns:
+            A counter that increases whenever the MCP's entries are
+            invalidated.
+        """
+        return self._generation + self._mcp_generations.get(index, 0)
+    
+    def get_ttl(self, index: int) -> Optional[float]:
+        """
+        Get the time-to-live of an MCP's entries.
+        
+        Args:
+            index: The index of the MCP.
+        
+        Returns:
+            The time-to-live in seconds, or None if the MCP is not cached.
+        """
+        ttl = self.mcp_ttls.get(index, self.ttl)
+        return ttl if ttl is not None and ttl > 0 else None
+    
+    def get(self, index: int, query_data: Any) -> Tuple[bool, Any]:
+        """
+        Look up the cached context of a query to an MCP.
+        
+        Args:
+            index: The index of the MCP.
+            query_data: The query passed to the MCP.
+        
+        Returns:
+            A tuple of (found, context).
+        """
+        if self.get_ttl(index) is None:
+            return False, None
+        
+        found, context = self.backend.get(index, normalize_query(query_data))
+        if found:
+            self.hits += 1
+            self.mcp_hits[index] = self.mcp_hits.get(index, 0) + 1
+        else:
+            self.misses += 1
+            self.mcp_misses[index] = self.mcp_misses.get(index, 0) + 1
+        return found, context
+    
+    def set(
+        self, index: int, query_data: Any, context: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache the context returned by an MCP for a query.
+        
+        Args:
+            index: The index of the MCP.
+            query_data: The query passed to the MCP.
+            context: The context returned by the MCP.
+            generation: Optional generation of the MCP's entries when the
+                        context was fetched. The context is not cached if
+                        the entries were invalidated since.
+        """
+        if generation is not None and generation != self.generation(index):
+            return
+        ttl = self.get_ttl(index)
+        if ttl is not None:
+            self.backend.set(index, normalize_query(query_data), context, ttl)
+    
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """
+        Remove the cached contexts of an MCP, or of all MCPs.
+        
+        Args:
+            index: The index of the MCP, or None for all MCPs.
+        """
+        if index is None:
+            self._generation += 1
+        else:
+            self._mcp_generations[index] = self._mcp_generations.get(index, 0) + 1
+        self.backend.invalidate(index)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hit and miss counters of the cache.
+        
+        Returns:
+            A dictionary with the total and per-MCP hits and misses.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "mcp_hits": dict(self.mcp_hits),
+            "mcp_misses": dict(self.mcp_misses),
+        }
@@ -0,0 +1,114 @@
+"""
+MCP capabilities for the MCP Orchestrator framework.
+
+This module contains the table of optional features each MCP supports,
+detected once when the orchestrator is built so that capability checks on
+the hot path are attribute lookups instead of per-call probing.
+"""
+
+from typing import Any, Dict
+
+from mcp_orchestrator.protocols import BatchMCP
+
+
+class McpCapabilities:
+    """
+    The optional features supported by an MCP.
+    
+    A feature is supported when the MCP implements its method, unless the
+    MCP opts out with a false supports_<method> attribute, for example
+    supports_update_context = False for a do-nothing update_context.
+    Methods inherited from a protocol class, such as MCP, are empty stubs
+    and do not count as implemented.
+    """
+    
+    __slots__ = (
+        "update", "update_batch", "batch", "cancellation", "health_check", "start",
+        "warmup", "aclose",
+    )
+    
+    def __init__(
+        self,
+        update: bool = False,
+        update_batch: bool = False,
+        batch: bool = False,
+        cancellation: bool = True,
+        health_check: bool = False,
+        start: bool = False,
+        warmup: bool = False,
+        aclose: bool = False,
+    ):
+        """
+        Initialize the McpCapabilities.
+        
+        Args:
+            update: Whether the MCP implements update_context.
+            update_batch: Whether the MCP implements update_context_batch.
+            batch: Whether the MCP implements get_context_batch.
+            cancellation: Whether calls to the MCP may be cancelled, for
+                          example by timeouts, hedging or early returns.
+            health_check: Whether the MCP implements health_check.
+            start: Whether the MCP implements start.
+            warmup: Whether the MCP implements warmup.
+            aclose: Whether the MCP implements aclose.
+        """
+        self.update = update
+        self.update_batch = update_batch
+        self.batch = batch
+        self.cancellation = cancellation
+        self.health_check = health_check
+        self.start = start
+        self.warmup = warmup
+        self.aclose = aclose
+    
+    @classmethod
+    def detect(cls, mcp: Any) -> "McpCapabilities":
+        """
+        Detect the optional features supported by an MCP.
+        
+        Args:
+            mcp: The MCP instance.
+        
+        Returns:
+            The capabilities of the MCP.
+        """
+        return cls(
+            update=_supports(mcp, "update_context"),
+            update_batch=_supports(mcp, "update_context_batch"),
+            batch=isinstance(mcp, BatchMCP) and _supports(mcp, "get_context_batch"),
+            cancellation=getattr(mcp, "supports_cancellation", True) is not False,
+            health_check=_supports(mcp, "health_check"),
+            start=_supports(mcp, "start"),
+            warmup=_supports(mcp, "warmup"),
+            aclose=_supports(mcp, "aclose"),
+        )
+    
+    def to_dict(self) -> Dict[str, bool]:
+        """
+        Export the capabilities.
+        
+        Returns:
+            A dictionary mapping each feature to whether it is supported.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __repr__(self) -> str:
+        supported = ", ".join(name for name, value in self.to_dict().items() if value)
+        return f"McpCapabilities({supported})"
+
+
+def _supports(mcp: Any, method: str) -> bool:
+    """Check that an MCP implements a method and does not opt out of it."""
+    if not callable(getattr(mcp, method, None)) or _is_protocol_stub(mcp, method):
+        return False
+    return getattr(mcp, f"supports_{method}", True) is not False
+
+
+def _is_protocol_stub(mcp: Any, method: str) -> bool:
+    """Check whether an MCP inherits a method from a protocol class."""
+    if method in getattr(mcp, "__dict__", ()):
+        return False
+    for cls in type(mcp).__mro__:
+        if method in cls.__dict__:
+            return bool(cls.__dict__.get("_is_protocol", False))
+    return False
@@ -0,0 +1,318 @@
+"""
+Circuit breakers for the MCP Orchestrator framework.
+
+This module contains a circuit breaker that stops calling an MCP after it
+keeps failing, rejecting calls instantly instead, and probes the MCP with
+a limited number of calls to detect its recovery, and a guard recording the
+outcome of each call that reaches the MCP.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from mcp_orchestrator.exceptions import (
+    McpCircuitOpenError, McpQueueFullError, McpTimeoutError,
+)
+
+
+class CircuitState(Enum):
+    """Enum defining the states of a circuit breaker."""
+    
+    CLOSED = "closed"        # Calls pass through
+    OPEN = "open"            # Calls are rejected
+    HALF_OPEN = "half_open"  # A limited number of probe calls pass through
+
+
+def _is_failure(error: Exception) -> bool:
+    """Count every error as a failure, except local queue rejections."""
+    return not isinstance(error, McpQueueFullError)
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker guarding calls to a single MCP.
+    
+    The circuit opens when too many consecutive calls fail, or when the
+    error rate over the most recent calls exceeds a threshold. After the
+    recovery timeout it becomes half-open and lets probe calls through:
+    enough successful probes close it, a failed probe opens it again.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = 5,
+        error_rate_threshold: Optional[float] = None,
+        window_size: int = 20,
+        min_calls: int = 10,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        is_failure: Callable[[Exception], bool] = _is_failure,
+        on_state_change: Optional[
+            Callable[["CircuitBreaker", CircuitState, CircuitState], None]
+        ] = None,
+    ):
+        """
+        Initialize the CircuitBreaker.
+        
+        Args:
+            failure_threshold: Optional number of consecutive failures that
+                               opens the circuit.
+            error_rate_threshold: Optional error rate, between 0 and 1, over
+                                  the last window_size calls that opens the
+                                  circuit.
+            window_size: The number of recent calls used for the error rate.
+            min_calls: The minimum number of calls in the window before the
+                       error rate is considered.
+            recovery_timeout: Seconds the circuit stays open before probing.
+            half_open_max_calls: The maximum number of concurrent probe calls.
+            success_threshold: The number of successful probes that closes
+                               the circuit.
+            is_failure: A predicate deciding which errors count as failures.
+            on_state_change: Optional callback invoked with the breaker, the
+                             old state and the new state on every transition.
+        
+        Raises:
+            ValueError: If a threshold or size is out of range.
+        """
+        if failure_threshold is not None and failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        if error_rate_threshold is not None and not 0 < error_rate_threshold <= 1:
+            raise ValueError("error_rate_threshold must be in (0, 1]")
+        if window_size <= 0 or min_calls <= 0:
+            raise ValueError("window_size and min_calls must be positive")
+        if half_open_max_calls <= 0 or success_threshold <= 0:
+            raise ValueError("half_open_max_calls and success_threshold must be positive")
+        
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_calls = min_calls
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.is_failure = is_failure
+        self.on_state_change = on_state_change
+        
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self.opened = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._window: Deque[bool] = deque(maxlen=window_size)
+        self._window_failures = 0
+    
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving to half-open once the timeout elapsed."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """
+        Decide whether a call may proceed.
+        
+        Every allowed call must be followed by exactly one call to
+        record_success, record_failure or record_cancelled.
+        
+        Returns:
+            True if the call may proceed, False if it must be rejected.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        
+        if state == CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        
+        self.rejected += 1
+        return False
+    
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes = max(self._probes - 1, 0)
+            self._probe_successes += 1
+            if self._probe_successes >= self.success_threshold:
+                self._transition(CircuitState.CLOSED)
+        elif self._state == CircuitState.CLOSED:
+            self.consecutive_failures = 0
+            self._record_outcome(False)
+    
+    def record_failure(self, error: Exception) -> None:
+        """
+        Record a failed call.
+        
+        Args:
+            error: The error raised by the call.
+        """
+        if not self.is_failure(error):
+            self.record_cancelled()
+            return
+        
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes = max(self._probes - 1, 0)
+            self._transition(CircuitState.OPEN)
+        elif self._state == CircuitState.CLOSED:
+            self.consecutive_failures += 1
+            self._record_outcome(True)
+            if self._should_open():
+                self._transition(CircuitState.OPEN)
+    
+    def record_cancelled(self) -> None:
+        """Record a call that completed without a meaningful outcome."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes = max(self._probes - 1, 0)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current state and counters of the breaker.
+        
+        Returns:
+            A dictionary with the state, failure counters and rejections.
+        """
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "window_calls": len(self._window),
+            "window_failures": self._window_failures,
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
+    
+    def _record_outcome(self, failed: bool) -> None:
+        """
+        Add the outcome of a call to the error rate window.
+        
+        Args:
+            failed: Whether the call failed.
+        """
+        if len(self._window) == self._window.maxlen and self._window[0]:
+            self._window_failures -= 1
+        self._window.append(failed)
+        if failed:
+            self._window_failures += 1
+    
+    def _should_open(self) -> bool:
+        """Check whether the failure thresholds are exceeded."""
+        if (
+            self.failure_threshold is not None
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            return True
+        
+        return (
+            self.error_rate_threshold is not None
+            and len(self._window) >= self.min_calls
+            and self._window_failures / len(self._window) >= self.error_rate_threshold
+        )
+    
+    def _transition(self, state: CircuitState) -> None:
+        """
+        Move to a new state, resetting the counters of the old one.
+        
+        Args:
+            state: The new state.
+        """
+        old_state = self._state
+        if old_state == state:
+            return
+        
+        self._state = state
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+        elif state == CircuitState.HALF_OPEN:
+            self._probes = 0
+            self._probe_successes = 0
+        else:
+            self.consecutive_failures = 0
+            self._window.clear()
+            self._window_failures = 0
+        
+        if self.on_state_change is not None:
+            self.on_state_change(self, old_state, state)
+
+
+class CircuitCall:
+    """
+    A call to an MCP guarded by the MCP's circuit breaker.
+    
+    The breaker is consulted when the call is about to reach the MCP, after
+    any wait for a concurrency slot, and the outcome of the call is recorded
+    once, however many callers share it. A call cancelled by its timeout
+    counts as a failure if it had at least half of the timeout to answer;
+    calls that spent most of their timeout waiting for a slot, and other
+    cancellations, do not count.
+    """
+    
+    __slots__ = ("breaker", "index", "timeout", "expires_at")
+    
+    def __init__(self, breaker: CircuitBreaker, index: int):
+        """
+        Initialize the CircuitCall.
+        
+        Args:
+            breaker: The circuit breaker of the MCP.
+            index: The index of the MCP.
+        """
+        self.breaker = breaker
+        self.index = index
+        self.timeout: Optional[float] = None
+        self.expires_at: Optional[float] = None
+    
+    def set_timeout(self, timeout: float) -> None:
+        """
+        Set the timeout the call is awaited with, starting now.
+        
+        Args:
+            timeout: The timeout in seconds.
+        """
+        self.timeout = timeout
+        self.expires_at = asyncio.get_running_loop().time() + timeout
+    
+    async def run(self, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Call the MCP if the breaker allows it, recording the outcome.
+        
+        Args:
+            function: A function starting the call to the MCP.
+        
+        Returns:
+            The result of the call.
+        
+        Raises:
+            McpCircuitOpenError: If the MCP's circuit is open.
+        """
+        if not self.breaker.allow_request():
+            raise McpCircuitOpenError(self.index)
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            if (
+                self.expires_at is not None
+                and loop.time() >= self.expires_at
+                and self.expires_at - start >= self.timeout / 2
+            ):
+                self.breaker.record_failure(McpTimeoutError(self.index, self.timeout))
+            else:
+                self.breaker.record_cancelled()
+            raise
+        except Exception as e:
+            self.breaker.record_failure(e)
+            raise
+        
+        self.breaker.record_success()
+        return result
@@ -0,0 +1,189 @@
+"""
+Completion policies for the MCP Orchestrator framework.
+
+This module contains policies deciding when enough MCPs have answered for
+context gathering to stop, so that the remaining MCPs can be cancelled and
+completeness traded for latency.
+"""
+
+from typing import AbstractSet, Collection, Mapping, Optional, Sequence
+
+
+class FirstK:
+    """
+    A policy that completes once k MCPs have answered successfully.
+    
+    Optionally only successes among a subset of MCPs are counted, for
+    example to return after the first successful vector source.
+    """
+    
+    def __init__(self, k: int, among: Optional[Collection[int]] = None):
+        """
+        Initialize the FirstK policy.
+        
+        Args:
+            k: The number of successful MCPs to wait for.
+            among: Optional indices of the MCPs whose successes count.
+        
+        Raises:
+            ValueError: If k is not positive.
+        """
+        if k <= 0:
+            raise ValueError("k must be positive")
+        
+        self.k = k
+        self.among = frozenset(among) if among is not None else None
+    
+    def evaluate(
+        self,
+        succeeded: AbstractSet[int],
+        failed: AbstractSet[int],
+        indices: Sequence[int],
+    ) -> Optional[float]:
+        """
+        Decide whether context gathering can stop.
+        
+        Args:
+            succeeded: The indices of the MCPs that answered successfully.
+            failed: The indices of the MCPs that failed.
+            indices: The indices of all MCPs called.
+        
+        Returns:
+            0 to stop, or None to keep waiting.
+        """
+        if self.among is not None:
+            succeeded = succeeded & self.among
+        return 0.0 if len(succeeded) >= self.k else None
+
+
+class Quorum:
+    """A policy that completes once more than a fraction of the MCPs answered."""
+    
+    def __init__(self, fraction: float = 0.5):
+        """
+        Initialize the Quorum policy.
+        
+        Args:
+            fraction: The fraction of the called MCPs that must be exceeded
+                      by the successful ones. The default is a majority.
+        
+        Raises:
+            ValueError: If the fraction is not between 0 and 1.
+        """
+        if not 0 <= fraction < 1:
+            raise ValueError("fraction must be in [0, 1)")
+        
+        self.fraction = fraction
+    
+    def evaluate(
+        self,
+        succeeded: AbstractSet[int],
+        failed: AbstractSet[int],
+        indices: Sequence[int],
+    ) -> Optional[float]:
+        """
+        Decide whether context gathering can stop.
+        
+        Args:
+            succeeded: The indices of the MCPs that answered successfully.
+            failed: The indices of the MCPs that failed.
+            indices: The indices of all MCPs called.
+        
+        Returns:
+            0 to stop, or None to keep waiting.
+        """
+        return 0.0 if len(succeeded) > self.fraction * len(indices) else None
+
+
+class WeightedQuorum:
+    """A policy that completes once the successful MCPs reach a total weight."""
+    
+    def __init__(
+        self,
+        weights: Mapping[int, float],
+        threshold: float,
+        default_weight: float = 1.0,
+    ):
+        """
+        Initialize the WeightedQuorum policy.
+        
+        Args:
+            weights: A mapping of MCP index to its weight.
+            threshold: The total weight of successful MCPs to wait for.
+            default_weight: The weight of MCPs missing from weights.
+        """
+        self.weights = weights
+        self.threshold = threshold
+        self.default_weight = default_weight
+    
+    def evaluate(
+        self,
+        succeeded: AbstractSet[int],
+        failed: AbstractSet[int],
+        indices: Sequence[int],
+    ) -> Optional[float]:
+        """
+        Decide whether context gathering can stop.
+        
+        Args:
+            succeeded: The indices of the MCPs that answered successfully.
+            failed: The indices of the MCPs that failed.
+            indices: The indices of all MCPs called.
+        
+        Returns:
+            0 to stop, or None to keep waiting.
+        """
+        weight = sum(self.weights.get(i, self.default_weight) for i in succeeded)
+        return 0.0 if weight >= self.threshold else None
+
+
+class RequiredSet:
+    """
+    A policy that completes once a set of required MCPs answered.
+    
+    The other MCPs are optional extras: once the required MCPs answered,
+    extras are waited for during a grace period at most.
+    """
+    
+    def __init__(self, required: Collection[int], grace_period: float = 0.0):
+        """
+        Initialize the RequiredSet policy.
+        
+        Args:
+            required: The indices of the required MCPs.
+            grace_period: Seconds to keep waiting for the extras once all
+                          required MCPs answered.
+        
+        Raises:
+            ValueError: If the grace period is negative.
+        """
+        if grace_period < 0:
+            raise ValueError("grace_period must not be negative")
+        
+        self.required = frozenset(required)
+        self.grace_period = grace_period
+    
+    def evaluate(
+        self,
+        succeeded: AbstractSet[int],
+        failed: AbstractSet[int],
+        indices: Sequence[int],
+    ) -> Optional[float]:
+        """
+        Decide whether context gathering can stop.
+        
+        Required MCPs that were not called, for example because the router
+        skipped them, are not waited for.
+        
+        Args:
+            succeeded: The indices of the MCPs that answered successfully.
+            failed: The indices of the MCPs that failed.
+            indices: The indices of all MCPs called.
+        
+        Returns:
+            The grace period once the required MCPs answered, or None to
+            keep waiting.
+        """
+        if not self.required.intersection(indices) <= succeeded:
+            return None
+        return self.grace_period
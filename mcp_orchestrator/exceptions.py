@@ -0,0 +1,98 @@
+"""
+Exception types raised by the MCP Orchestrator framework.
+
+All orchestrator errors derive from RuntimeError so that callers which
+already catch the generic failures raised by the orchestrator keep working.
+"""
+
+import asyncio
+from typing import Any, Dict, Sequence
+
+
+class McpOrchestratorError(RuntimeError):
+    """Base class for all errors raised by the orchestrator."""
+
+
+class McpTimeoutError(McpOrchestratorError, asyncio.TimeoutError):
+    """Raised when an MCP does not respond before its deadline."""
+    
+    def __init__(self, index: Any, timeout: float):
+        """
+        Initialize the McpTimeoutError.
+        
+        Args:
+            index: The index of the MCP that timed out.
+            timeout: The timeout in seconds that was exceeded.
+        """
+        super().__init__(f"MCP {index} timed out after {timeout:.3f}s")
+        self.index = index
+        self.timeout = timeout
+
+
+class McpQueueFullError(McpOrchestratorError):
+    """Raised when a call is rejected because too many calls are queued."""
+    
+    def __init__(self, max_queue: int):
+        """
+        Initialize the McpQueueFullError.
+        
+        Args:
+            max_queue: The maximum number of queued calls that was reached.
+        """
+        super().__init__(f"Call rejected: {max_queue} calls already queued")
+        self.max_queue = max_queue
+
+
+class McpOverloadedError(McpOrchestratorError):
+    """Raised when a request is shed because the orchestrator is overloaded."""
+    
+    def __init__(self, reason: str):
+        """
+        Initialize the McpOverloadedError.
+        
+        Args:
+            reason: Why the request was rejected.
+        """
+        super().__init__(f"Request rejected: {reason}")
+        self.reason = reason
+
+
+class McpCircuitOpenError(McpOrchestratorError):
+    """Raised when a call is rejected because the MCP's circuit is open."""
+    
+    def __init__(self, index: Any):
+        """
+        Initialize the McpCircuitOpenError.
+        
+        Args:
+            index: The index of the MCP whose circuit is open.
+        """
+        super().__init__(f"Circuit of MCP {index} is open")
+        self.index = index
+
+
+class McpGatherError(McpOrchestratorError):
+    """Raised when an operation fails under the FAIL_FAST error policy."""
+    
+    def __init__(
+        self,
+        action: str,
+        errors: Dict[int, Exception],
+        cancelled: Sequence[int] = (),
+    ):
+        """
+        Initialize the McpGatherError.
+        
+        Args:
+            action: A description of the operation that failed.
+            errors: A mapping of MCP index to the error it raised.
+            cancelled: The indices of the MCPs that were cancelled because
+                       of the failure.
+        """
+        message = f"{action} failed: {errors}"
+        if cancelled:
+            message += f"; cancelled MCPs: {list(cancelled)}"
+        super().__init__(message)
+        self.action = action
+        self.errors = errors
+        self.cancelled = list(cancelled)
@@ -0,0 +1,376 @@
+"""
+Executor support for the MCP Orchestrator framework.
+
+This module contains an adapter running synchronous MCPs in a bounded
+executor, so that their blocking calls do not freeze the event loop, a
+detector warning when an async MCP blocks the event loop anyway, and a
+policy running CPU-heavy context combinations in a thread or process pool.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional
+
+from mcp_orchestrator.capabilities import McpCapabilities
+from mcp_orchestrator.limits import ConcurrencyLimiter
+from mcp_orchestrator.protocols import ContextCombinationStrategy
+from mcp_orchestrator.tracing import payload_size
+
+
+class ExecutorMCP:
+    """
+    An MCP running the get_context method of a synchronous MCP in an executor.
+    
+    Calls beyond the executor's number of workers wait in a first-in,
+    first-out queue, which may be bounded. By default the adapter owns a
+    thread pool; process pools require the MCP to be picklable.
+    """
+    
+    def __init__(
+        self,
+        mcp: Any,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: int = 4,
+        max_queue: Optional[int] = None,
+    ):
+        """
+        Initialize the ExecutorMCP.
+        
+        Args:
+            mcp: The synchronous MCP, whose get_context method blocks.
+            executor: Optional executor running the calls. Defaults to a
+                      thread pool owned by the adapter.
+            max_workers: The maximum number of concurrent calls, and the
+                         size of the thread pool owned by the adapter.
+            max_queue: Optional maximum number of calls waiting for a
+                       worker. Calls arriving when the queue is full are
+                       rejected.
+        
+        Raises:
+            ValueError: If max_workers is not positive or max_queue is
+                        negative.
+        """
+        self.mcp = mcp
+        self.limiter = ConcurrencyLimiter(max_workers, max_queue)
+        self._owns_executor = executor is None
+        self.executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix=f"mcp-{type(mcp).__name__}"
+        )
+    
+    async def get_context(self, query_data: Any) -> Any:
+        """
+        Gather context from the synchronous MCP in the executor.
+        
+        Args:
+            query_data: The query or parameters to pass to the MCP.
+        
+        Returns:
+            The context returned by the MCP.
+        
+        Raises:
+            McpQueueFullError: If the queue of waiting calls is full.
+        """
+        return await self._run(self.mcp.get_context, query_data)
+    
+    def close(self) -> None:
+        """Shut down the executor, if the adapter owns it."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+    
+    async def aclose(self) -> None:
+        """Shut down the executor when the orchestrator is closed."""
+        self.close()
+    
+    async def _run(self, function: Callable[[Any], Any], argument: Any) -> Any:
+        """Run a blocking call in the executor, within the worker limit."""
+        await self.limiter.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, function, argument)
+        except BaseException:
+            self.limiter.release()
+            raise
+        # A cancelled caller cannot stop the worker, so the slot is released
+        # when the worker is done
+        future.add_done_callback(self._release)
+        return await asyncio.shield(future)
+    
+    def _release(self, future: "asyncio.Future[Any]") -> None:
+        """Free the slot of a finished call, retrieving its outcome."""
+        self.limiter.release()
+        if not future.cancelled():
+            future.exception()
+
+
+class ExecutorUpdateMCP(ExecutorMCP):
+    """
+    An MCP running the get_context and update_context methods of a
+    synchronous MCP in an executor.
+    """
+    
+    async def update_context(self, response_data: Any) -> None:
+        """
+        Update the synchronous MCP in the executor.
+        
+        Args:
+            response_data: The response data to pass to the MCP.
+        
+        Raises:
+            McpQueueFullError: If the queue of waiting calls is full.
+        """
+        await self._run(self.mcp.update_context, response_data)
+
+
+def run_in_executor(
+    mcp: Any,
+    executor: Optional[concurrent.futures.Executor] = None,
+    max_workers: int = 4,
+    max_queue: Optional[int] = None,
+) -> ExecutorMCP:
+    """
+    Adapt a synchronous MCP to the async MCP interface.
+    
+    The adapter supports update_context only if the MCP supports it.
+    
+    Args:
+        mcp: The synchronous MCP, whose methods block.
+        executor: Optional executor running the calls. Defaults to a thread
+                  pool owned by the adapter.
+        max_workers: The maximum number of concurrent calls, and the size
+                     of the thread pool owned by the adapter.
+        max_queue: Optional maximum number of calls waiting for a worker.
+    
+    Returns:
+        The async MCP.
+    """
+    if McpCapabilities.detect(mcp).update:
+        return ExecutorUpdateMCP(mcp, executor, max_workers, max_queue)
+    return ExecutorMCP(mcp, executor, max_workers, max_queue)
+
+
+class BlockingDetector:
+    """
+    A detector of MCP calls blocking the event loop.
+    
+    Each step of a watched call, from one suspension point to the next, runs
+    on the event loop without interruption. Steps lasting longer than the
+    threshold are reported, as they delay every other task of the loop.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        logger: Optional[logging.Logger] = None,
+        on_block: Optional[Callable[[Any, str, float], None]] = None,
+    ):
+        """
+        Initialize the BlockingDetector.
+        
+        Args:
+            threshold: The duration in seconds above which a step is
+                       reported.
+            logger: Optional logger receiving a warning for each report.
+            on_block: Optional function called for each report with the
+                      index of the MCP, the name of the call and the
+                      duration of the step.
+        
+        Raises:
+            ValueError: If the threshold is not positive.
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        
+        self.threshold = threshold
+        self.logger = logger or logging.getLogger(__name__)
+        self.on_block = on_block
+        self.blocked = 0
+        self.max_blocked = 0.0
+    
+    def watch(self, index: Any, awaitable: Awaitable[Any], name: str) -> Awaitable[Any]:
+        """
+        Watch a call to an MCP for blocking steps.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            awaitable: The call to the MCP.
+            name: The name of the call, used in reports.
+        
+        Returns:
+            An awaitable with the same result as the call.
+        """
+        return _WatchedAwaitable(self, index, awaitable, name)
+    
+    def record_step(self, index: Any, name: str, duration: float) -> None:
+        """
+        Report a step of a call if it blocked the event loop.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            name: The name of the call.
+            duration: The duration of the step in seconds.
+        """
+        if duration < self.threshold:
+            return
+        
+        self.blocked += 1
+        self.max_blocked = max(self.max_blocked, duration)
+        self.logger.warning(
+            "MCP %s blocked the event loop for %.3fs in %s", index, duration, name
+        )
+        if self.on_block is not None:
+            self.on_block(index, name, duration)
+
+
+class _WatchedAwaitable:
+    """An awaitable timing each step of the awaitable it wraps."""
+    
+    __slots__ = ("detector", "index", "awaitable", "name")
+    
+    def __init__(
+        self, detector: BlockingDetector, index: Any, awaitable: Awaitable[Any], name: str
+    ):
+        self.detector = detector
+        self.index = index
+        self.awaitable = awaitable
+        self.name = name
+    
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self.awaitable.__await__()
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            start = time.perf_counter()
+            try:
+                if error is None:
+                    yielded = iterator.send(value)
+                else:
+                    yielded = iterator.throw(error)
+            except StopIteration as e:
+                self.detector.record_step(self.index, self.name, time.perf_counter() - start)
+                return e.value
+            except BaseException:
+                self.detector.record_step(self.index, self.name, time.perf_counter() - start)
+                raise
+            self.detector.record_step(self.index, self.name, time.perf_counter() - start)
+            
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class CombineOffload:
+    """
+    A policy running context combinations outside the event loop.
+    
+    Combinations of contexts whose total size reaches the threshold run in
+    an executor; smaller ones stay inline, where they are cheaper than the
+    transfer to a worker. Unless an executor is given, a strategy chooses
+    its pool with a combine_executor attribute: "thread" (the default) for
+    strategies releasing the GIL, or "process" for pure Python ones, which
+    requires the strategy and contexts to be picklable.
+    """
+    
+    def __init__(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        min_size: int = 65536,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the CombineOffload.
+        
+        Args:
+            executor: Optional executor running the combinations. By default
+                      the policy owns a pool chosen by the strategy.
+            min_size: The total size of the contexts, in characters, bytes
+                      or items, from which a combination is offloaded.
+            max_workers: Optional number of workers of the pools owned by
+                         the policy.
+        
+        Raises:
+            ValueError: If min_size is negative.
+        """
+        if min_size < 0:
+            raise ValueError("min_size must not be negative")
+        
+        self.executor = executor
+        self.min_size = min_size
+        self.max_workers = max_workers
+        self.offloaded = 0
+        self.inline = 0
+        self._pools: Dict[str, concurrent.futures.Executor] = {}
+    
+    def should_offload(self, contexts: List[Any]) -> bool:
+        """
+        Decide whether a combination runs in an executor.
+        
+        Args:
+            contexts: The contexts to combine.
+        
+        Returns:
+            True if the total size of the contexts reaches the threshold.
+        """
+        size = 0
+        for context in contexts:
+            size += payload_size(context) or 1
+            if size >= self.min_size:
+                return True
+        return False
+    
+    async def combine(
+        self, strategy: ContextCombinationStrategy, contexts: List[Any]
+    ) -> Any:
+        """
+        Combine contexts, in an executor if they are large enough.
+        
+        Args:
+            strategy: The strategy to use for combining contexts.
+            contexts: The contexts to combine.
+        
+        Returns:
+            The combined context data.
+        """
+        if not self.should_offload(contexts):
+            self.inline += 1
+            return strategy.combine(contexts)
+        
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor(strategy)
+        return await loop.run_in_executor(executor, _combine, strategy, contexts)
+    
+    def close(self) -> None:
+        """Shut down the pools owned by the policy."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=False)
+        self._pools.clear()
+    
+    def _get_executor(self, strategy: ContextCombinationStrategy) -> concurrent.futures.Executor:
+        """Get the executor running the combinations of a strategy."""
+        if self.executor is not None:
+            return self.executor
+        
+        kind = getattr(strategy, "combine_executor", "thread")
+        pool = self._pools.get(kind)
+        if pool is None:
+            if kind == "process":
+                pool = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+            elif kind == "thread":
+                pool = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="mcp-combine"
+                )
+            else:
+                raise ValueError(f"Unknown combine executor: {kind!r}")
+            self._pools[kind] = pool
+        return pool
+
+
+def _combine(strategy: ContextCombinationStrategy, contexts: List[Any]) -> Any:
+    """Combine contexts in a worker; a module function so it can be pickled."""
+    return strategy.combine(contexts)
@@ -0,0 +1,161 @@
+"""
+Hedged requests for the MCP Orchestrator framework.
+
+This module contains a hedging policy: when a call to an MCP has not
+returned after a delay, a duplicate call is sent to a replica and the first
+successful answer wins, trading a little extra load for a shorter tail.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+from mcp_orchestrator.latency import LatencyHistogram
+from mcp_orchestrator.protocols import MCP
+
+
+class HedgePolicy:
+    """
+    A policy deciding when and where to send hedged calls for an MCP.
+    
+    The hedge delay is either fixed or the observed percentile of the MCP's
+    latency. Hedges are capped to a fraction of the calls, and are sent to
+    the given replicas in turn, or to the MCP itself when it has none.
+    """
+    
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        replicas: Optional[Sequence[MCP]] = None,
+        latency: Optional[LatencyHistogram] = None,
+        refresh_interval: int = 32,
+    ):
+        """
+        Initialize the HedgePolicy.
+        
+        Args:
+            delay: Optional fixed delay in seconds before hedging. By default
+                   the delay is the observed latency percentile.
+            percentile: The latency percentile used as delay, between 0 and 1.
+            min_samples: The number of latency samples needed before hedging
+                         with an observed delay.
+            max_hedge_ratio: The maximum fraction of calls that are hedged.
+            replicas: Optional MCP instances serving the same data, used in
+                      turn for hedged calls.
+            latency: Optional histogram of observed latencies. Defaults to a
+                     histogram over a sliding window of one minute.
+            refresh_interval: The number of samples between recomputations
+                              of the observed delay.
+        
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be in [0, 1]")
+        
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.replicas = list(replicas or [])
+        self.latency = latency if latency is not None else LatencyHistogram(window=60.0)
+        self.refresh_interval = max(refresh_interval, 1)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.suppressed = 0
+        self._next_replica = 0
+        self._observed_delay: Optional[float] = None
+        self._samples_since_refresh = 0
+    
+    @property
+    def hedge_rate(self) -> float:
+        """The fraction of calls that were hedged."""
+        return self.hedges / self.calls if self.calls else 0.0
+    
+    def get_delay(self) -> Optional[float]:
+        """
+        Get the delay after which a call should be hedged.
+        
+        Returns:
+            The delay in seconds, or None if calls should not be hedged yet.
+        """
+        if self.delay is not None:
+            return self.delay
+        
+        if self._observed_delay is None or self._samples_since_refresh >= self.refresh_interval:
+            if self.latency.count >= self.min_samples:
+                self._observed_delay = self.latency.percentile(self.percentile)
+            self._samples_since_refresh = 0
+        return self._observed_delay
+    
+    def record_call(self) -> None:
+        """Record a call that may be hedged."""
+        self.calls += 1
+    
+    def record_latency(self, latency: float) -> None:
+        """
+        Record the latency of a successful call.
+        
+        Args:
+            latency: The latency in seconds.
+        """
+        self.latency.record(latency)
+        self._samples_since_refresh += 1
+    
+    def try_hedge(self) -> bool:
+        """
+        Reserve a hedge, if the hedge rate allows it.
+        
+        Returns:
+            True if a hedged call may be sent.
+        """
+        if self.hedges + 1 > self.max_hedge_ratio * self.calls:
+            self.suppressed += 1
+            return False
+        
+        self.hedges += 1
+        return True
+    
+    def record_hedge_win(self) -> None:
+        """Record a hedged call answering before the original call."""
+        self.hedge_wins += 1
+    
+    def next_replica(self, mcp: MCP) -> MCP:
+        """
+        Choose the MCP instance receiving a hedged call.
+        
+        Args:
+            mcp: The MCP that received the original call.
+        
+        Returns:
+            The next replica in turn, or the MCP itself if it has none.
+        """
+        if not self.replicas:
+            return mcp
+        
+        replica = self.replicas[self._next_replica % len(self.replicas)]
+        self._next_replica += 1
+        return replica
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hedging counters of the policy.
+        
+        Returns:
+            A dictionary with the calls, hedges, wins, suppressed hedges,
+            hedge rate and current delay.
+        """
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "suppressed": self.suppressed,
+            "hedge_rate": self.hedge_rate,
+            "delay": self.get_delay(),
+        }
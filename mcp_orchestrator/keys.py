@@ -0,0 +1,79 @@
+"""
+Query key helpers for the MCP Orchestrator framework.
+
+This module turns arbitrary query data into stable, hashable keys so that
+identical queries can be recognised across calls.
+"""
+
+import json
+from typing import Any, Set
+
+
+def normalize_query(query_data: Any) -> str:
+    """
+    Build a canonical key for a query.
+    
+    Every value is encoded with a tag of its type, so that values which
+    serialize alike, such as the key 1 and the key "1" or a tuple and a list
+    with the same items, produce different keys. Dictionaries and sets are
+    encoded in a sorted order, so ones that differ only in the order of their
+    items produce the same key. Other values are represented by their type
+    and repr.
+    
+    Args:
+        query_data: The query or parameters passed to an MCP.
+    
+    Returns:
+        A string key identifying the query.
+    
+    Raises:
+        ValueError: If the query contains a circular reference.
+    """
+    return _encode(query_data, set())
+
+
+def _encode(value: Any, seen: Set[int]) -> str:
+    """
+    Encode a value with type tags.
+    
+    Args:
+        value: The value to encode.
+        seen: The ids of the containers being encoded, to detect cycles.
+    
+    Returns:
+        The encoded value.
+    
+    Raises:
+        ValueError: If the value contains a circular reference.
+    """
+    if value is None:
+        return "n"
+    if isinstance(value, bool):
+        return "b1" if value else "b0"
+    if isinstance(value, int):
+        return f"i{value}"
+    if isinstance(value, float):
+        return f"f{value!r}"
+    if isinstance(value, str):
+        return "s" + json.dumps(value)
+    if isinstance(value, bytes):
+        return "y" + value.hex()
+    if not isinstance(value, (dict, list, tuple, set, frozenset)):
+        name = f"{type(value).__module__}.{type(value).__qualname__}"
+        return "r" + json.dumps(name) + json.dumps(repr(value))
+    
+    if id(value) in seen:
+        raise ValueError("Circular reference in query")
+    seen.add(id(value))
+    try:
+        if isinstance(value, dict):
+            items = sorted(
+                _encode(k, seen) + ":" + _encode(v, seen) for k, v in value.items()
+            )
+            return "d{" + ",".join(items) + "}"
+        if isinstance(value, (set, frozenset)):
+            return "e{" + ",".join(sorted(_encode(item, seen) for item in value)) + "}"
+        tag = "l" if isinstance(value, list) else "t"
+        return tag + "[" + ",".join(_encode(item, seen) for item in value) + "]"
+    finally:
+        seen.discard(id(value))
@@ -0,0 +1,174 @@
+"""
+Latency tracking for the MCP Orchestrator framework.
+
+This module contains a streaming latency histogram with logarithmic buckets
+that estimates percentiles within a fixed relative error, in memory bounded
+by the range of tracked values rather than by the number of samples.
+"""
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """
+    A streaming histogram of latencies in seconds.
+    
+    Values are counted in logarithmic buckets, each spanning a constant
+    ratio, so that percentile estimates are within relative_error of the
+    true value. With a window, percentiles reflect roughly the last one
+    to two windows of samples.
+    """
+    
+    def __init__(
+        self,
+        relative_error: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 3600.0,
+        window: Optional[float] = None,
+    ):
+        """
+        Initialize the LatencyHistogram.
+        
+        Args:
+            relative_error: The relative accuracy of percentile estimates.
+            min_value: Values below this are counted as this value.
+            max_value: Values above this are counted as this value.
+            window: Optional length in seconds after which old samples are
+                    progressively forgotten.
+        
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be in (0, 1)")
+        if not 0 < min_value < max_value:
+            raise ValueError("min_value must be positive and below max_value")
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive")
+        
+        self.relative_error = relative_error
+        self.min_value = min_value
+        self.max_value = max_value
+        self.window = window
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        self.reset()
+    
+    @property
+    def count(self) -> int:
+        """The number of samples used for percentile estimates."""
+        self._rotate()
+        return self._current_count + self._previous_count
+    
+    def record(self, value: float) -> None:
+        """
+        Record a latency.
+        
+        Args:
+            value: The latency in seconds.
+        """
+        self._rotate()
+        self.total_count += 1
+        self.total_sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        
+        clamped = min(max(value, self.min_value), self.max_value)
+        key = math.ceil(math.log(clamped) / self._log_gamma)
+        self._current[key] = self._current.get(key, 0) + 1
+        self._current_count += 1
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a percentile of the recorded latencies.
+        
+        Args:
+            q: The percentile as a fraction between 0 and 1.
+        
+        Returns:
+            The estimated latency in seconds, or None if there are no samples.
+        
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        
+        buckets = self._merged_buckets()
+        total = sum(count for _, count in buckets)
+        if not total:
+            return None
+        
+        rank = q * (total - 1)
+        seen = 0
+        for key, count in buckets:
+            seen += count
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(buckets[-1][0])
+    
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.total_count = 0
+        self.total_sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._current: Dict[int, int] = {}
+        self._previous: Dict[int, int] = {}
+        self._current_count = 0
+        self._previous_count = 0
+        self._rotated_at = time.monotonic()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export the histogram for dashboards.
+        
+        Returns:
+            A dictionary with lifetime totals, common percentiles and the
+            non-empty buckets as (upper bound in seconds, count) pairs.
+        """
+        buckets = self._merged_buckets()
+        return {
+            "count": self.total_count,
+            "sum": self.total_sum,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": [
+                (self._gamma ** key, count) for key, count in buckets
+            ],
+        }
+    
+    def _bucket_value(self, key: int) -> float:
+        """Estimate the value of a bucket, minimizing the relative error."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+    
+    def _merged_buckets(self) -> List[Tuple[int, int]]:
+        """Combine the current and previous buckets, sorted by value."""
+        self._rotate()
+        merged = dict(self._previous)
+        for key, count in self._current.items():
+            merged[key] = merged.get(key, 0) + count
+        return sorted(merged.items())
+    
+    def _rotate(self) -> None:
+        """Start a new window when the current one has elapsed."""
+        if self.window is None:
+            return
+        
+        now = time.monotonic()
+        elapsed = now - self._rotated_at
+        if elapsed < self.window:
+            return
+        
+        if elapsed < 2 * self.window:
+            self._previous, self._previous_count = self._current, self._current_count
+        else:
+            self._previous, self._previous_count = {}, 0
+        self._current, self._current_count = {}, 0
+        self._rotated_at = now
@@ -0,0 +1,151 @@
+"""
+Concurrency limits for the MCP Orchestrator framework.
+
+This module contains a limiter that caps the number of concurrent calls to
+an MCP, queueing the excess calls fairly and optionally rejecting calls
+when the queue is full.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from mcp_orchestrator.exceptions import McpQueueFullError
+
+
+class ConcurrencyLimiter:
+    """
+    A first-in, first-out limiter of concurrent calls.
+    
+    Calls beyond the limit wait in a queue and are admitted in arrival order
+    as running calls complete. The limit may be changed while calls run.
+    The limiter records the queue depth and the time calls spend waiting.
+    """
+    
+    def __init__(self, limit: int, max_queue: Optional[int] = None):
+        """
+        Initialize the ConcurrencyLimiter.
+        
+        Args:
+            limit: The maximum number of concurrent calls.
+            max_queue: Optional maximum number of waiting calls. Calls
+                       arriving when the queue is full are rejected.
+        
+        Raises:
+            ValueError: If the limit is not positive or max_queue is negative.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        
+        self.limit = limit
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+    
+    @property
+    def queue_depth(self) -> int:
+        """The number of calls currently waiting."""
+        return len(self._waiters)
+    
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot.
+        
+        Raises:
+            McpQueueFullError: If the call must wait and the queue is full.
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.acquired += 1
+            return
+        
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise McpQueueFullError(self.max_queue)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        start = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        
+        wait = time.perf_counter() - start
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+    
+    def release(self) -> None:
+        """Free a slot, handing it over to the longest waiting call."""
+        self.in_flight -= 1
+        self._wake()
+    
+    def set_limit(self, limit: int) -> None:
+        """
+        Change the maximum number of concurrent calls.
+        
+        When the limit grows, waiting calls are admitted at once. When it
+        shrinks, running calls finish and their slots are not handed over
+        until fewer calls than the new limit run.
+        
+        Args:
+            limit: The new maximum number of concurrent calls.
+        
+        Raises:
+            ValueError: If the limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.limit = limit
+        self._wake()
+    
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
+    
+    def _wake(self) -> None:
+        """Hand free slots over to the longest waiting calls."""
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current state and counters of the limiter.
+        
+        Returns:
+            A dictionary with the limit, in-flight calls, queue depth and
+            wait time statistics.
+        """
+        return {
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait,
+            "mean_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+        }
@@ -0,0 +1,254 @@
+"""
+Metrics for the MCP Orchestrator framework.
+
+This module contains a registry of per-MCP call metrics and combination
+timings, cheap enough to leave enabled on the hot path, which can be
+exported as a plain dictionary or in the Prometheus text format.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_orchestrator.latency import LatencyHistogram
+
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class McpMetrics:
+    """
+    The call metrics of a single MCP.
+    
+    Counters only ever increase, except for the in-flight gauge, which
+    tracks the calls currently running.
+    """
+    
+    def __init__(self, latency: Optional[LatencyHistogram] = None):
+        """
+        Initialize the McpMetrics.
+        
+        Args:
+            latency: Optional histogram of call latencies. Defaults to a
+                     histogram over the whole lifetime of the metrics.
+        """
+        self.latency = latency if latency is not None else LatencyHistogram()
+        self.calls = 0
+        self.successes = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.cache_hits = 0
+        self.in_flight = 0
+        self.errors: Dict[str, int] = {}
+    
+    def record_start(self) -> None:
+        """Record the start of a call."""
+        self.calls += 1
+        self.in_flight += 1
+    
+    def record_success(self, latency: float) -> None:
+        """
+        Record a call that succeeded.
+        
+        Args:
+            latency: The latency of the call in seconds.
+        """
+        self.in_flight -= 1
+        self.successes += 1
+        self.latency.record(latency)
+    
+    def record_error(self, error: BaseException, timeout: bool = False) -> None:
+        """
+        Record a call that failed.
+        
+        Args:
+            error: The error raised by the call.
+            timeout: Whether the call timed out.
+        """
+        self.in_flight -= 1
+        if timeout:
+            self.timeouts += 1
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+    
+    def record_cancelled(self) -> None:
+        """Record a call that was cancelled."""
+        self.in_flight -= 1
+        self.cancelled += 1
+    
+    def record_cache_hit(self) -> None:
+        """Record a call answered from the cache."""
+        self.cache_hits += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export the metrics.
+        
+        Returns:
+            A dictionary with the counters, the in-flight gauge and a
+            snapshot of the latency histogram.
+        """
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "errors": dict(self.errors),
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "cache_hits": self.cache_hits,
+            "in_flight": self.in_flight,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """
+    A registry of the metrics of an orchestrator.
+    
+    The registry holds the call metrics of each MCP, created on first use,
+    and a histogram of the time spent combining contexts.
+    """
+    
+    def __init__(self, prefix: str = "mcp_orchestrator"):
+        """
+        Initialize the MetricsRegistry.
+        
+        Args:
+            prefix: The prefix of the metric names in the Prometheus export.
+        """
+        self.prefix = prefix
+        self.mcps: Dict[int, McpMetrics] = {}
+        self.combine_latency = LatencyHistogram()
+    
+    def mcp(self, index: int) -> McpMetrics:
+        """
+        Get the metrics of an MCP.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+        
+        Returns:
+            The metrics of the MCP, created if needed.
+        """
+        metrics = self.mcps.get(index)
+        if metrics is None:
+            metrics = self.mcps[index] = McpMetrics()
+        return metrics
+    
+    def record_combine(self, duration: float) -> None:
+        """
+        Record the time spent combining contexts.
+        
+        Args:
+            duration: The duration of the combination in seconds.
+        """
+        self.combine_latency.record(duration)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export the metrics as a plain dictionary.
+        
+        Returns:
+            A dictionary with the metrics of each MCP by index and a
+            snapshot of the combination time histogram.
+        """
+        return {
+            "mcps": {
+                index: metrics.snapshot()
+                for index, metrics in sorted(self.mcps.items())
+            },
+            "combine": self.combine_latency.snapshot(),
+        }
+    
+    def to_prometheus(self) -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+        
+        Latency histograms are exported as summaries with the 0.5, 0.9, 0.95
+        and 0.99 quantiles.
+        
+        Returns:
+            The metrics as text, ending with a newline.
+        """
+        lines: List[str] = []
+        mcps = sorted(self.mcps.items())
+        
+        counters = [
+            ("calls_total", "Calls to get_context per MCP.", "calls"),
+            ("successes_total", "Successful calls per MCP.", "successes"),
+            ("timeouts_total", "Calls that timed out per MCP.", "timeouts"),
+            ("cancelled_total", "Calls that were cancelled per MCP.", "cancelled"),
+            ("cache_hits_total", "Calls answered from the cache per MCP.", "cache_hits"),
+        ]
+        for name, help_text, attribute in counters:
+            self._add_header(lines, name, help_text, "counter")
+            for index, metrics in mcps:
+                self._add_sample(
+                    lines, name, [("mcp", str(index))], getattr(metrics, attribute)
+                )
+        
+        self._add_header(
+            lines, "errors_total", "Failed calls per MCP and error type.", "counter"
+        )
+        for index, metrics in mcps:
+            for error_type, count in sorted(metrics.errors.items()):
+                self._add_sample(
+                    lines, "errors_total",
+                    [("mcp", str(index)), ("type", error_type)], count,
+                )
+        
+        self._add_header(lines, "in_flight", "Calls currently running per MCP.", "gauge")
+        for index, metrics in mcps:
+            self._add_sample(lines, "in_flight", [("mcp", str(index))], metrics.in_flight)
+        
+        self._add_header(
+            lines, "latency_seconds", "Latency of successful calls per MCP.", "summary"
+        )
+        for index, metrics in mcps:
+            self._add_summary(
+                lines, "latency_seconds", [("mcp", str(index))], metrics.latency
+            )
+        
+        self._add_header(
+            lines, "combine_seconds", "Time spent combining contexts.", "summary"
+        )
+        self._add_summary(lines, "combine_seconds", [], self.combine_latency)
+        
+        return "\n".join(lines) + "\n"
+    
+    def _add_header(
+        self, lines: List[str], name: str, help_text: str, metric_type: str
+    ) -> None:
+        """Add the HELP and TYPE lines of a metric."""
+        lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {self.prefix}_{name} {metric_type}")
+    
+    def _add_sample(
+        self, lines: List[str], name: str, labels: List[Tuple[str, str]], value: Any
+    ) -> None:
+        """Add a sample line of a metric."""
+        if labels:
+            label_text = ",".join(
+                f'{key}="{_escape_label(label)}"' for key, label in labels
+            )
+            lines.append(f"{self.prefix}_{name}{{{label_text}}} {value}")
+        else:
+            lines.append(f"{self.prefix}_{name} {value}")
+    
+    def _add_summary(
+        self,
+        lines: List[str],
+        name: str,
+        labels: List[Tuple[str, str]],
+        histogram: LatencyHistogram,
+    ) -> None:
+        """Add the quantile, sum and count lines of a summary."""
+        for q in QUANTILES:
+            value = histogram.percentile(q)
+            self._add_sample(
+                lines, name, labels + [("quantile", str(q))],
+                "NaN" if value is None else value,
+            )
+        self._add_sample(lines, f"{name}_sum", labels, histogram.total_sum)
+        self._add_sample(lines, f"{name}_count", labels, histogram.total_count)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -6,11 +6,57 @@ collection and combination of context from multiple MCPs.
 """
 
 import asyncio
+import contextlib
 import logging
+import time
 from enum import Enum
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any, AsyncContextManager, AsyncIterable, AsyncIterator, Awaitable, Callable,
+    ContextManager, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence,
+    Tuple, Union,
+)
 
-from mcp_orchestrator.protocols import MCP, ContextCombinationStrategy
+from mcp_orchestrator.cache import ContextCache
+from mcp_orchestrator.admission import AdmissionController
+from mcp_orchestrator.capabilities import McpCapabilities
+from mcp_orchestrator.circuit import CircuitBreaker, CircuitCall, CircuitState
+from mcp_orchestrator.exceptions import (
+    McpCircuitOpenError, McpGatherError, McpOrchestratorError, McpTimeoutError,
+)
+from mcp_orchestrator.executors import BlockingDetector, CombineOffload
+from mcp_orchestrator.hedging import HedgePolicy
+from mcp_orchestrator.keys import normalize_query
+from mcp_orchestrator.limits import ConcurrencyLimiter
+from mcp_orchestrator.metrics import MetricsRegistry
+from mcp_orchestrator.payloads import PayloadSummary
+from mcp_orchestrator.registry import McpRegistry, McpSnapshot
+from mcp_orchestrator.protocols import (
+    MCP, BatchMCP, CompletionPolicy, ContextCombinationStrategy,
+    IncrementalCombinationStrategy, QueryRouter,
+)
+from mcp_orchestrator.retry import RetryPolicy
+from mcp_orchestrator.routing import SKIP
+from mcp_orchestrator.singleflight import SingleFlight
+from mcp_orchestrator.timeouts import AdaptiveTimeout
+from mcp_orchestrator.tracing import Span, Tracer, payload_size, use_span
+from mcp_orchestrator.updates import UpdateQueue
+
+# Shared by all blocks of code run without tracing
+_NO_SPAN = contextlib.nullcontext()
+
+
+class _NoAdmission:
+    """An async context manager admitting every query at once."""
+    
+    async def __aenter__(self) -> None:
+        return None
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+# Shared by all queries gathered without admission control
+_NO_ADMISSION = _NoAdmission()
 
 
 class ErrorPolicy(Enum):
@@ -35,6 +81,27 @@ class McpOrchestrator:
         strategy: ContextCombinationStrategy,
         error_policy: ErrorPolicy = ErrorPolicy.CONTINUE,
         logger: Optional[logging.Logger] = None,
+        timeout: Optional[float] = None,
+        mcp_timeouts: Optional[Mapping[int, float]] = None,
+        router: Optional[QueryRouter] = None,
+        cache: Optional[ContextCache] = None,
+        coalesce: bool = False,
+        concurrency_limiters: Optional[Mapping[int, ConcurrencyLimiter]] = None,
+        circuit_breakers: Optional[Mapping[int, CircuitBreaker]] = None,
+        retry_policies: Optional[Mapping[int, RetryPolicy]] = None,
+        hedge_policies: Optional[Mapping[int, HedgePolicy]] = None,
+        completion_policy: Optional[CompletionPolicy] = None,
+        adaptive_timeouts: Optional[Mapping[int, AdaptiveTimeout]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        hot_path_logging: bool = True,
+        log_payload_limit: int = 200,
+        blocking_detector: Optional[BlockingDetector] = None,
+        combine_offload: Optional[CombineOffload] = None,
+        update_queues: Optional[Mapping[int, UpdateQueue]] = None,
+        drain_timeout: Optional[float] = None,
+        mcp_names: Optional[Mapping[int, str]] = None,
+        admission_control: Optional[AdmissionController] = None,
     ):
         """
         Initialize the MCP Orchestrator.
@@ -44,95 +111,1428 @@ class McpOrchestrator:
             strategy: The strategy to use for combining contexts.
             error_policy: The policy to follow when MCPs encounter errors.
             logger: Optional logger for logging events and errors.
+            timeout: Optional default deadline in seconds for a whole
+                     context gathering call.
+            mcp_timeouts: Optional mapping of MCP index to a timeout in
+                          seconds for each individual call to that MCP.
+            router: Optional router mapping each query to the sub-query of
+                    each MCP. By default every MCP receives the same query.
+            cache: Optional cache of contexts keyed by MCP and query. The
+                   entries of an MCP are invalidated when an update is
+                   propagated to it.
+            coalesce: Whether concurrent identical queries to the same MCP
+                      share a single in-flight call.
+            concurrency_limiters: Optional mapping of MCP index to a limiter
+                                  capping the concurrent calls to that MCP.
+                                  Calls rejected because the limiter's queue
+                                  is full fail with McpQueueFullError.
+            circuit_breakers: Optional mapping of MCP index to a circuit
+                              breaker. Calls to an MCP whose circuit is open
+                              fail instantly with McpCircuitOpenError.
+            retry_policies: Optional mapping of MCP index to the policy used
+                            to retry its failed get_context calls within the
+                            overall deadline.
+            hedge_policies: Optional mapping of MCP index to the policy used
+                            to send hedged get_context calls when the MCP
+                            is slow to answer.
+            completion_policy: Optional default policy deciding when enough
+                               MCPs have answered for context gathering to
+                               stop. By default every MCP is waited for.
+            adaptive_timeouts: Optional mapping of MCP index to the policy
+                               deriving the timeout of its get_context calls
+                               from their observed latencies. It takes
+                               precedence over the MCP's fixed timeout.
+            metrics: Optional registry recording per-MCP call metrics and
+                     the time spent combining contexts.
+            tracer: Optional tracer receiving a span for each gather, MCP
+                    call and combine step. Tracing is disabled by default.
+            hot_path_logging: Whether to log the progress of each query and
+                              MCP call at debug level. Running Python with
+                              -O also removes these log calls.
+            log_payload_limit: The approximate maximum length of queries,
+                               contexts and responses in log messages.
+            blocking_detector: Optional detector reporting MCP calls that
+                               block the event loop. Synchronous MCPs should
+                               be adapted with run_in_executor instead.
+            combine_offload: Optional policy running the combination of
+                             large sets of contexts in a thread or process
+                             pool instead of on the event loop.
+            update_queues: Optional mapping of MCP index to the queue through
+                           which its updates are delivered in the background
+                           instead of during propagate_update.
+            drain_timeout: Optional time in seconds that closing the
+                           orchestrator or removing an MCP waits for
+                           requests in flight. By default it waits for all
+                           of them.
+            mcp_names: Optional mapping of MCP index to a unique name, by
+                       which the MCP can be removed. Defaults to
+                       "mcp-<index>".
+            admission_control: Optional controller limiting the number of
+                               queries gathered at once, and rejecting the
+                               queries that cannot be served in time.
         
         Raises:
-            ValueError: If no MCPs are provided or if the strategy is invalid.
+            ValueError: If no MCPs are provided, if the strategy is invalid,
+                        if a timeout is not positive or if two MCPs have
+                        the same name.
         """
         if not mcps:
             raise ValueError("At least one MCP must be provided")
         
-        self.mcps = mcps
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        
+        mcp_timeouts = dict(mcp_timeouts or {})
+        for index, mcp_timeout in mcp_timeouts.items():
+            if mcp_timeout <= 0:
+                raise ValueError(f"Timeout for MCP {index} must be positive")
+        
+        self.registry = McpRegistry(mcps, mcp_names)
+        self.capabilities = {
+            index: McpCapabilities.detect(mcp)
+            for index, mcp in self.registry.snapshot.mcps.items()
+        }
         self.strategy = strategy
         self.error_policy = error_policy
         self.logger = logger or logging.getLogger(__name__)
+        self.timeout = timeout
+        self.mcp_timeouts = mcp_timeouts
+        self.router = router
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.concurrency_limiters = dict(concurrency_limiters or {})
+        self.circuit_breakers = dict(circuit_breakers or {})
+        self.retry_policies = dict(retry_policies or {})
+        self.hedge_policies = dict(hedge_policies or {})
+        self.completion_policy = completion_policy
+        self.adaptive_timeouts = dict(adaptive_timeouts or {})
+        self.metrics = metrics
+        self.tracer = tracer
+        self.hot_path_logging = hot_path_logging
+        self.log_payload_limit = log_payload_limit
+        self.blocking_detector = blocking_detector
+        self.combine_offload = combine_offload
+        self.update_queues = dict(update_queues or {})
+        for index, queue in self.update_queues.items():
+            if index in self.registry.snapshot:
+                self._bind_update_queue(index, self.registry.snapshot.mcps[index], queue)
+        self.drain_timeout = drain_timeout
+        self.admission_control = admission_control
+        self.started = False
+        self.closed = False
+        self._in_flight = 0
+        self._idle: Optional[asyncio.Event] = None
+    
+    @property
+    def mcps(self) -> Sequence[MCP]:
+        """
+        The registered MCPs, in index order.
+        
+        The mapping of index to MCP is registry.snapshot.mcps. Until the
+        orchestrator is started, assigning a sequence replaces every
+        registered MCP, as if the orchestrator had been created with it: the
+        new MCPs get the indexes 0 to n - 1, per-MCP policies apply to them
+        by index, and the policies of other indexes are dropped. Once it is
+        started, MCPs are added and removed with add_mcp and remove_mcp,
+        which close them and never reuse their indexes.
+        
+        Raises:
+            McpOrchestratorError: If assigned once the orchestrator is started.
+            ValueError: If assigned an empty sequence.
+        """
+        return tuple(self.registry.snapshot.mcps.values())
+    
+    @mcps.setter
+    def mcps(self, mcps: Sequence[MCP]) -> None:
+        if self.started or self.closed:
+            raise McpOrchestratorError(
+                "MCPs of a started orchestrator are replaced with add_mcp and remove_mcp"
+            )
+        if not mcps:
+            raise ValueError("At least one MCP must be provided")
+        
+        dropped = [index for index in self.registry.snapshot.mcps if index >= len(mcps)]
+        self.registry.replace(mcps)
+        for index in dropped:
+            self._forget_mcp(index)
+        for index, mcp in enumerate(mcps):
+            self.capabilities[index] = McpCapabilities.detect(mcp)
+            queue = self.update_queues.get(index)
+            if queue is not None:
+                self._bind_update_queue(index, mcp, queue)
+        if self.cache is not None:
+            self._write_cache(self.cache.invalidate, None)
+    
+    async def __aenter__(self) -> "McpOrchestrator":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        await self.aclose()
+    
+    async def start(self) -> None:
+        """
+        Start the MCPs and warm them up, before taking traffic.
+        
+        MCPs implementing start are started concurrently, then MCPs
+        implementing warmup are warmed up concurrently. If an MCP fails to
+        start or warm up, the MCPs implementing aclose are closed again.
+        
+        Raises:
+            McpGatherError: If an MCP fails to start or warm up.
+        """
+        mcps = self.registry.snapshot.mcps
+        with self._trace("start", {"mcps": len(mcps)}):
+            for hook in ("start", "warmup"):
+                errors = await self._run_hooks(hook, mcps)
+                if errors:
+                    await self._run_hooks("aclose", mcps)
+                    raise McpGatherError(f"MCP {hook}", errors)
+            self.started = True
+    
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """
+        Drain the orchestrator and close the MCPs.
+        
+        New requests are rejected at once. Once the requests in flight have
+        finished, or the timeout has expired, the queued updates are
+        delivered and the MCPs implementing aclose are closed concurrently.
+        Errors while closing MCPs are logged. Closing the orchestrator again
+        does nothing.
+        
+        Args:
+            timeout: Optional time in seconds to wait for requests in flight.
+                     Defaults to the drain timeout given at construction.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        
+        with self._trace("aclose", {"in_flight": self._in_flight}):
+            if self._in_flight:
+                self._idle = asyncio.Event()
+                try:
+                    await asyncio.wait_for(
+                        self._idle.wait(),
+                        timeout if timeout is not None else self.drain_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        "Closing with %d requests still in flight", self._in_flight
+                    )
+            
+            await self.drain_updates()
+            await self._run_hooks("aclose", self.registry.snapshot.mcps)
+    
+    async def add_mcp(
+        self,
+        mcp: MCP,
+        name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        adaptive_timeout: Optional[AdaptiveTimeout] = None,
+        update_queue: Optional[UpdateQueue] = None,
+    ) -> int:
+        """
+        Register an MCP while the orchestrator is running.
+        
+        If the orchestrator was started, the MCP is started and warmed up
+        before it takes traffic. Requests already in flight do not call it.
+        
+        Args:
+            mcp: The MCP instance.
+            name: Optional unique name of the MCP. Defaults to "mcp-<index>".
+            timeout: Optional timeout in seconds for each call to the MCP.
+            concurrency_limiter: Optional limiter of the calls to the MCP.
+            circuit_breaker: Optional circuit breaker of the MCP.
+            retry_policy: Optional retry policy of the MCP.
+            hedge_policy: Optional hedge policy of the MCP.
+            adaptive_timeout: Optional adaptive timeout of the MCP.
+            update_queue: Optional queue delivering the updates of the MCP.
+        
+        Returns:
+            The index of the MCP, which is not reused by MCPs added later.
+        
+        Raises:
+            McpOrchestratorError: If the orchestrator is closed.
+            McpGatherError: If the MCP fails to start or warm up.
+            ValueError: If the timeout is not positive or if another MCP has
+                        the same name.
+        """
+        if self.closed:
+            raise McpOrchestratorError("Orchestrator is closed")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if name is not None and name in self.registry.snapshot.names.values():
+            raise ValueError(f"An MCP named {name!r} is already registered")
+        
+        index = self.registry.reserve()
+        self.capabilities[index] = McpCapabilities.detect(mcp)
+        for policies, policy in (
+            (self.mcp_timeouts, timeout),
+            (self.concurrency_limiters, concurrency_limiter),
+            (self.circuit_breakers, circuit_breaker),
+            (self.retry_policies, retry_policy),
+            (self.hedge_policies, hedge_policy),
+            (self.adaptive_timeouts, adaptive_timeout),
+            (self.update_queues, update_queue),
+        ):
+            if policy is not None:
+                policies[index] = policy
+        if update_queue is not None:
+            self._bind_update_queue(index, mcp, update_queue)
+        
+        try:
+            if self.started:
+                for hook in ("start", "warmup"):
+                    errors = await self._run_hooks(hook, {index: mcp})
+                    if errors:
+                        raise McpGatherError(f"MCP {hook}", errors)
+            # Another MCP with the same name may have been added meanwhile
+            self.registry.add(mcp, name, index)
+        except BaseException:
+            if self.started:
+                await self._run_hooks("aclose", {index: mcp})
+            self._forget_mcp(index)
+            raise
+        
+        self.logger.info("Added MCP %d (%s)", index, self.registry.snapshot.names[index])
+        return index
+    
+    async def remove_mcp(
+        self, key: Union[int, str], timeout: Optional[float] = None
+    ) -> None:
+        """
+        Unregister an MCP while the orchestrator is running.
+        
+        New requests stop calling the MCP at once. Once the requests that
+        may still call it have finished, or the timeout has expired, its
+        queued updates are delivered and it is closed if it implements
+        aclose.
+        
+        Args:
+            key: The index or name of the MCP.
+            timeout: Optional time in seconds to wait for requests in flight.
+                     Defaults to the drain timeout given at construction.
+        
+        Raises:
+            KeyError: If no such MCP is registered.
+        """
+        index = self.registry.resolve(key)
+        mcp = self.registry.snapshot.mcps[index]
+        self.registry.remove(index)
+        
+        drained = True
+        try:
+            await asyncio.wait_for(
+                self.registry.drain(index),
+                timeout if timeout is not None else self.drain_timeout,
+            )
+        except asyncio.TimeoutError:
+            drained = False
+            self.logger.warning("Removing MCP %d with requests still in flight", index)
+        
+        queue = self.update_queues.get(index)
+        if queue is not None:
+            await queue.aclose()
+        await self._run_hooks("aclose", {index: mcp})
+        if self.cache is not None:
+            self._write_cache(self.cache.invalidate, index)
+        # Requests still in flight may look up the policies of the MCP
+        if drained:
+            self._forget_mcp(index)
+        self.logger.info("Removed MCP %d", index)
     
     async def gather_and_combine_context(
-        self, query_data: Any, timeout: Optional[float] = None
+        self,
+        query_data: Any,
+        timeout: Optional[float] = None,
+        completion_policy: Optional[CompletionPolicy] = None,
     ) -> Any:
         """
         Gather context from all MCPs concurrently and combine the results.
         
+        MCPs that do not answer before their own timeout or the overall
+        deadline are cancelled and reported as McpTimeoutError through the
+        error policy. Once the completion policy is satisfied, the MCPs
+        still running are cancelled and left out of the combination.
+        
         Args:
             query_data: The query or parameters to pass to each MCP.
             timeout: Optional timeout in seconds for context gathering.
+                     Defaults to the timeout given at construction.
+            completion_policy: Optional policy deciding when enough MCPs
+                               have answered. Defaults to the completion
+                               policy given at construction.
         
         Returns:
             The combined context data.
         
         Raises:
+            McpOverloadedError: If the query is shed by admission control.
             Exception: If context gathering or combination fails, depending
                       on the error policy.
         """
-        self.logger.debug(f"Gathering context with query: {query_data}")
+        if __debug__ and self.hot_path_logging:
+            self.logger.debug("Gathering context with query: %s", self._summarize(query_data))
         
-        # Create tasks for each MCP
-        tasks = [
-            self._gather_context_from_mcp(i, mcp, query_data)
-            for i, mcp in enumerate(self.mcps)
-        ]
+        deadline = self._get_deadline(timeout)
         
-        # Gather results concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with self._admission(deadline):
+            with self._admit() as snapshot, self._trace(
+                "gather_and_combine_context", {"mcps": len(snapshot)}
+            ):
+                # Create tasks for each MCP
+                tasks = self._create_context_tasks(query_data, deadline, snapshot.mcps)
+                
+                return await self._combine_tasks(
+                    tasks, completion_policy or self.completion_policy
+                )
+    
+    async def gather_and_combine_many(
+        self,
+        queries: Union[Iterable[Any], AsyncIterable[Any]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        mcp_concurrency: Optional[Union[int, Mapping[int, int]]] = None,
+        batch_size: int = 100,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Gather and combine context for many queries with bounded concurrency.
         
-        # Process results based on error policy
-        contexts, errors = self._process_results(results)
+        This is equivalent to calling gather_and_combine_context for each
+        query, but limits how many queries and MCP calls run at once and
+        sends a single get_context_batch call per batch of queries to MCPs
+        that implement the BatchMCP protocol.
         
-        if errors and self.error_policy == ErrorPolicy.FAIL_FAST:
-            self.logger.error(f"Context gathering failed: {errors}")
-            raise RuntimeError(f"Context gathering failed: {errors}")
+        Args:
+            queries: The queries to process, as an iterable or async iterable.
+            timeout: Optional timeout in seconds for each query.
+                     Defaults to the timeout given at construction.
+            max_concurrency: Optional maximum number of queries in flight.
+            mcp_concurrency: Optional maximum number of concurrent calls per
+                             MCP, either for all MCPs or as a mapping of MCP
+                             index to limit.
+            batch_size: The number of queries read and batched together.
+            return_exceptions: Whether to return the exception of a failed
+                               query in its place instead of raising it.
         
-        # Combine contexts using the strategy
-        if not contexts:
-            self.logger.warning("No contexts were successfully gathered")
-            return None
+        Returns:
+            The combined context of each query, in input order.
+        
+        Raises:
+            Exception: If a query fails and return_exceptions is False.
+        """
+        results: Dict[int, Any] = {}
+        async for position, result in self.iter_gather_and_combine_many(
+            queries,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            mcp_concurrency=mcp_concurrency,
+            batch_size=batch_size,
+            return_exceptions=return_exceptions,
+        ):
+            results[position] = result
+        
+        return [results[position] for position in range(len(results))]
+    
+    async def iter_gather_and_combine_many(
+        self,
+        queries: Union[Iterable[Any], AsyncIterable[Any]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        mcp_concurrency: Optional[Union[int, Mapping[int, int]]] = None,
+        batch_size: int = 100,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Gather and combine context for many queries, yielding results as they complete.
+        
+        Queries are read lazily, one batch at a time, so that at most about
+        max_concurrency queries are buffered. Queries still running when the
+        iterator is closed are cancelled.
+        
+        Args:
+            queries: The queries to process, as an iterable or async iterable.
+            timeout: Optional timeout in seconds for each query.
+                     Defaults to the timeout given at construction.
+            max_concurrency: Optional maximum number of queries in flight.
+            mcp_concurrency: Optional maximum number of concurrent calls per
+                             MCP, either for all MCPs or as a mapping of MCP
+                             index to limit.
+            batch_size: The number of queries read and batched together.
+            return_exceptions: Whether to yield the exception of a failed
+                               query in its place instead of raising it.
+        
+        Yields:
+            Tuples of (position, combined_context), where position is the
+            position of the query in the input.
+        
+        Raises:
+            ValueError: If a limit or the batch size is not positive.
+            Exception: If a query fails and return_exceptions is False.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        
+        if mcp_concurrency is None:
+            mcp_limits: Mapping[int, int] = {}
+        elif isinstance(mcp_concurrency, int):
+            mcp_limits = {i: mcp_concurrency for i in self.registry.snapshot.mcps}
+        else:
+            mcp_limits = mcp_concurrency
+        for index, limit in mcp_limits.items():
+            if limit <= 0:
+                raise ValueError(f"Concurrency limit for MCP {index} must be positive")
+        
+        query_semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+        mcp_semaphores = {
+            index: asyncio.Semaphore(limit) for index, limit in mcp_limits.items()
+        }
+        read_ahead = max_concurrency or batch_size
         
-        self.logger.debug(f"Combining {len(contexts)} contexts")
-        return self.strategy.combine(contexts)
+        with self._admit() as snapshot:
+            batches = self._iter_batches(queries, batch_size)
+            pending: Dict["asyncio.Task[Any]", int] = {}
+            batch_tasks: List["asyncio.Task[List[Any]]"] = []
+            position = 0
+            exhausted = False
+            try:
+                while True:
+                    # Read more queries while there is room for them
+                    while not exhausted and len(pending) < read_ahead:
+                        try:
+                            batch = await batches.__anext__()
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                        
+                        if __debug__ and self.hot_path_logging:
+                            self.logger.debug("Starting batch of %d queries", len(batch))
+                        deadline = self._get_deadline(timeout)
+                        routes: List[Union[Dict[int, Any], Exception]] = []
+                        for query_data in batch:
+                            try:
+                                routes.append(self._route_query(query_data, snapshot.mcps))
+                            except Exception as e:
+                                routes.append(e)
+                        
+                        batch_results = {}
+                        for i, mcp in snapshot.mcps.items():
+                            if not self.capabilities[i].batch:
+                                continue
+                            offsets = [
+                                offset for offset, route in enumerate(routes)
+                                if not isinstance(route, Exception) and i in route
+                            ]
+                            if not offsets:
+                                continue
+                            sub_queries = [routes[offset][i] for offset in offsets]
+                            batch_task = asyncio.ensure_future(self._with_semaphore(
+                                mcp_semaphores.get(i),
+                                self._gather_batch_from_mcp(i, mcp, sub_queries, deadline),
+                            ))
+                            batch_tasks.append(batch_task)
+                            batch_results[i] = (
+                                batch_task,
+                                {offset: k for k, offset in enumerate(offsets)},
+                            )
+                        
+                        for offset, (query_data, route) in enumerate(zip(batch, routes)):
+                            task = asyncio.ensure_future(self._with_semaphore(
+                                query_semaphore,
+                                self._gather_and_combine_batched(
+                                    query_data, route, offset, snapshot.mcps,
+                                    batch_results, mcp_semaphores, timeout,
+                                ),
+                            ))
+                            pending[task] = position
+                            position += 1
+                    
+                    if not pending:
+                        break
+                    
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in sorted(done, key=pending.__getitem__):
+                        query_position = pending.pop(task)
+                        exception = task.exception()
+                        if exception is None:
+                            yield query_position, task.result()
+                        elif return_exceptions and isinstance(exception, Exception):
+                            yield query_position, exception
+                        else:
+                            raise exception
+            finally:
+                remaining = list(pending) + [t for t in batch_tasks if not t.done()]
+                for task in remaining:
+                    task.cancel()
+                if remaining:
+                    await asyncio.gather(*remaining, return_exceptions=True)
+                await batches.aclose()
+    
+    async def gather_as_completed(
+        self,
+        query_data: Any,
+        timeout: Optional[float] = None,
+        completion_policy: Optional[CompletionPolicy] = None,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Gather context from all MCPs concurrently, yielding results as they arrive.
+        
+        Results are yielded in completion order so that callers can start
+        processing early contexts while slower MCPs are still running. Errors
+        are handled according to the error policy: FAIL_FAST raises on the
+        first error, CONTINUE yields the exception in place of the context,
+        and IGNORE skips failed MCPs. MCPs that are still running when the
+        iterator is closed (for example with aclose() after an early break)
+        or when the completion policy is satisfied are cancelled.
+        
+        Args:
+            query_data: The query or parameters to pass to each MCP.
+            timeout: Optional timeout in seconds for context gathering.
+                     Defaults to the timeout given at construction.
+            completion_policy: Optional policy deciding when enough MCPs
+                               have answered. Defaults to the completion
+                               policy given at construction.
+        
+        Yields:
+            Tuples of (index, context) or, under the CONTINUE policy,
+            (index, exception) for MCPs that failed.
+        
+        Raises:
+            Exception: If context gathering fails, depending on the error policy.
+        """
+        if __debug__ and self.hot_path_logging:
+            self.logger.debug(
+                "Gathering context as completed with query: %s",
+                self._summarize(query_data),
+            )
+        
+        deadline = self._get_deadline(timeout)
+        
+        async with self._admission(deadline, measure=False):
+            # The span is only made current while the MCP calls are started, as
+            # the iterator may be resumed from other contexts
+            with self._admit() as snapshot, self._trace(
+                "gather_as_completed", {"mcps": len(snapshot)}, activate=False
+            ) as span:
+                with use_span(span):
+                    tasks = self._create_context_tasks(query_data, deadline, snapshot.mcps)
+                
+                completed = self._iter_completed(
+                    tasks, completion_policy or self.completion_policy
+                )
+                try:
+                    async for index, result in completed:
+                        contexts, errors = self._process_results([result], [index])
+                        if not errors:
+                            yield index, contexts[0]
+                            continue
+                        
+                        self._check_errors(
+                            errors, "Context gathering", self._get_pending_indices(tasks)
+                        )
+                        if self.error_policy == ErrorPolicy.CONTINUE:
+                            yield index, errors[index]
+                finally:
+                    await completed.aclose()
     
     async def propagate_update(self, response_data: Any) -> None:
         """
         Propagate an update to all MCPs that support the update_context method.
         
+        MCPs whose update_context does nothing can opt out with a
+        supports_update_context = False attribute, so that no call is
+        scheduled for them. Updates to MCPs with an update queue are only
+        queued, waiting for room if the queue is full; use flush_updates to
+        wait for their delivery. Under the FAIL_FAST policy, the first
+        failure cancels the updates still in progress.
+        
         Args:
             response_data: The response data to pass to each MCP.
         
         Raises:
             Exception: If update propagation fails, depending on the error policy.
         """
-        self.logger.debug(f"Propagating update with response: {response_data}")
+        if __debug__ and self.hot_path_logging:
+            self.logger.debug(
+                "Propagating update with response: %s", self._summarize(response_data)
+            )
         
-        # Create tasks for each MCP that supports update_context
-        tasks = []
-        for i, mcp in enumerate(self.mcps):
-            if hasattr(mcp, "update_context"):
-                tasks.append(self._update_context_in_mcp(i, mcp, response_data))
+        with self._admit() as snapshot, self._trace("propagate_update", {"mcps": len(snapshot)}):
+            # Create tasks for each MCP that supports update_context
+            tasks = {}
+            for i, mcp in snapshot.mcps.items():
+                if not self.capabilities[i].update:
+                    continue
+                queue = self.update_queues.get(i)
+                if queue is None:
+                    coro = self._update_context_in_mcp(i, mcp, response_data)
+                else:
+                    coro = self._enqueue_update(i, queue, response_data)
+                tasks[asyncio.ensure_future(coro)] = i
+            
+            if not tasks:
+                self.logger.debug("No MCPs support update_context")
+                return
+            
+            # Propagate updates concurrently, processing results based on error policy
+            completed = self._iter_completed(tasks)
+            try:
+                async for index, result in completed:
+                    _, errors = self._process_results([result], [index])
+                    self._check_errors(
+                        errors, "Update propagation", self._get_pending_indices(tasks)
+                    )
+            finally:
+                await completed.aclose()
+    
+    async def flush_updates(self) -> None:
+        """Wait until every queued update has been delivered to its MCP."""
+        await asyncio.gather(*(queue.flush() for queue in self.update_queues.values()))
+    
+    async def drain_updates(self) -> None:
+        """
+        Deliver every queued update and stop the background delivery.
         
-        if not tasks:
-            self.logger.debug("No MCPs support update_context")
-            return
+        Updates propagated afterwards to MCPs with an update queue fail.
+        """
+        await asyncio.gather(*(queue.aclose() for queue in self.update_queues.values()))
+    
+    async def _combine_tasks(
+        self,
+        tasks: Dict["asyncio.Task[Tuple[int, Any]]", int],
+        completion_policy: Optional[CompletionPolicy] = None,
+    ) -> Any:
+        """
+        Wait for context gathering tasks and combine their results.
         
-        # Propagate updates concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            tasks: A mapping of context gathering tasks to their MCP index.
+            completion_policy: Optional policy deciding when enough MCPs
+                               have answered.
         
-        # Process results based on error policy
-        _, errors = self._process_results(results)
+        Returns:
+            The combined context data, or None if no context was gathered.
         
+        Raises:
+            Exception: If context gathering or combination fails, depending
+                      on the error policy.
+        """
+        if isinstance(self.strategy, IncrementalCombinationStrategy):
+            return await self._gather_and_accumulate(tasks, completion_policy)
+        
+        # Gather results concurrently, processing them based on error policy
+        results: Dict[int, Any] = {}
+        completed = self._iter_completed(tasks, completion_policy)
+        try:
+            async for index, result in completed:
+                contexts, errors = self._process_results([result], [index])
+                self._check_errors(
+                    errors, "Context gathering", self._get_pending_indices(tasks)
+                )
+                if contexts:
+                    results[index] = contexts[0]
+        finally:
+            await completed.aclose()
+        
+        # Combine contexts in MCP order using the strategy
+        contexts = [results[i] for i in sorted(results)]
+        if not contexts:
+            self.logger.warning("No contexts were successfully gathered")
+            return None
+        
+        if __debug__ and self.hot_path_logging:
+            self.logger.debug("Combining %d contexts", len(contexts))
+        with self._trace("combine", self._get_combine_attributes(len(contexts))):
+            if self.metrics is None:
+                return await self._combine_contexts(contexts)
+            
+            start = time.perf_counter()
+            try:
+                return await self._combine_contexts(contexts)
+            finally:
+                self.metrics.record_combine(time.perf_counter() - start)
+    
+    async def _combine_contexts(self, contexts: List[Any]) -> Any:
+        """
+        Combine contexts using the strategy, offloading large combinations.
+        
+        Args:
+            contexts: The contexts to combine.
+        
+        Returns:
+            The combined context data.
+        """
+        if self.combine_offload is None:
+            return self.strategy.combine(contexts)
+        return await self.combine_offload.combine(self.strategy, contexts)
+    
+    async def _gather_and_accumulate(
+        self,
+        tasks: Dict["asyncio.Task[Tuple[int, Any]]", int],
+        completion_policy: Optional[CompletionPolicy] = None,
+    ) -> Any:
+        """
+        Combine contexts incrementally as each MCP completes.
+        
+        Args:
+            tasks: A mapping of context gathering tasks to their MCP index.
+            completion_policy: Optional policy deciding when enough MCPs
+                               have answered.
+        
+        Returns:
+            The combined context data, or None if no context was gathered.
+        
+        Raises:
+            Exception: If context gathering or combination fails, depending
+                      on the error policy.
+        """
+        accumulator = self.strategy.create_accumulator()
+        count = 0
+        errors: Dict[int, Exception] = {}
+        
+        completed = self._iter_completed(tasks, completion_policy)
+        try:
+            async for index, result in completed:
+                contexts, new_errors = self._process_results([result], [index])
+                errors.update(new_errors)
+                self._check_errors(
+                    new_errors, "Context gathering", self._get_pending_indices(tasks)
+                )
+                for context in contexts:
+                    accumulator.add(index, context)
+                    count += 1
+        finally:
+            await completed.aclose()
+        
+        self._check_errors(errors, "Context gathering")
+        
+        if not count:
+            self.logger.warning("No contexts were successfully gathered")
+            return None
+        
+        if __debug__ and self.hot_path_logging:
+            self.logger.debug("Finishing combination of %d contexts", count)
+        with self._trace("combine", self._get_combine_attributes(count)):
+            if self.metrics is None:
+                return accumulator.finish()
+            
+            start = time.perf_counter()
+            try:
+                return accumulator.finish()
+            finally:
+                self.metrics.record_combine(time.perf_counter() - start)
+    
+    def _create_context_tasks(
+        self, query_data: Any, deadline: Optional[float], mcps: Mapping[int, MCP]
+    ) -> Dict["asyncio.Task[Tuple[int, Any]]", int]:
+        """
+        Start one context gathering task per MCP.
+        
+        Args:
+            query_data: The query or parameters to pass to each MCP.
+            deadline: Optional overall deadline in event loop time.
+            mcps: The MCPs of the request, by index.
+        
+        Returns:
+            A mapping of each task to the index of its MCP, in MCP order.
+            MCPs skipped by the router have no task.
+        """
+        return {
+            asyncio.ensure_future(
+                self._gather_context_from_mcp(i, mcps[i], sub_query, deadline)
+            ): i
+            for i, sub_query in self._route_query(query_data, mcps).items()
+        }
+    
+    def _route_query(self, query_data: Any, mcps: Mapping[int, MCP]) -> Dict[int, Any]:
+        """
+        Map a query to the sub-query of each MCP that should be called.
+        
+        Args:
+            query_data: The query given to the orchestrator.
+            mcps: The MCPs of the request, by index.
+        
+        Returns:
+            A mapping of MCP index to its sub-query, in MCP order.
+        
+        Raises:
+            Exception: If the router fails to route the query.
+        """
+        if self.router is None:
+            return {i: query_data for i in mcps}
+        
+        routes = {}
+        for i, mcp in mcps.items():
+            sub_query = self.router.route(query_data, i, mcp)
+            if sub_query is SKIP:
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug("Skipping MCP %d for query", i)
+                continue
+            routes[i] = sub_query
+        return routes
+    
+    async def _gather_and_combine_batched(
+        self,
+        query_data: Any,
+        route: Union[Dict[int, Any], Exception],
+        offset: int,
+        mcps: Mapping[int, MCP],
+        batch_results: Mapping[int, Tuple["asyncio.Task[List[Any]]", Dict[int, int]]],
+        mcp_semaphores: Mapping[int, asyncio.Semaphore],
+        timeout: Optional[float],
+    ) -> Any:
+        """
+        Gather and combine context for one query of a batch.
+        
+        MCPs with a batch call in progress contribute their result for this
+        query from that call; the other MCPs are called individually.
+        
+        Args:
+            query_data: The query given to the orchestrator.
+            route: The sub-query of each MCP to call, or the routing error.
+            offset: The position of the query within its batch.
+            mcps: The MCPs of the request, by index.
+            batch_results: A mapping of MCP index to its batch call task and
+                           the position of each query within that call.
+            mcp_semaphores: A mapping of MCP index to its concurrency limit.
+            timeout: Optional timeout in seconds for the query.
+        
+        Returns:
+            The combined context data.
+        
+        Raises:
+            Exception: If routing, context gathering or combination fails,
+                      depending on the error policy.
+        """
+        if __debug__ and self.hot_path_logging:
+            self.logger.debug("Gathering context with query: %s", self._summarize(query_data))
+        
+        if isinstance(route, Exception):
+            raise route
+        
+        deadline = self._get_deadline(timeout)
+        
+        async with self._admission(deadline):
+            with self._trace("gather_and_combine_context", {"mcps": len(mcps)}):
+                tasks = {}
+                for i, sub_query in route.items():
+                    if i in batch_results:
+                        batch_task, offsets = batch_results[i]
+                        coro = self._take_batch_result(i, batch_task, offsets[offset])
+                    else:
+                        coro = self._with_semaphore(
+                            mcp_semaphores.get(i),
+                            self._gather_context_from_mcp(
+                                i, mcps[i], sub_query, deadline
+                            ),
+                        )
+                    tasks[asyncio.ensure_future(coro)] = i
+                
+                return await self._combine_tasks(tasks, self.completion_policy)
+    
+    async def _iter_batches(
+        self, queries: Union[Iterable[Any], AsyncIterable[Any]], batch_size: int
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Split queries into batches, reading them lazily.
+        
+        Args:
+            queries: The queries, as an iterable or async iterable.
+            batch_size: The maximum number of queries per batch.
+        
+        Yields:
+            Lists of at most batch_size queries.
+        """
+        batch: List[Any] = []
+        if isinstance(queries, AsyncIterable):
+            async for query_data in queries:
+                batch.append(query_data)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        else:
+            for query_data in queries:
+                batch.append(query_data)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        
+        if batch:
+            yield batch
+    
+    @staticmethod
+    async def _with_semaphore(
+        semaphore: Optional[asyncio.Semaphore], awaitable: Awaitable[Any]
+    ) -> Any:
+        """
+        Await an awaitable while holding an optional semaphore.
+        
+        Args:
+            semaphore: The semaphore to hold, or None for no limit.
+            awaitable: The awaitable to run.
+        
+        Returns:
+            The result of the awaitable.
+        """
+        if semaphore is None:
+            return await awaitable
+        async with semaphore:
+            return await awaitable
+    
+    async def _iter_completed(
+        self,
+        tasks: Dict["asyncio.Task[Any]", int],
+        completion_policy: Optional[CompletionPolicy] = None,
+    ) -> AsyncIterator[Tuple[int, Union[Any, Exception]]]:
+        """
+        Yield the outcome of each task as soon as it completes.
+        
+        The iteration stops when every task completed or when the completion
+        policy is satisfied. Tasks that are still pending when the iteration
+        stops are cancelled and awaited before returning.
+        
+        Args:
+            tasks: A mapping of tasks to the index of their MCP.
+            completion_policy: Optional policy deciding when enough tasks
+                               have completed.
+        
+        Yields:
+            Tuples of (index, result), where result is either the task's
+            return value or the exception it raised.
+        """
+        loop = asyncio.get_running_loop()
+        indices = list(tasks.values())
+        succeeded = set()
+        failed = set()
+        grace_deadline: Optional[float] = None
+        
+        pending = set(tasks)
+        try:
+            while pending:
+                wait_timeout = None
+                if grace_deadline is not None:
+                    wait_timeout = max(grace_deadline - loop.time(), 0)
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in sorted(done, key=tasks.__getitem__):
+                    exception = task.exception()
+                    if exception is not None and not isinstance(exception, Exception):
+                        raise exception
+                    (failed if exception is not None else succeeded).add(tasks[task])
+                    yield tasks[task], exception or task.result()
+                
+                if completion_policy is None or not pending:
+                    continue
+                if grace_deadline is not None and loop.time() >= grace_deadline:
+                    break
+                
+                wait = completion_policy.evaluate(succeeded, failed, indices)
+                if wait is None:
+                    continue
+                if wait <= 0:
+                    break
+                if grace_deadline is None or loop.time() + wait < grace_deadline:
+                    grace_deadline = loop.time() + wait
+            
+            if pending:
+                self.logger.debug(
+                    "Completion policy satisfied, cancelling %d MCPs", len(pending)
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    @staticmethod
+    def _get_pending_indices(tasks: Dict["asyncio.Task[Any]", int]) -> List[int]:
+        """
+        Get the indices of the MCPs whose task has not completed yet.
+        
+        Args:
+            tasks: A mapping of tasks to the index of their MCP.
+        
+        Returns:
+            The indices of the pending MCPs, in MCP order.
+        """
+        return sorted(i for task, i in tasks.items() if not task.done())
+    
+    def _check_errors(
+        self,
+        errors: Dict[int, Exception],
+        action: str,
+        cancelled: Sequence[int] = (),
+    ) -> None:
+        """
+        Apply the error policy to the errors of an operation.
+        
+        Args:
+            errors: A mapping of MCP index to the error it raised.
+            action: A description of the operation, used in messages.
+            cancelled: The indices of the MCPs that are cancelled if the
+                       operation fails.
+        
+        Raises:
+            McpGatherError: If there are errors and the policy is FAIL_FAST.
+        """
         if errors and self.error_policy == ErrorPolicy.FAIL_FAST:
-            self.logger.error(f"Update propagation failed: {errors}")
-            raise RuntimeError(f"Update propagation failed: {errors}")
+            error = McpGatherError(action, errors, cancelled)
+            self.logger.error("%s", error)
+            raise error
+    
+    def _get_deadline(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        Compute the absolute deadline of a call on the event loop clock.
+        
+        Args:
+            timeout: The timeout of the call, or None to use the default.
+        
+        Returns:
+            The deadline in event loop time, or None if there is no deadline.
+        
+        Raises:
+            ValueError: If the timeout is not positive.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None:
+            return None
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        return asyncio.get_running_loop().time() + timeout
+    
+    def _get_mcp_timeout(
+        self,
+        index: int,
+        deadline: Optional[float],
+        adaptive: Optional[AdaptiveTimeout] = None,
+    ) -> Optional[float]:
+        """
+        Compute the timeout of a single MCP call.
+        
+        The timeout is the adaptive timeout, if given, or else the MCP's own
+        timeout, capped by the time remaining until the overall deadline.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            deadline: The overall deadline in event loop time, if any.
+            adaptive: Optional adaptive timeout policy of the call.
+        
+        Returns:
+            The timeout in seconds, or None if the call is unbounded.
+        """
+        if adaptive is not None:
+            timeout = adaptive.get_timeout()
+        else:
+            timeout = self.mcp_timeouts.get(index)
+        if deadline is not None:
+            remaining = deadline - asyncio.get_running_loop().time()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+    
+    async def _await_with_timeout(
+        self,
+        index: int,
+        awaitable: Awaitable[Any],
+        deadline: Optional[float],
+        adaptive: Optional[AdaptiveTimeout] = None,
+        circuit: Optional[CircuitCall] = None,
+    ) -> Any:
+        """
+        Await a call to an MCP, bounded by the MCP's timeout.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            awaitable: The call to the MCP.
+            deadline: Optional overall deadline in event loop time.
+            adaptive: Optional adaptive timeout policy of the call, which
+                      records the call's latency.
+            circuit: Optional circuit breaker guard of the call, told the
+                     timeout so that it can tell timeouts from other
+                     cancellations.
+        
+        Returns:
+            The result of the call.
+        
+        Raises:
+            McpTimeoutError: If the MCP does not answer in time.
+        """
+        timeout = self._get_mcp_timeout(index, deadline, adaptive)
+        if timeout is None:
+            return await awaitable
+        
+        if timeout <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise McpTimeoutError(index, 0.0)
+        
+        if circuit is not None:
+            circuit.set_timeout(timeout)
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            # Only a timeout of the policy's own says something about the MCP
+            if adaptive is not None and timeout >= adaptive.get_timeout():
+                adaptive.record_timeout(timeout)
+            raise McpTimeoutError(index, timeout) from None
+        
+        if adaptive is not None:
+            adaptive.record_latency(time.perf_counter() - start)
+        return result
+    
+    async def _call_limited(
+        self,
+        index: int,
+        function: Callable[[], Awaitable[Any]],
+        name: str = "get_context",
+    ) -> Any:
+        """
+        Call an MCP within its concurrency limit, if it has one.
+        
+        The call is watched for steps blocking the event loop when a
+        blocking detector is configured. Calls to MCPs that do not support
+        cancellation are shielded: when the caller is cancelled, the call
+        runs to completion in the background and keeps its concurrency slot
+        until then.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            function: A function starting the call to the MCP.
+            name: The name of the call, used in blocking reports.
+        
+        Returns:
+            The result of the call.
+        
+        Raises:
+            McpQueueFullError: If the MCP's queue of waiting calls is full.
+        """
+        def start() -> Awaitable[Any]:
+            awaitable = function()
+            if self.blocking_detector is not None:
+                awaitable = self.blocking_detector.watch(index, awaitable, name)
+            return awaitable
+        
+        limiter = self.concurrency_limiters.get(index)
+        if self.capabilities[index].cancellation:
+            if limiter is None:
+                return await start()
+            async with limiter:
+                return await start()
+        
+        if limiter is None:
+            return await asyncio.shield(start())
+        
+        # The slot is released by the call itself, not by a cancelled caller
+        await limiter.acquire()
+        try:
+            task = asyncio.ensure_future(start())
+        except BaseException:
+            limiter.release()
+            raise
+        task.add_done_callback(lambda _: limiter.release())
+        return await asyncio.shield(task)
+    
+    async def _fetch_context(
+        self, index: int, mcp: MCP, query_data: Any, deadline: Optional[float]
+    ) -> Any:
+        """
+        Call get_context on an MCP through the orchestrator's call guards.
+        
+        Each attempt goes through the MCP's timeout, which adapts to the
+        MCP's latency when it has an adaptive timeout, is shared with
+        identical in-flight calls when coalescing is enabled, is hedged
+        according to the MCP's hedge policy, and waits for the MCP's
+        concurrency limit. Attempts are rejected at once while the MCP's
+        circuit is open; otherwise the breaker records the outcome of each
+        call that reaches the MCP. Failed attempts are retried according to
+        the MCP's retry policy, if it has one.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            mcp: The MCP instance.
+            query_data: The query or parameters to pass to the MCP.
+            deadline: Optional overall deadline in event loop time.
+        
+        Returns:
+            The context returned by the MCP.
+        
+        Raises:
+            McpCircuitOpenError: If the MCP's circuit is open.
+            McpTimeoutError: If the MCP does not answer in time.
+            Exception: If context gathering fails.
+        """
+        def call(circuit: Optional[CircuitCall]) -> Awaitable[Any]:
+            function = lambda: mcp.get_context(query_data)
+            if circuit is not None:
+                function = lambda: circuit.run(lambda: mcp.get_context(query_data))
+            policy = self.hedge_policies.get(index)
+            if policy is not None:
+                return self._call_hedged(index, mcp, query_data, policy, function)
+            return self._call_limited(index, function)
+        
+        def start(circuit: Optional[CircuitCall]) -> Awaitable[Any]:
+            if self.single_flight is None:
+                return call(circuit)
+            try:
+                key = (index, normalize_query(query_data))
+            except (TypeError, ValueError) as e:
+                # Queries without a canonical form are not shared
+                self.logger.debug("Not coalescing query to MCP %d: %s", index, e)
+                return call(circuit)
+            # Each caller waits up to its own deadline for the shared call
+            return self.single_flight.do(key, lambda: call(circuit))
+        
+        def attempt_call(circuit: Optional[CircuitCall]) -> Awaitable[Any]:
+            return self._await_with_timeout(
+                index, start(circuit), deadline, self.adaptive_timeouts.get(index),
+                circuit,
+            )
+        
+        policy = self.retry_policies.get(index)
+        if policy is None:
+            return await self._call_with_breaker(index, attempt_call)
+        
+        policy.record_call()
+        attempt = 1
+        while True:
+            try:
+                return await self._call_with_breaker(index, attempt_call)
+            except Exception as e:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                delay = policy.next_delay(attempt, e, remaining)
+                if delay is None:
+                    raise
+                self.logger.warning(
+                    "Attempt %d on MCP %d failed, retrying in %.3fs: %s",
+                    attempt, index, delay, e,
+                )
+            
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _call_hedged(
+        self,
+        index: int,
+        mcp: MCP,
+        query_data: Any,
+        policy: HedgePolicy,
+        function: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Call get_context on an MCP, hedging the call if it is slow.
+        
+        If the call has not returned after the policy's delay, a duplicate
+        call is sent to a replica. The first successful answer is returned
+        and the other call is cancelled. Calls to a replica bypass the MCP's
+        concurrency limit and circuit breaker; hedges to the MCP itself share
+        its concurrency limit.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            mcp: The MCP instance.
+            query_data: The query or parameters to pass to the MCP.
+            policy: The hedge policy of the MCP.
+            function: A function starting the call to the MCP itself.
+        
+        Returns:
+            The context returned by the first successful call.
+        
+        Raises:
+            Exception: If every call fails, the error of the last one.
+        """
+        start = time.perf_counter()
+        policy.record_call()
+        primary = asyncio.ensure_future(self._call_limited(index, function))
+        pending = {primary}
+        try:
+            delay = policy.get_delay()
+            if delay is not None:
+                await asyncio.wait(pending, timeout=delay)
+                if not primary.done() and policy.try_hedge():
+                    replica = policy.next_replica(mcp)
+                    if __debug__ and self.hot_path_logging:
+                        self.logger.debug("Hedging call to MCP %d after %.3fs", index, delay)
+                    if replica is mcp:
+                        hedge = self._call_limited(
+                            index, lambda: mcp.get_context(query_data)
+                        )
+                    else:
+                        # Replicas have their own capacity and health, so the
+                        # hedge neither waits for nor counts against the MCP's
+                        # concurrency limit and circuit breaker
+                        hedge = replica.get_context(query_data)
+                    pending.add(asyncio.ensure_future(hedge))
+            
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer the primary call when both complete at once
+                for task in sorted(done, key=lambda t: t is not primary):
+                    if task.exception() is None:
+                        policy.record_latency(time.perf_counter() - start)
+                        if task is not primary:
+                            policy.record_hedge_win()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _call_with_breaker(
+        self, index: int, function: Callable[[Optional[CircuitCall]], Awaitable[Any]]
+    ) -> Any:
+        """
+        Attempt a call to an MCP, unless its circuit breaker is open.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            function: A function starting the attempt, given the guard that
+                      records the outcome of the call once it reaches the
+                      MCP, or None if the MCP has no circuit breaker.
+        
+        Returns:
+            The result of the call.
+        
+        Raises:
+            McpCircuitOpenError: If the MCP's circuit is open.
+        """
+        breaker = self.circuit_breakers.get(index)
+        if breaker is None:
+            return await function(None)
+        
+        if breaker.state is CircuitState.OPEN:
+            breaker.rejected += 1
+            if __debug__ and self.hot_path_logging:
+                self.logger.debug("Circuit of MCP %d is open, skipping call", index)
+            raise McpCircuitOpenError(index)
+        
+        return await function(CircuitCall(breaker, index))
     
     async def _gather_context_from_mcp(
-        self, index: int, mcp: MCP, query_data: Any
+        self, index: int, mcp: MCP, query_data: Any,
+        deadline: Optional[float] = None,
     ) -> Tuple[int, Any]:
         """
         Gather context from a single MCP.
@@ -141,21 +1541,137 @@ class McpOrchestrator:
             index: The index of the MCP in the sequence.
             mcp: The MCP instance.
             query_data: The query or parameters to pass to the MCP.
+            deadline: Optional overall deadline in event loop time.
         
         Returns:
             A tuple of (index, context_data).
         
         Raises:
+            McpTimeoutError: If the MCP does not answer in time.
             Exception: If context gathering fails.
         """
-        try:
-            self.logger.debug(f"Gathering context from MCP {index}")
-            context = await mcp.get_context(query_data)
-            self.logger.debug(f"Successfully gathered context from MCP {index}")
+        metrics = None if self.metrics is None else self.metrics.mcp(index)
+        
+        with self._trace(
+            "mcp.get_context", self._get_mcp_attributes(index, mcp, query_data)
+        ) as span:
+            if self.cache is not None:
+                generation = self.cache.generation(index)
+                found, context = await self._get_cached_context(index, query_data)
+                if span is not None:
+                    span.set_attribute("cache.hit", found)
+                if found:
+                    if __debug__ and self.hot_path_logging:
+                        self.logger.debug("Using cached context from MCP %d", index)
+                    if metrics is not None:
+                        metrics.record_cache_hit()
+                    return index, context
+            
+            if metrics is not None:
+                metrics.record_start()
+                start = time.perf_counter()
+            try:
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug("Gathering context from MCP %d", index)
+                context = await self._fetch_context(index, mcp, query_data, deadline)
+            except asyncio.CancelledError:
+                if metrics is not None:
+                    metrics.record_cancelled()
+                raise
+            except Exception as e:
+                if metrics is not None:
+                    metrics.record_error(e, isinstance(e, McpTimeoutError))
+                self.logger.error("Error gathering context from MCP %d: %s", index, e)
+                raise
+            
+            if metrics is not None:
+                metrics.record_success(time.perf_counter() - start)
+            if span is not None:
+                span.set_attribute("response.size", payload_size(context))
+            if __debug__ and self.hot_path_logging:
+                self.logger.debug("Successfully gathered context from MCP %d", index)
+            if self.cache is not None:
+                self._write_cache(self.cache.set, index, query_data, context, generation)
             return index, context
-        except Exception as e:
-            self.logger.error(f"Error gathering context from MCP {index}: {e}")
-            raise
+    
+    async def _gather_batch_from_mcp(
+        self, index: int, mcp: BatchMCP, batch: List[Any],
+        deadline: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Gather context for a batch of queries from a single MCP.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            mcp: The MCP instance, which must support batching.
+            batch: The queries to pass to the MCP.
+            deadline: Optional overall deadline in event loop time.
+        
+        Returns:
+            The result for each query, in batch order.
+        
+        Raises:
+            McpTimeoutError: If the MCP does not answer in time.
+            ValueError: If the MCP returns the wrong number of results.
+            Exception: If context gathering fails.
+        """
+        with self._trace(
+            "mcp.get_context_batch", self._get_mcp_attributes(index, mcp, batch)
+        ):
+            try:
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug(
+                        "Gathering context for %d queries from MCP %d", len(batch), index
+                    )
+                def attempt_call(circuit: Optional[CircuitCall]) -> Awaitable[Any]:
+                    function = lambda: mcp.get_context_batch(batch)
+                    if circuit is not None:
+                        function = lambda: circuit.run(lambda: mcp.get_context_batch(batch))
+                    return self._await_with_timeout(
+                        index,
+                        self._call_limited(index, function, "get_context_batch"),
+                        deadline,
+                        circuit=circuit,
+                    )
+                
+                contexts = await self._call_with_breaker(index, attempt_call)
+                
+                if len(contexts) != len(batch):
+                    raise ValueError(
+                        f"MCP {index} returned {len(contexts)} results "
+                        f"for {len(batch)} queries"
+                    )
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug("Successfully gathered batch context from MCP %d", index)
+                return list(contexts)
+            except Exception as e:
+                self.logger.error("Error gathering batch context from MCP %d: %s", index, e)
+                raise
+    
+    async def _take_batch_result(
+        self, index: int, batch_task: "asyncio.Task[List[Any]]", offset: int
+    ) -> Tuple[int, Any]:
+        """
+        Take the result of one query from a batch call.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            batch_task: The task running the batch call.
+            offset: The position of the query within the batch.
+        
+        Returns:
+            A tuple of (index, context_data).
+        
+        Raises:
+            Exception: If the batch call or this query within it failed.
+        """
+        # Shield the batch call so that one query being cancelled
+        # does not cancel it for the other queries of the batch
+        contexts = await asyncio.shield(batch_task)
+        context = contexts[offset]
+        if isinstance(context, Exception):
+            raise context
+        return index, context
     
     async def _update_context_in_mcp(
         self, index: int, mcp: MCP, response_data: Any
@@ -174,23 +1690,357 @@ class McpOrchestrator:
         Raises:
             Exception: If context update fails.
         """
+        with self._trace(
+            "mcp.update_context", self._get_mcp_attributes(index, mcp, response_data)
+        ):
+            try:
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug("Updating context in MCP %d", index)
+                await self._call_limited(
+                    index, lambda: mcp.update_context(response_data), "update_context"
+                )
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug("Successfully updated context in MCP %d", index)
+                return index, None
+            except Exception as e:
+                self.logger.error("Error updating context in MCP %d: %s", index, e)
+                raise
+            finally:
+                # Drop cached contexts even if the update failed part way
+                if self.cache is not None:
+                    self._write_cache(self.cache.invalidate, index)
+    
+    @contextlib.contextmanager
+    def _admit(self) -> Iterator[McpSnapshot]:
+        """
+        Count a request as in flight until it finishes.
+        
+        Yields:
+            The snapshot of the MCPs the request may call.
+        
+        Raises:
+            McpOrchestratorError: If the orchestrator is closed.
+        """
+        if self.closed:
+            raise McpOrchestratorError("Orchestrator is closed")
+        
+        snapshot = self.registry.acquire()
+        self._in_flight += 1
         try:
-            self.logger.debug(f"Updating context in MCP {index}")
-            await mcp.update_context(response_data)
-            self.logger.debug(f"Successfully updated context in MCP {index}")
-            return index, None
-        except Exception as e:
-            self.logger.error(f"Error updating context in MCP {index}: {e}")
+            yield snapshot
+        finally:
+            self.registry.release(snapshot)
+            self._in_flight -= 1
+            if not self._in_flight and self._idle is not None:
+                self._idle.set()
+    
+    def _admission(
+        self, deadline: Optional[float], measure: bool = True
+    ) -> AsyncContextManager[None]:
+        """
+        Create a block waiting until the admission controller lets a query
+        be gathered.
+        
+        Args:
+            deadline: Optional deadline of the query in event loop time.
+            measure: Whether the latency of the query is reported to the
+                     controller. Iterators, whose latency includes the time
+                     their consumer takes, are not measured.
+        
+        Returns:
+            An async context manager admitting the query on entry, which
+            does nothing if admission control is disabled.
+        """
+        if self.admission_control is None:
+            return _NO_ADMISSION
+        return self._admit_query(self.admission_control, deadline, measure)
+    
+    @contextlib.asynccontextmanager
+    async def _admit_query(
+        self, controller: AdmissionController, deadline: Optional[float], measure: bool
+    ) -> AsyncIterator[None]:
+        """
+        Wait until an admission controller lets a query be gathered.
+        
+        Args:
+            controller: The admission controller.
+            deadline: Optional deadline of the query in event loop time.
+            measure: Whether the latency of the query is reported to the
+                     controller.
+        
+        Raises:
+            McpOverloadedError: If the query is shed.
+        """
+        await controller.acquire(deadline)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
             raise
+        finally:
+            end = loop.time()
+            if deadline is not None and end >= deadline - 0.01 * (deadline - start):
+                # The latency of a query cut short measures its deadline
+                controller.release(None, asyncio.TimeoutError())
+            else:
+                controller.release(end - start if measure else None, error)
+    
+    async def _run_hooks(self, hook: str, mcps: Mapping[int, MCP]) -> Dict[int, Exception]:
+        """
+        Run a lifecycle hook concurrently on the MCPs implementing it.
+        
+        Args:
+            hook: The name of the hook: start, warmup or aclose.
+            mcps: The MCPs to run the hook on, by index.
+        
+        Returns:
+            A dictionary mapping the index of each failed MCP to its error.
+        """
+        indices = [i for i in mcps if getattr(self.capabilities[i], hook)]
+        results = await asyncio.gather(
+            *(getattr(mcps[i], hook)() for i in indices), return_exceptions=True
+        )
+        
+        errors = {}
+        for index, result in zip(indices, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error in %s of MCP %d: %s", hook, index, result)
+                errors[index] = result
+            elif isinstance(result, BaseException):
+                raise result
+        return errors
+    
+    def _forget_mcp(self, index: int) -> None:
+        """Drop the capabilities and policies of an MCP that is not registered."""
+        for policies in (
+            self.capabilities,
+            self.mcp_timeouts,
+            self.concurrency_limiters,
+            self.circuit_breakers,
+            self.retry_policies,
+            self.hedge_policies,
+            self.adaptive_timeouts,
+            self.update_queues,
+        ):
+            policies.pop(index, None)
+    
+    def _summarize(self, payload: Any) -> PayloadSummary:
+        """
+        Describe a payload for a log message, formatting it only if logged.
+        
+        Args:
+            payload: The query, context or response to describe.
+        
+        Returns:
+            The lazy, size-bounded description of the payload.
+        """
+        return PayloadSummary(payload, self.log_payload_limit)
+    
+    def _trace(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        activate: bool = True,
+    ) -> ContextManager[Optional[Span]]:
+        """
+        Run a block of code within a span, if tracing is enabled.
+        
+        Args:
+            name: The name of the operation.
+            attributes: Optional attributes describing the operation.
+            activate: Whether the span becomes the current span within the
+                      block.
+        
+        Returns:
+            A context manager yielding the span, or None if tracing is
+            disabled.
+        """
+        if self.tracer is None:
+            return _NO_SPAN
+        return self.tracer.span(name, attributes, activate)
+    
+    def _get_mcp_attributes(
+        self, index: int, mcp: Any, payload: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Describe a call to an MCP for its span.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            mcp: The MCP instance.
+            payload: The query or response passed to the MCP.
+        
+        Returns:
+            The span attributes, or None if tracing is disabled.
+        """
+        if self.tracer is None:
+            return None
+        return {
+            "mcp.index": index,
+            "mcp.class": type(mcp).__name__,
+            "request.size": payload_size(payload),
+        }
+    
+    def _get_combine_attributes(self, count: int) -> Optional[Dict[str, Any]]:
+        """
+        Describe a combination of contexts for its span.
+        
+        Args:
+            count: The number of contexts combined.
+        
+        Returns:
+            The span attributes, or None if tracing is disabled.
+        """
+        if self.tracer is None:
+            return None
+        return {"strategy": type(self.strategy).__name__, "contexts": count}
+    
+    async def _enqueue_update(
+        self, index: int, queue: UpdateQueue, response_data: Any
+    ) -> Tuple[int, None]:
+        """
+        Queue an update for background delivery to a single MCP.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            queue: The update queue of the MCP.
+            response_data: The response data to pass to the MCP.
+        
+        Returns:
+            A tuple of (index, None).
+        
+        Raises:
+            McpQueueFullError: If the queue is full and does not block.
+        """
+        await queue.put(response_data)
+        return index, None
+    
+    def _bind_update_queue(self, index: int, mcp: MCP, queue: UpdateQueue) -> None:
+        """Make an update queue deliver its updates to a single MCP."""
+        queue.bind(lambda responses: self._deliver_updates(index, mcp, responses))
+    
+    async def _deliver_updates(self, index: int, mcp: MCP, responses: List[Any]) -> None:
+        """
+        Deliver a batch of queued updates to a single MCP.
+        
+        MCPs implementing update_context_batch receive the batch in one call;
+        the others receive one update_context call per update.
+        
+        Args:
+            index: The index of the MCP.
+            mcp: The MCP instance.
+            responses: The response data of each update, oldest first.
+        
+        Raises:
+            Exception: If the batch update fails, or if any update fails.
+        """
+        if not self.capabilities[index].update_batch:
+            failed = 0
+            for response_data in responses:
+                try:
+                    await self._update_context_in_mcp(index, mcp, response_data)
+                except Exception:
+                    failed += 1
+            if failed:
+                raise McpOrchestratorError(
+                    f"{failed} of {len(responses)} updates to MCP {index} failed"
+                )
+            return
+        
+        with self._trace(
+            "mcp.update_context_batch", self._get_mcp_attributes(index, mcp, responses)
+        ):
+            try:
+                if __debug__ and self.hot_path_logging:
+                    self.logger.debug(
+                        "Updating context in MCP %d with %d updates", index, len(responses)
+                    )
+                await self._call_limited(
+                    index, lambda: mcp.update_context_batch(responses), "update_context_batch"
+                )
+            except Exception as e:
+                self.logger.error("Error updating context in MCP %d: %s", index, e)
+                raise
+            finally:
+                # Drop cached contexts even if the update failed part way
+                if self.cache is not None:
+                    self._write_cache(self.cache.invalidate, index)
+    
+    async def _get_cached_context(self, index: int, query_data: Any) -> Tuple[bool, Any]:
+        """
+        Look up the cached context of a query to an MCP.
+        
+        Lookups run in the cache backend's executor if it has one. Cache
+        failures are logged and treated as misses.
+        
+        Args:
+            index: The index of the MCP in the sequence.
+            query_data: The query or parameters passed to the MCP.
+        
+        Returns:
+            A tuple of (found, context).
+        """
+        try:
+            executor = getattr(self.cache.backend, "executor", None)
+            if executor is None:
+                return self.cache.get(index, query_data)
+            if self.cache.get_ttl(index) is None:
+                return False, None
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, self.cache.get, index, query_data
+            )
+        except Exception as e:
+            self.logger.warning("Error reading cache for MCP %d: %s", index, e)
+            return False, None
+    
+    def _write_cache(
+        self, function: Callable[..., None], index: Optional[int], *args: Any
+    ) -> None:
+        """
+        Store or invalidate cached contexts of an MCP.
+        
+        Writes are submitted to the cache backend's executor if it has one,
+        without waiting for them; the executor runs them in order, after the
+        lookups made before. Cache failures are logged and otherwise ignored.
+        
+        Args:
+            function: The cache method to call.
+            index: The index of the MCP in the sequence, or None for all MCPs.
+            *args: The other arguments of the method.
+        """
+        executor = getattr(self.cache.backend, "executor", None)
+        if executor is None:
+            self._run_cache_write(function, index, *args)
+            return
+        try:
+            executor.submit(self._run_cache_write, function, index, *args)
+        except RuntimeError as e:
+            self.logger.warning("Error writing cache for MCP %s: %s", index, e)
+    
+    def _run_cache_write(
+        self, function: Callable[..., None], index: Optional[int], *args: Any
+    ) -> None:
+        """Call a cache method, logging failures."""
+        try:
+            function(index, *args)
+        except Exception as e:
+            self.logger.warning("Error writing cache for MCP %s: %s", index, e)
     
     def _process_results(
-        self, results: List[Union[Tuple[int, Any], Exception]]
+        self,
+        results: Sequence[Union[Tuple[int, Any], Exception]],
+        indices: Optional[Sequence[int]] = None,
     ) -> Tuple[List[Any], Dict[int, Exception]]:
         """
         Process the results of asyncio.gather.
         
         Args:
             results: The results from asyncio.gather.
+            indices: Optional MCP index of each result, used to key errors.
+                     Defaults to the position of each result.
         
         Returns:
             A tuple of (contexts, errors).
@@ -200,13 +2050,15 @@ class McpOrchestrator:
         
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                errors[i] = result
+                errors[i if indices is None else indices[i]] = result
             else:
                 index, context = result
                 contexts.append(context)
         
         if errors:
-            error_msg = ", ".join(f"MCP {i}: {e}" for i, e in errors.items())
-            self.logger.warning(f"Errors occurred during processing: {error_msg}")
+            self.logger.warning(
+                "Errors occurred during processing: %s",
+                ", ".join(f"MCP {i}: {e}" for i, e in errors.items()),
+            )
         
         return contexts, errors
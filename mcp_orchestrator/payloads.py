@@ -0,0 +1,57 @@
+"""
+Payload summaries for the MCP Orchestrator framework.
+
+This module contains a lazy, size-bounded description of queries, contexts
+and responses for log messages, so that logging never formats a whole
+payload, and formats nothing at all when the message is not emitted.
+"""
+
+import reprlib
+from typing import Any, Sized
+
+# The number of items of a collection that are described
+MAX_ITEMS = 6
+
+
+class PayloadSummary:
+    """
+    A description of a payload, formatted only when it is logged.
+    
+    The description is the payload's repr, with long strings and large
+    collections truncated, followed by the payload's length when it is
+    truncated.
+    """
+    
+    __slots__ = ("payload", "max_length")
+    
+    def __init__(self, payload: Any, max_length: int = 200):
+        """
+        Initialize the PayloadSummary.
+        
+        Args:
+            payload: The query, context or response to describe.
+            max_length: The approximate maximum length of the description.
+        """
+        self.payload = payload
+        self.max_length = max_length
+    
+    def __str__(self) -> str:
+        payload = self.payload
+        if isinstance(payload, (bytes, bytearray)):
+            # reprlib would format the whole payload before truncating it
+            text = repr(payload[:self.max_length])
+        else:
+            formatter = reprlib.Repr()
+            formatter.maxstring = formatter.maxother = self.max_length
+            formatter.maxlong = self.max_length
+            formatter.maxlist = formatter.maxtuple = formatter.maxdict = MAX_ITEMS
+            formatter.maxset = formatter.maxfrozenset = formatter.maxdeque = MAX_ITEMS
+            text = formatter.repr(payload)
+        
+        if isinstance(payload, Sized):
+            limit = self.max_length if isinstance(payload, (str, bytes, bytearray)) else MAX_ITEMS
+            if len(payload) > limit:
+                text += f" (length {len(payload)})"
+        return text
+    
+    __repr__ = __str__
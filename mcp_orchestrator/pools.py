@@ -0,0 +1,444 @@
+"""
+Replica pools for the MCP Orchestrator framework.
+
+This module contains an MCP presenting several replicas of the same
+backend as a single logical MCP: each call is sent to one replica chosen by
+a load balancer, and replicas that keep failing, or fail their health
+checks, are ejected from the pool for a while.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from mcp_orchestrator.capabilities import McpCapabilities
+from mcp_orchestrator.exceptions import McpGatherError
+from mcp_orchestrator.protocols import MCP, LoadBalancer
+
+
+class Replica:
+    """
+    A replica of a pool, with the load and health statistics of its calls.
+    
+    The latency is an exponentially weighted moving average of the latency
+    of successful calls, or None before the first one. The error rate is a
+    moving average of the outcome of calls, 1 for failures and 0 for
+    successes, with the same weight. Calls that are cancelled, for instance
+    when they time out, count as failures.
+    """
+    
+    def __init__(self, mcp: MCP, index: int, latency_weight: float = 0.2):
+        """
+        Initialize the Replica.
+        
+        Args:
+            mcp: The MCP instance.
+            index: The position of the replica in its pool.
+            latency_weight: The weight of each new sample in the latency
+                            and error rate averages, between 0 and 1.
+        """
+        self.mcp = mcp
+        self.index = index
+        self.latency_weight = latency_weight
+        self.capabilities = McpCapabilities.detect(mcp)
+        self.outstanding = 0
+        self.calls = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.ejected_until = 0.0
+        self._starts: List[float] = []
+    
+    @property
+    def ejected(self) -> bool:
+        """Whether the replica is ejected from the pool."""
+        return self.ejected_until > time.monotonic()
+    
+    @property
+    def in_flight_time(self) -> float:
+        """The time in seconds the oldest call in progress has been running."""
+        if not self._starts:
+            return 0.0
+        return time.perf_counter() - self._starts[0]
+    
+    def begin_call(self) -> float:
+        """
+        Record the start of a call.
+        
+        Returns:
+            The start time of the call, to pass to end_call.
+        """
+        start = time.perf_counter()
+        self.calls += 1
+        self.outstanding += 1
+        self._starts.append(start)
+        return start
+    
+    def end_call(self, start: float) -> float:
+        """
+        Record the end of a call, before its outcome.
+        
+        Args:
+            start: The start time returned by begin_call.
+        
+        Returns:
+            The latency of the call in seconds.
+        """
+        self.outstanding -= 1
+        self._starts.remove(start)
+        return time.perf_counter() - start
+    
+    def record_success(self, latency: float) -> None:
+        """
+        Record a successful call.
+        
+        Args:
+            latency: The latency of the call in seconds.
+        """
+        self.consecutive_failures = 0
+        self.error_rate -= self.latency_weight * self.error_rate
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.latency_weight * (latency - self.latency)
+    
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self.errors += 1
+        self.consecutive_failures += 1
+        self.error_rate += self.latency_weight * (1.0 - self.error_rate)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the statistics of the replica.
+        
+        Returns:
+            A dictionary with the calls, errors, error rate, outstanding
+            calls, average latency, ejections and whether the replica is
+            ejected.
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "outstanding": self.outstanding,
+            "latency": self.latency,
+            "ejections": self.ejections,
+            "ejected": self.ejected,
+        }
+
+
+class RoundRobinBalancer:
+    """A balancer choosing the replicas in turn."""
+    
+    def __init__(self):
+        """Initialize the RoundRobinBalancer."""
+        self._next = 0
+    
+    def choose(self, replicas: Sequence[Replica]) -> Replica:
+        """
+        Choose the next replica in turn.
+        
+        Args:
+            replicas: The replicas that may receive the call.
+        
+        Returns:
+            The chosen replica.
+        """
+        replica = replicas[self._next % len(replicas)]
+        self._next += 1
+        return replica
+
+
+class LeastOutstandingBalancer:
+    """A balancer choosing a replica with the fewest calls in progress."""
+    
+    def choose(self, replicas: Sequence[Replica]) -> Replica:
+        """
+        Choose a replica with the fewest calls in progress, at random among ties.
+        
+        Args:
+            replicas: The replicas that may receive the call.
+        
+        Returns:
+            The chosen replica.
+        """
+        fewest = min(replica.outstanding for replica in replicas)
+        return random.choice([r for r in replicas if r.outstanding == fewest])
+
+
+class PowerOfTwoChoicesBalancer:
+    """
+    A balancer comparing two replicas drawn at random.
+    
+    The replica with the lower expected time to a successful answer, its
+    average latency times its calls in progress plus one, divided by its
+    success rate, is chosen. The latency is at least the running time of
+    the oldest call in progress, so a replica that hangs gets more expensive
+    the longer it hangs. Replicas never called are preferred, so that every
+    replica is measured; idle replicas without successful calls yet are
+    assumed to be as fast as the replica they are compared with. Sampling
+    two replicas avoids herding all calls to the replica that currently
+    looks best.
+    """
+    
+    def choose(self, replicas: Sequence[Replica]) -> Replica:
+        """
+        Choose the better of two replicas drawn at random.
+        
+        Args:
+            replicas: The replicas that may receive the call.
+        
+        Returns:
+            The chosen replica.
+        """
+        if len(replicas) == 1:
+            return replicas[0]
+        
+        first, second = random.sample(replicas, 2)
+        first_cost = _cost(first, second.latency)
+        return first if first_cost <= _cost(second, first.latency) else second
+
+
+def _cost(replica: Replica, default_latency: Optional[float]) -> float:
+    """Estimate the time a new call to a replica would take to succeed."""
+    if not replica.calls:
+        return 0.0
+    if replica.outstanding:
+        latency: Optional[float] = max(replica.latency or 0.0, replica.in_flight_time)
+    elif replica.latency is not None:
+        latency = replica.latency
+    else:
+        latency = default_latency
+    success_rate = 1.0 - replica.error_rate
+    if latency is None or success_rate <= 0.0:
+        return float("inf")
+    return latency * (replica.outstanding + 1) / success_rate
+
+
+class PooledMCP:
+    """
+    An MCP sending each call to one of several replicas of the same backend.
+    
+    A replica is ejected when its consecutive failures reach the failure
+    threshold, or when its health check fails, and readmitted after the
+    ejection time or once a health check passes. At most max_ejection_ratio
+    of the replicas are ejected at once; if every replica is ejected anyway,
+    calls are spread over all of them. Updates are sent to every replica.
+    """
+    
+    def __init__(
+        self,
+        replicas: Sequence[MCP],
+        balancer: Optional[LoadBalancer] = None,
+        failure_threshold: Optional[int] = 5,
+        ejection_time: float = 30.0,
+        max_ejection_ratio: float = 0.5,
+        health_check_interval: Optional[float] = None,
+        health_check_timeout: float = 5.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the PooledMCP.
+        
+        Args:
+            replicas: The MCP instances serving the same data.
+            balancer: Optional load balancer choosing the replica of each
+                      call. Defaults to a PowerOfTwoChoicesBalancer.
+            failure_threshold: Optional number of consecutive failures that
+                               ejects a replica.
+            ejection_time: The time in seconds an ejected replica stays out
+                           of the pool.
+            max_ejection_ratio: The maximum fraction of replicas ejected at
+                                once, between 0 and 1.
+            health_check_interval: Optional interval in seconds between
+                                   health checks of the replicas
+                                   implementing health_check, run in the
+                                   background between start and aclose.
+            health_check_timeout: The time in seconds after which a health
+                                  check counts as failed.
+            logger: Optional logger for ejections and readmissions.
+        
+        Raises:
+            ValueError: If no replicas are given or a parameter is out of
+                        range.
+        """
+        if not replicas:
+            raise ValueError("At least one replica must be provided")
+        if failure_threshold is not None and failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        if not 0 <= max_ejection_ratio <= 1:
+            raise ValueError("max_ejection_ratio must be in [0, 1]")
+        if health_check_interval is not None and health_check_interval <= 0:
+            raise ValueError("health_check_interval must be positive")
+        
+        self.replicas = [Replica(mcp, index) for index, mcp in enumerate(replicas)]
+        self.balancer = balancer or PowerOfTwoChoicesBalancer()
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self.max_ejection_ratio = max_ejection_ratio
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.supports_update_context = any(r.capabilities.update for r in self.replicas)
+        self._health_task: Optional["asyncio.Task[None]"] = None
+    
+    async def get_context(self, query_data: Any) -> Any:
+        """
+        Gather context from a replica chosen by the balancer.
+        
+        Args:
+            query_data: The query or parameters to pass to the replica.
+        
+        Returns:
+            The context returned by the replica.
+        
+        Raises:
+            Exception: If the replica fails.
+        """
+        replica = self.balancer.choose(self._get_available())
+        start = replica.begin_call()
+        try:
+            context = await replica.mcp.get_context(query_data)
+        except (Exception, asyncio.CancelledError):
+            # Calls cancelled by a timeout count, or a hung replica is never ejected
+            replica.end_call(start)
+            replica.record_failure()
+            if (
+                self.failure_threshold is not None
+                and replica.consecutive_failures >= self.failure_threshold
+            ):
+                self._eject(replica, "consecutive failures")
+            raise
+        replica.record_success(replica.end_call(start))
+        return context
+    
+    async def update_context(self, response_data: Any) -> None:
+        """
+        Update every replica implementing update_context.
+        
+        Args:
+            response_data: The response data to pass to the replicas.
+        
+        Raises:
+            McpGatherError: If any replica fails to update.
+        """
+        await self._broadcast("update_context", response_data)
+    
+    async def start(self) -> None:
+        """Start the replicas and the background health checks."""
+        await self._broadcast("start")
+        if self.health_check_interval is not None and self._health_task is None:
+            self._health_task = asyncio.ensure_future(self._run_health_checks())
+    
+    async def warmup(self) -> None:
+        """Warm up the replicas."""
+        await self._broadcast("warmup")
+    
+    async def aclose(self) -> None:
+        """Stop the background health checks and close the replicas."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        await self._broadcast("aclose")
+    
+    async def health_check(self) -> bool:
+        """
+        Check the health of the replicas implementing health_check.
+        
+        Failing replicas are ejected and passing ones readmitted.
+        
+        Returns:
+            True if any replica is available.
+        """
+        checked = [r for r in self.replicas if r.capabilities.health_check]
+        results = await asyncio.gather(
+            *(self._check_replica(replica) for replica in checked)
+        )
+        for replica, healthy in zip(checked, results):
+            if not healthy:
+                self._eject(replica, "failed health check")
+            elif replica.ejected:
+                replica.ejected_until = 0.0
+                self.logger.info("Readmitted replica %d after health check", replica.index)
+        return any(not replica.ejected for replica in self.replicas)
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the statistics of each replica.
+        
+        Returns:
+            The statistics of the replicas, in pool order.
+        """
+        return [replica.stats() for replica in self.replicas]
+    
+    def _get_available(self) -> List[Replica]:
+        """Get the replicas that are not ejected, or all of them if none is left."""
+        available = [replica for replica in self.replicas if not replica.ejected]
+        return available or self.replicas
+    
+    def _eject(self, replica: Replica, reason: str) -> None:
+        """Eject a replica, unless too many replicas are ejected already."""
+        if replica.ejected:
+            return
+        ejected = sum(1 for r in self.replicas if r.ejected)
+        if ejected + 1 > self.max_ejection_ratio * len(self.replicas):
+            return
+        
+        replica.ejected_until = time.monotonic() + self.ejection_time
+        replica.ejections += 1
+        replica.consecutive_failures = 0
+        # Readmitted replicas compete on their latency again
+        replica.error_rate = 0.0
+        self.logger.warning("Ejected replica %d after %s", replica.index, reason)
+    
+    async def _check_replica(self, replica: Replica) -> bool:
+        """Run the health check of a replica, counting errors as failures."""
+        try:
+            return bool(await asyncio.wait_for(
+                replica.mcp.health_check(), self.health_check_timeout
+            ))
+        except Exception as e:
+            self.logger.debug("Health check of replica %d failed: %s", replica.index, e)
+            return False
+    
+    async def _run_health_checks(self) -> None:
+        """Check the health of the replicas until cancelled."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.health_check()
+    
+    async def _broadcast(self, method: str, *args: Any) -> None:
+        """
+        Call a method concurrently on every replica implementing it.
+        
+        Raises:
+            McpGatherError: If any replica fails.
+        """
+        replicas = [r for r in self.replicas if getattr(r.capabilities, _CAPABILITIES[method])]
+        results = await asyncio.gather(
+            *(getattr(replica.mcp, method)(*args) for replica in replicas),
+            return_exceptions=True,
+        )
+        errors = {}
+        for replica, result in zip(replicas, results):
+            if isinstance(result, Exception):
+                errors[replica.index] = result
+            elif isinstance(result, BaseException):
+                raise result
+        if errors:
+            raise McpGatherError(f"Replica {method}", errors)
+
+
+# The capability of each method broadcast to the replicas
+_CAPABILITIES = {
+    "update_context": "update",
+    "start": "start",
+    "warmup": "warmup",
+    "aclose": "aclose",
+}
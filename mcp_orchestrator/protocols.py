@@ -4,7 +4,9 @@ Core protocols for the MCP Orchestrator framework.
 This module defines the standard interfaces that all components must follow.
 """
 
-from typing import Any, List, Protocol, runtime_checkable
+from typing import (
+    AbstractSet, Any, List, Optional, Protocol, Sequence, runtime_checkable,
+)
 
 
 @runtime_checkable
@@ -38,7 +40,9 @@ class MCP(Protocol):
         
         This method is optional for MCP implementations. It allows for
         updating the context source based on the response from an LLM
-        or other processing steps.
+        or other processing steps. MCPs whose update_context does nothing
+        can set a supports_update_context = False class attribute, so that
+        the orchestrator does not call it.
         
         Args:
             response_data: The response data used to update the context.
@@ -50,6 +54,210 @@ class MCP(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchMCP(Protocol):
+    """
+    Protocol for MCPs that can retrieve context for many queries in one call.
+    
+    This is an optional extension of the MCP protocol. When processing many
+    queries, the orchestrator sends each batch of queries to such MCPs in a
+    single call instead of calling get_context once per query.
+    """
+    
+    async def get_context_batch(self, queries: List[Any]) -> List[Any]:
+        """
+        Asynchronously retrieve context for a batch of queries.
+        
+        Args:
+            queries: The queries or parameters used to retrieve context.
+        
+        Returns:
+            The context data for each query, in the same order as the queries.
+            An exception instance may be returned in place of the context of
+            a query that failed.
+        
+        Raises:
+            Exception: If context retrieval fails for the whole batch.
+        """
+        ...
+
+
+@runtime_checkable
+class BatchUpdateMCP(Protocol):
+    """
+    Protocol for MCPs that can apply many context updates in one call.
+    
+    This is an optional extension of the MCP protocol. When updates are
+    queued for background delivery, the orchestrator delivers each batch of
+    queued updates to such MCPs in a single call instead of calling
+    update_context once per update.
+    """
+    
+    async def update_context_batch(self, responses: List[Any]) -> None:
+        """
+        Asynchronously update the context based on a batch of response data.
+        
+        Args:
+            responses: The response data of each update, oldest first.
+        
+        Raises:
+            Exception: If the update fails.
+        """
+        ...
+
+
+@runtime_checkable
+class LifecycleMCP(Protocol):
+    """
+    Protocol for MCPs that hold resources across queries.
+    
+    This is an optional extension of the MCP protocol. MCPs may implement
+    any of its methods; the orchestrator calls those implemented when it
+    starts and closes, and when MCPs are added or removed at runtime.
+    """
+    
+    async def start(self) -> None:
+        """
+        Asynchronously open the resources of the MCP, such as connections.
+        
+        The orchestrator calls it once, before taking traffic, when it is
+        started or entered as an async context manager.
+        
+        Raises:
+            Exception: If the MCP cannot be started.
+        """
+        ...
+    
+    async def warmup(self) -> None:
+        """
+        Asynchronously prepare the MCP for its first queries.
+        
+        It is called after every MCP has been started, and lets the MCP pay
+        connection and cache fill costs before taking traffic.
+        
+        Raises:
+            Exception: If the MCP cannot be warmed up.
+        """
+        ...
+    
+    async def aclose(self) -> None:
+        """
+        Asynchronously release the resources of the MCP.
+        
+        The orchestrator calls it once its requests in flight are drained.
+        It is also called when starting the orchestrator fails, so it should
+        tolerate an MCP that was not fully started.
+        
+        Raises:
+            Exception: If the MCP cannot be closed cleanly.
+        """
+        ...
+
+
+@runtime_checkable
+class HealthCheckMCP(Protocol):
+    """
+    Protocol for MCPs that can report whether they are healthy.
+    
+    This is an optional extension of the MCP protocol. Replica pools check
+    the health of such replicas to eject unhealthy ones and to readmit them
+    once recovered.
+    """
+    
+    async def health_check(self) -> bool:
+        """
+        Asynchronously check whether the MCP can serve queries.
+        
+        Returns:
+            True if the MCP is healthy. Raising an exception counts as
+            unhealthy.
+        """
+        ...
+
+
+@runtime_checkable
+class QueryRouter(Protocol):
+    """
+    Protocol defining the interface for routing queries to MCPs.
+    
+    A router maps the query given to the orchestrator to the sub-query
+    expected by each MCP, and can skip MCPs that are irrelevant for a query
+    by returning mcp_orchestrator.routing.SKIP.
+    """
+    
+    def route(self, query_data: Any, index: int, mcp: MCP) -> Any:
+        """
+        Compute the sub-query for a single MCP.
+        
+        Args:
+            query_data: The query given to the orchestrator.
+            index: The index of the MCP in the orchestrator.
+            mcp: The MCP instance.
+        
+        Returns:
+            The sub-query to pass to the MCP, or SKIP to not call it.
+        
+        Raises:
+            Exception: If the query cannot be routed.
+        """
+        ...
+
+
+@runtime_checkable
+class LoadBalancer(Protocol):
+    """
+    Protocol defining the interface for balancing calls over replicas.
+    
+    A balancer chooses which replica of a pool receives each call, from the
+    replicas that are not ejected and their load and latency statistics.
+    """
+    
+    def choose(self, replicas: Sequence[Any]) -> Any:
+        """
+        Choose the replica receiving a call.
+        
+        Args:
+            replicas: The replicas that may receive the call, never empty.
+        
+        Returns:
+            One of the replicas.
+        """
+        ...
+
+
+@runtime_checkable
+class CompletionPolicy(Protocol):
+    """
+    Protocol defining the interface for context gathering completion policies.
+    
+    A completion policy decides when enough MCPs have answered for context
+    gathering to stop. The MCPs still running are then cancelled and the
+    contexts gathered so far are combined.
+    """
+    
+    def evaluate(
+        self,
+        succeeded: AbstractSet[int],
+        failed: AbstractSet[int],
+        indices: Sequence[int],
+    ) -> Optional[float]:
+        """
+        Decide whether context gathering can stop.
+        
+        This is called each time MCPs complete.
+        
+        Args:
+            succeeded: The indices of the MCPs that answered successfully.
+            failed: The indices of the MCPs that failed.
+            indices: The indices of all MCPs called.
+        
+        Returns:
+            None to keep waiting for the remaining MCPs, 0 to stop now, or
+            a grace period in seconds to keep waiting for at most.
+        """
+        ...
+
+
 @runtime_checkable
 class ContextCombinationStrategy(Protocol):
     """
@@ -75,3 +283,59 @@ class ContextCombinationStrategy(Protocol):
             Exception: If context combination fails.
         """
         ...
+
+
+@runtime_checkable
+class ContextAccumulator(Protocol):
+    """
+    Protocol defining the interface for incremental context combination.
+    
+    An accumulator receives contexts one at a time, in any order, as the
+    MCPs that produce them complete. The result of finish must be the same
+    as combining all added contexts ordered by their index.
+    """
+    
+    def add(self, index: int, context: Any) -> None:
+        """
+        Add the context of a single MCP to the combination.
+        
+        Args:
+            index: The index of the MCP that produced the context.
+            context: The context data from the MCP.
+        
+        Raises:
+            Exception: If the context cannot be combined.
+        """
+        ...
+    
+    def finish(self) -> Any:
+        """
+        Complete the combination of all added contexts.
+        
+        Returns:
+            The combined context data.
+        
+        Raises:
+            Exception: If context combination fails.
+        """
+        ...
+
+
+@runtime_checkable
+class IncrementalCombinationStrategy(ContextCombinationStrategy, Protocol):
+    """
+    Protocol for strategies that can combine contexts incrementally.
+    
+    The orchestrator feeds the accumulator as each MCP completes, overlapping
+    combination work with outstanding I/O. Strategies that do not implement
+    this protocol are combined with combine once all MCPs have completed.
+    """
+    
+    def create_accumulator(self) -> ContextAccumulator:
+        """
+        Create a new, empty accumulator for a single combination.
+        
+        Returns:
+            The accumulator to feed contexts into.
+        """
+        ...
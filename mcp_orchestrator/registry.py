@@ -0,0 +1,237 @@
+"""
+MCP registry for the MCP Orchestrator framework.
+
+This module contains the registry of the MCPs orchestrated at a given time.
+Each MCP keeps the index and name it was registered with for its whole
+lifetime, and indexes are not reused by MCPs added later, so that per-MCP
+policies, metrics and results keep referring to the same MCP while others
+come and go.
+
+The registry is copy-on-write: every change publishes a new snapshot, and
+each request reads the snapshot that was current when it started, so that
+requests never see an MCP appear or disappear midway. A removed MCP is
+drained once no request still reads a snapshot containing it.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+
+class McpSnapshot:
+    """
+    An immutable view of the registered MCPs.
+    
+    The snapshot counts the requests reading it, so that the registry can
+    tell when an MCP removed since is no longer used.
+    """
+    
+    __slots__ = ("mcps", "names", "users", "retired", "_idle")
+    
+    def __init__(self, mcps: Dict[int, Any], names: Dict[int, str]):
+        """
+        Initialize the McpSnapshot.
+        
+        Args:
+            mcps: A mapping of MCP index to MCP, in index order.
+            names: A mapping of MCP index to MCP name.
+        """
+        self.mcps = mcps
+        self.names = names
+        self.users = 0
+        self.retired = False
+        self._idle: Optional[asyncio.Event] = None
+    
+    def __contains__(self, index: int) -> bool:
+        return index in self.mcps
+    
+    def __len__(self) -> int:
+        return len(self.mcps)
+    
+    async def wait_idle(self) -> None:
+        """Wait until no request reads the snapshot any more."""
+        if self.users:
+            if self._idle is None:
+                self._idle = asyncio.Event()
+            await self._idle.wait()
+
+
+class McpRegistry:
+    """
+    A copy-on-write registry of MCPs with stable indexes and names.
+    
+    MCPs are named after their index unless a name is given. Names must be
+    unique among the registered MCPs; a name may be reused once its MCP is
+    removed, but its index is not.
+    """
+    
+    def __init__(
+        self,
+        mcps: Sequence[Any] = (),
+        names: Optional[Mapping[int, str]] = None,
+    ):
+        """
+        Initialize the McpRegistry.
+        
+        Args:
+            mcps: The initial MCPs, registered with indexes 0 to n - 1.
+            names: Optional mapping of initial MCP index to name.
+        
+        Raises:
+            ValueError: If two MCPs have the same name.
+        """
+        names = dict(names or {})
+        self._next_index = 0
+        self._snapshot = McpSnapshot({}, {})
+        self._retired: List[McpSnapshot] = []
+        for mcp in mcps:
+            self.add(mcp, names.get(self._next_index))
+    
+    @property
+    def snapshot(self) -> McpSnapshot:
+        """The current snapshot of the registered MCPs."""
+        return self._snapshot
+    
+    def acquire(self) -> McpSnapshot:
+        """
+        Get the current snapshot for a request, until it is released.
+        
+        Returns:
+            The current snapshot.
+        """
+        snapshot = self._snapshot
+        snapshot.users += 1
+        return snapshot
+    
+    def release(self, snapshot: McpSnapshot) -> None:
+        """
+        Release a snapshot acquired for a request.
+        
+        Args:
+            snapshot: The snapshot returned by acquire.
+        """
+        snapshot.users -= 1
+        if not snapshot.users and snapshot.retired:
+            self._retired.remove(snapshot)
+            if snapshot._idle is not None:
+                snapshot._idle.set()
+    
+    def resolve(self, key: Union[int, str]) -> int:
+        """
+        Get the index of a registered MCP.
+        
+        Args:
+            key: The index or name of the MCP.
+        
+        Returns:
+            The index of the MCP.
+        
+        Raises:
+            KeyError: If no such MCP is registered.
+        """
+        snapshot = self._snapshot
+        if isinstance(key, str):
+            for index, name in snapshot.names.items():
+                if name == key:
+                    return index
+        elif key in snapshot.mcps:
+            return key
+        raise KeyError(f"No MCP {key!r} is registered")
+    
+    def reserve(self) -> int:
+        """
+        Reserve the index of an MCP that will be registered later.
+        
+        Returns:
+            A new index.
+        """
+        index = self._next_index
+        self._next_index += 1
+        return index
+    
+    def add(self, mcp: Any, name: Optional[str] = None, index: Optional[int] = None) -> int:
+        """
+        Register an MCP.
+        
+        Args:
+            mcp: The MCP instance.
+            name: Optional name of the MCP. Defaults to "mcp-<index>".
+            index: Optional index reserved for the MCP. Defaults to a new
+                   index.
+        
+        Returns:
+            The index of the MCP.
+        
+        Raises:
+            ValueError: If another registered MCP has the same name.
+        """
+        if index is None:
+            index = self.reserve()
+        name = name if name is not None else f"mcp-{index}"
+        if name in self._snapshot.names.values():
+            raise ValueError(f"An MCP named {name!r} is already registered")
+        
+        mcps = dict(self._snapshot.mcps)
+        names = dict(self._snapshot.names)
+        mcps[index] = mcp
+        names[index] = name
+        if index < max(self._snapshot.mcps, default=-1):
+            # An index reserved earlier may be registered after later ones
+            mcps = dict(sorted(mcps.items()))
+        self._publish(McpSnapshot(mcps, names))
+        return index
+    
+    def remove(self, key: Union[int, str]) -> int:
+        """
+        Unregister an MCP; requests already started may still call it.
+        
+        Args:
+            key: The index or name of the MCP.
+        
+        Returns:
+            The index of the MCP.
+        
+        Raises:
+            KeyError: If no such MCP is registered.
+        """
+        index = self.resolve(key)
+        mcps = dict(self._snapshot.mcps)
+        names = dict(self._snapshot.names)
+        del mcps[index]
+        del names[index]
+        self._publish(McpSnapshot(mcps, names))
+        return index
+    
+    def replace(self, mcps: Sequence[Any]) -> None:
+        """
+        Unregister every MCP and register others in their place.
+        
+        The new MCPs are registered with indexes 0 to n - 1 and default
+        names, as if the registry had been created with them, so indexes may
+        be reused: this is meant for MCPs that have not taken traffic yet.
+        Requests already started keep calling the previous MCPs.
+        
+        Args:
+            mcps: The new MCPs.
+        """
+        self._next_index = max(self._next_index, len(mcps))
+        self._publish(McpSnapshot(
+            dict(enumerate(mcps)), {index: f"mcp-{index}" for index in range(len(mcps))}
+        ))
+    
+    async def drain(self, index: int) -> None:
+        """
+        Wait until no request reads a snapshot containing an MCP.
+        
+        Args:
+            index: The index of a removed MCP.
+        """
+        users = [snapshot for snapshot in self._retired if index in snapshot]
+        await asyncio.gather(*(snapshot.wait_idle() for snapshot in users))
+    
+    def _publish(self, snapshot: McpSnapshot) -> None:
+        """Make a snapshot current, retiring the previous one."""
+        previous = self._snapshot
+        self._snapshot = snapshot
+        if previous.users:
+            previous.retired = True
+            self._retired.append(previous)
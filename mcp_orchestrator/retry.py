@@ -0,0 +1,223 @@
+"""
+Retry policies for the MCP Orchestrator framework.
+
+This module contains a retry policy with exponential backoff and jitter,
+and a retry budget that caps retries to a fraction of the traffic so that
+retries cannot turn an outage into a retry storm.
+"""
+
+import asyncio
+import random
+import time
+from typing import Callable, List, Optional, Tuple, Type, Union
+
+from mcp_orchestrator.exceptions import McpCircuitOpenError, McpQueueFullError
+
+
+class _RollingCounter:
+    """A counter of events over a sliding time window, in fixed buckets."""
+    
+    def __init__(self, window: float, buckets: int = 10):
+        self._bucket_width = window / buckets
+        self._counts: List[int] = [0] * buckets
+        self._current = 0
+    
+    def _advance(self) -> int:
+        """Clear the buckets that left the window and return the current slot."""
+        now = int(time.monotonic() / self._bucket_width)
+        size = len(self._counts)
+        if now - self._current >= size:
+            self._counts = [0] * size
+        else:
+            for bucket in range(self._current + 1, now + 1):
+                self._counts[bucket % size] = 0
+        self._current = max(self._current, now)
+        return self._current % size
+    
+    def add(self) -> None:
+        """Count one event."""
+        self._counts[self._advance()] += 1
+    
+    def total(self) -> int:
+        """Count the events in the window."""
+        self._advance()
+        return sum(self._counts)
+
+
+class RetryBudget:
+    """
+    A budget limiting retries to a fraction of the calls.
+    
+    Over a sliding window, retries are allowed while they stay below a
+    fixed allowance plus a ratio of the calls made in the same window.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+    ):
+        """
+        Initialize the RetryBudget.
+        
+        Args:
+            ratio: The fraction of calls that may be retried.
+            min_retries_per_second: Retries always allowed regardless of the
+                                    ratio, so that low traffic can retry.
+            window: The length of the sliding window in seconds.
+        
+        Raises:
+            ValueError: If a parameter is negative or the window is not positive.
+        """
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError("ratio and min_retries_per_second must not be negative")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self.exhausted = 0
+        self._calls = _RollingCounter(window)
+        self._retries = _RollingCounter(window)
+    
+    def record_call(self) -> None:
+        """Record a first attempt, adding to the budget."""
+        self._calls.add()
+    
+    def try_acquire(self) -> bool:
+        """
+        Withdraw a retry from the budget.
+        
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted.
+        """
+        allowed = self.min_retries_per_second * self.window
+        allowed += self.ratio * self._calls.total()
+        if self._retries.total() >= allowed:
+            self.exhausted += 1
+            return False
+        
+        self._retries.add()
+        return True
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Retry connection errors and timeouts, but not local rejections."""
+    if isinstance(error, (McpCircuitOpenError, McpQueueFullError)):
+        return False
+    return isinstance(error, (ConnectionError, asyncio.TimeoutError))
+
+
+class RetryPolicy:
+    """
+    A policy deciding whether and when to retry a failed MCP call.
+    
+    Retries wait with exponential backoff and, by default, full jitter.
+    A retry is never scheduled past the overall deadline of the call.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_on: Union[
+            Tuple[Type[Exception], ...], Callable[[Exception], bool]
+        ] = _is_retryable,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Initialize the RetryPolicy.
+        
+        Args:
+            max_attempts: The maximum number of attempts, including the first.
+            initial_backoff: The backoff before the first retry in seconds.
+            max_backoff: The maximum backoff in seconds.
+            multiplier: The factor applied to the backoff after each retry.
+            jitter: Whether to pick each backoff uniformly between zero and
+                    its exponential value.
+            retry_on: The exception types to retry, or a predicate deciding
+                      whether an error is retryable.
+            budget: Optional retry budget, which may be shared by policies.
+        
+        Raises:
+            ValueError: If max_attempts is not positive or a backoff is negative.
+        """
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        if initial_backoff < 0 or max_backoff < 0:
+            raise ValueError("Backoffs must not be negative")
+        
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = retry_on
+        self.budget = budget
+        self.retries = 0
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether an error may be retried.
+        
+        Args:
+            error: The error raised by the call.
+        
+        Returns:
+            True if the error is retryable.
+        """
+        if isinstance(self.retry_on, tuple):
+            return isinstance(error, self.retry_on)
+        return self.retry_on(error)
+    
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Compute the backoff before the next attempt.
+        
+        Args:
+            attempt: The number of the attempt that failed, starting at 1.
+        
+        Returns:
+            The backoff in seconds.
+        """
+        backoff = min(
+            self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1)
+        )
+        return random.uniform(0, backoff) if self.jitter else backoff
+    
+    def record_call(self) -> None:
+        """Record a first attempt in the retry budget, if any."""
+        if self.budget is not None:
+            self.budget.record_call()
+    
+    def next_delay(
+        self, attempt: int, error: Exception, remaining: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+        
+        Args:
+            attempt: The number of the attempt that failed, starting at 1.
+            error: The error raised by the attempt.
+            remaining: Optional time in seconds left until the deadline.
+        
+        Returns:
+            The delay in seconds before retrying, or None to give up.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        
+        delay = self.get_backoff(attempt)
+        if remaining is not None and delay >= remaining:
+            return None
+        
+        if self.budget is not None and not self.budget.try_acquire():
+            return None
+        
+        self.retries += 1
+        return delay
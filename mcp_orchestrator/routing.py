@@ -0,0 +1,105 @@
+"""
+Query routing for the MCP Orchestrator framework.
+
+This module contains routers that map a single query to a sub-query for
+each MCP, so that MCPs expecting different query shapes can be orchestrated
+together and MCPs that are irrelevant for a query are not called at all.
+"""
+
+from typing import Any, Callable, Hashable, Mapping
+
+from mcp_orchestrator.protocols import MCP
+
+
+class _Skip:
+    """Sentinel type returned by routers to skip an MCP."""
+    
+    def __repr__(self) -> str:
+        return "SKIP"
+
+
+# Returned by a router instead of a sub-query to skip an MCP
+SKIP: Any = _Skip()
+
+
+class FunctionRouter:
+    """
+    A router that projects the query with a function per MCP.
+    
+    Each function receives the original query and returns the sub-query
+    for its MCP, or SKIP if the MCP should not be called.
+    """
+    
+    def __init__(
+        self,
+        routes: Mapping[int, Callable[[Any], Any]],
+        broadcast_unrouted: bool = False,
+    ):
+        """
+        Initialize the FunctionRouter.
+        
+        Args:
+            routes: A mapping of MCP index to its projection function.
+            broadcast_unrouted: Whether MCPs without a route receive the
+                                original query. If False, they are skipped.
+        """
+        self.routes = routes
+        self.broadcast_unrouted = broadcast_unrouted
+    
+    def route(self, query_data: Any, index: int, mcp: MCP) -> Any:
+        """
+        Compute the sub-query for an MCP.
+        
+        Args:
+            query_data: The original query.
+            index: The index of the MCP in the orchestrator.
+            mcp: The MCP instance.
+        
+        Returns:
+            The sub-query to pass to the MCP, or SKIP.
+        """
+        route = self.routes.get(index)
+        if route is None:
+            return query_data if self.broadcast_unrouted else SKIP
+        return route(query_data)
+
+
+class KeyRouter:
+    """
+    A router for dictionary queries holding one sub-query per MCP.
+    
+    Each MCP is assigned a key; it receives the value of that key in the
+    query and is skipped when the key is absent.
+    """
+    
+    def __init__(self, keys: Mapping[int, Hashable]):
+        """
+        Initialize the KeyRouter.
+        
+        Args:
+            keys: A mapping of MCP index to the query key holding its sub-query.
+        """
+        self.keys = keys
+    
+    def route(self, query_data: Any, index: int, mcp: MCP) -> Any:
+        """
+        Compute the sub-query for an MCP.
+        
+        Args:
+            query_data: The original query. Must be a dictionary.
+            index: The index of the MCP in the orchestrator.
+            mcp: The MCP instance.
+        
+        Returns:
+            The sub-query to pass to the MCP, or SKIP.
+        
+        Raises:
+            ValueError: If the query is not a dictionary.
+        """
+        if not isinstance(query_data, dict):
+            raise ValueError(f"Query data must be a dictionary: {type(query_data)}")
+        
+        key = self.keys.get(index)
+        if key is None or key not in query_data:
+            return SKIP
+        return query_data[key]
@@ -0,0 +1,83 @@
+"""
+Request coalescing for the MCP Orchestrator framework.
+
+This module contains a single-flight group that lets concurrent callers
+asking for the same key share one in-flight call instead of each issuing
+their own.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """An in-flight call shared by one or more waiters."""
+    
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    A group of in-flight calls, deduplicated by key.
+    
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same result. A caller that is cancelled stops waiting
+    without cancelling the shared call, which is only cancelled once every
+    caller has stopped waiting for it.
+    """
+    
+    def __init__(self):
+        """Initialize the SingleFlight group."""
+        self.calls = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+    
+    @property
+    def in_flight(self) -> int:
+        """The number of distinct calls currently in flight."""
+        return len(self._calls)
+    
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or join the identical call already in flight.
+        
+        Args:
+            key: The key identifying identical calls.
+            function: A function starting the call, used if none is in flight.
+        
+        Returns:
+            The result of the shared call.
+        
+        Raises:
+            Exception: If the shared call fails.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(function()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller stopped waiting, so nobody needs the result
+                call.task.cancel()
+    
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        """
+        Remove a completed call from the group.
+        
+        Args:
+            key: The key of the call.
+            call: The completed call.
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -3,7 +3,7 @@ Dictionary-based context combination strategies for the MCP Orchestrator framewo
 """
 
 from enum import Enum
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 
 class MergePolicy(Enum):
@@ -15,6 +15,113 @@ class MergePolicy(Enum):
     ERROR = "error"  # Raise an error on collision
 
 
+class DictionaryMergeAccumulator:
+    """
+    An accumulator that merges dictionary-based contexts incrementally.
+    
+    Contexts may be added in any order. Collisions are resolved using the
+    index of the contexts, so the result is the same as merging all contexts
+    in index order.
+    """
+    
+    def __init__(self, merge_policy: MergePolicy = MergePolicy.OVERWRITE):
+        """
+        Initialize the DictionaryMergeAccumulator.
+        
+        Args:
+            merge_policy: The policy to follow when handling key collisions.
+        """
+        self.merge_policy = merge_policy
+        self._count = 0
+        # Value of each key and the index of the context it came from
+        self._values: Dict[str, Tuple[int, Any]] = {}
+        # All values of each key, used by the COMBINE_LISTS policy
+        self._all_values: Dict[str, List[Tuple[int, Any]]] = {}
+        # Position of each key in the merged result
+        self._order: Dict[str, Tuple[int, int]] = {}
+    
+    def add(self, index: int, context: Any) -> None:
+        """
+        Merge a context into the result.
+        
+        Args:
+            index: The index of the MCP that produced the context.
+            context: The context data from the MCP. Must be a dictionary.
+        
+        Raises:
+            ValueError: If the context is not a dictionary.
+            KeyError: If a key collision occurs and the merge policy is ERROR.
+        """
+        if not isinstance(context, dict):
+            raise ValueError(
+                f"Context at index {index} is not a dictionary: {type(context)}"
+            )
+        
+        self._count += 1
+        for position, (key, value) in enumerate(context.items()):
+            order = (index, position)
+            if key not in self._order or order < self._order[key]:
+                self._order[key] = order
+            
+            if self.merge_policy == MergePolicy.COMBINE_LISTS:
+                self._all_values.setdefault(key, []).append((index, value))
+                continue
+            
+            if key not in self._values:
+                # Key doesn't exist yet, simply add it
+                self._values[key] = (index, value)
+                continue
+            
+            # Key already exists, handle according to policy
+            owner = self._values[key][0]
+            if self.merge_policy == MergePolicy.OVERWRITE:
+                if index > owner:
+                    self._values[key] = (index, value)
+            elif self.merge_policy == MergePolicy.KEEP_FIRST:
+                if index < owner:
+                    self._values[key] = (index, value)
+            elif self.merge_policy == MergePolicy.ERROR:
+                raise KeyError(
+                    f"Key collision: '{key}' already exists in the result"
+                )
+    
+    def finish(self) -> Dict[str, Any]:
+        """
+        Build the merged dictionary.
+        
+        Returns:
+            The merged dictionary.
+        
+        Raises:
+            ValueError: If no contexts were added.
+        """
+        if not self._count:
+            raise ValueError("No contexts provided for combination")
+        
+        result: Dict[str, Any] = {}
+        for key in sorted(self._order, key=self._order.__getitem__):
+            if self.merge_policy != MergePolicy.COMBINE_LISTS:
+                result[key] = self._values[key][1]
+                continue
+            
+            values = sorted(self._all_values[key], key=lambda item: item[0])
+            if len(values) == 1:
+                result[key] = values[0][1]
+                continue
+            
+            # Convert to list if not already and append
+            first = values[0][1]
+            combined = list(first) if isinstance(first, list) else [first]
+            for _, value in values[1:]:
+                if isinstance(value, list):
+                    combined.extend(value)
+                else:
+                    combined.append(value)
+            result[key] = combined
+        
+        return result
+
+
 class DictionaryMergeStrategy:
     """
     A strategy that merges dictionary-based contexts.
@@ -57,34 +164,18 @@ class DictionaryMergeStrategy:
                     f"Context at index {i} is not a dictionary: {type(context)}"
                 )
         
-        # Start with an empty result dictionary
-        result: Dict[str, Any] = {}
-        
         # Merge dictionaries according to the policy
-        for context in contexts:
-            for key, value in context.items():
-                if key not in result:
-                    # Key doesn't exist yet, simply add it
-                    result[key] = value
-                else:
-                    # Key already exists, handle according to policy
-                    if self.merge_policy == MergePolicy.OVERWRITE:
-                        result[key] = value
-                    elif self.merge_policy == MergePolicy.KEEP_FIRST:
-                        # Do nothing, keep the existing value
-                        pass
-                    elif self.merge_policy == MergePolicy.COMBINE_LISTS:
-                        # Convert to list if not already and append
-                        if not isinstance(result[key], list):
-                            result[key] = [result[key]]
-                        
-                        if isinstance(value, list):
-                            result[key].extend(value)
-                        else:
-                            result[key].append(value)
-                    elif self.merge_policy == MergePolicy.ERROR:
-                        raise KeyError(
-                            f"Key collision: '{key}' already exists in the result"
-                        )
+        accumulator = self.create_accumulator()
+        for i, context in enumerate(contexts):
+            accumulator.add(i, context)
         
-        return result
+        return accumulator.finish()
+    
+    def create_accumulator(self) -> DictionaryMergeAccumulator:
+        """
+        Create an accumulator that merges contexts incrementally.
+        
+        Returns:
+            A new DictionaryMergeAccumulator using this strategy's merge policy.
+        """
+        return DictionaryMergeAccumulator(self.merge_policy)
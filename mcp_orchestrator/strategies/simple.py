@@ -2,7 +2,51 @@
 Simple context combination strategies for the MCP Orchestrator framework.
 """
 
-from typing import Any, List
+from typing import Any, Dict, List
+
+
+class ConcatenationAccumulator:
+    """
+    An accumulator that concatenates text-based contexts incrementally.
+    
+    Contexts are converted to strings as they arrive and joined in index
+    order when the combination is finished.
+    """
+    
+    def __init__(self, separator: str = "\n\n"):
+        """
+        Initialize the ConcatenationAccumulator.
+        
+        Args:
+            separator: The separator to use between contexts.
+        """
+        self.separator = separator
+        self._parts: Dict[int, str] = {}
+    
+    def add(self, index: int, context: Any) -> None:
+        """
+        Add a context to the concatenation.
+        
+        Args:
+            index: The index of the MCP that produced the context.
+            context: The context data from the MCP.
+        """
+        self._parts[index] = str(context)
+    
+    def finish(self) -> str:
+        """
+        Concatenate all added contexts in index order.
+        
+        Returns:
+            The concatenated context as a string.
+        
+        Raises:
+            ValueError: If no contexts were added.
+        """
+        if not self._parts:
+            raise ValueError("No contexts provided for combination")
+        
+        return self.separator.join(self._parts[i] for i in sorted(self._parts))
 
 
 class SimpleConcatenationStrategy:
@@ -40,3 +84,12 @@ class SimpleConcatenationStrategy:
         
         # Convert all contexts to strings and join with the separator
         return self.separator.join(str(context) for context in contexts)
+    
+    def create_accumulator(self) -> ConcatenationAccumulator:
+        """
+        Create an accumulator that concatenates contexts incrementally.
+        
+        Returns:
+            A new ConcatenationAccumulator using this strategy's separator.
+        """
+        return ConcatenationAccumulator(self.separator)
@@ -0,0 +1,134 @@
+"""
+Adaptive timeouts for the MCP Orchestrator framework.
+
+This module contains a timeout policy deriving the timeout of an MCP from
+its observed latencies, so that the timeout follows the MCP's actual speed
+instead of a hard-coded guess that is either too tight or far too loose.
+"""
+
+from typing import Any, Dict, Optional
+
+from mcp_orchestrator.latency import LatencyHistogram
+
+
+class AdaptiveTimeout:
+    """
+    A policy deriving the timeout of an MCP from its observed latencies.
+    
+    The timeout is a multiple of a percentile of the MCP's recent latencies,
+    clamped between a floor and a ceiling. Until enough latencies have been
+    observed, the initial timeout is used.
+    
+    Calls that time out are recorded with their timeout as latency, so that
+    a timeout which turns out to be too tight grows back.
+    """
+    
+    def __init__(
+        self,
+        percentile: float = 0.99,
+        multiplier: float = 2.0,
+        min_timeout: float = 0.05,
+        max_timeout: float = 30.0,
+        initial_timeout: Optional[float] = None,
+        min_samples: int = 20,
+        latency: Optional[LatencyHistogram] = None,
+        refresh_interval: int = 32,
+    ):
+        """
+        Initialize the AdaptiveTimeout.
+        
+        Args:
+            percentile: The latency percentile the timeout is based on,
+                        between 0 and 1.
+            multiplier: The factor applied to the percentile.
+            min_timeout: The smallest timeout in seconds.
+            max_timeout: The largest timeout in seconds.
+            initial_timeout: Optional timeout in seconds used until enough
+                             latencies have been observed. Defaults to
+                             max_timeout.
+            min_samples: The number of latency samples needed before the
+                         timeout is derived from them.
+            latency: Optional histogram of observed latencies. Defaults to a
+                     histogram over a sliding window of one minute.
+            refresh_interval: The number of samples between recomputations
+                              of the timeout.
+        
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 < min_timeout <= max_timeout:
+            raise ValueError("min_timeout must be positive and at most max_timeout")
+        if initial_timeout is not None and initial_timeout <= 0:
+            raise ValueError("initial_timeout must be positive")
+        
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.initial_timeout = initial_timeout
+        self.min_samples = min_samples
+        self.latency = latency if latency is not None else LatencyHistogram(window=60.0)
+        self.refresh_interval = max(refresh_interval, 1)
+        self.timeouts = 0
+        self._observed_timeout: Optional[float] = None
+        self._samples_since_refresh = 0
+    
+    def get_timeout(self) -> float:
+        """
+        Get the timeout of the next call.
+        
+        Returns:
+            The timeout in seconds.
+        """
+        if self._observed_timeout is None or self._samples_since_refresh >= self.refresh_interval:
+            if self.latency.count >= self.min_samples:
+                observed = self.latency.percentile(self.percentile) * self.multiplier
+                self._observed_timeout = min(
+                    max(observed, self.min_timeout), self.max_timeout
+                )
+            self._samples_since_refresh = 0
+        
+        if self._observed_timeout is not None:
+            return self._observed_timeout
+        if self.initial_timeout is not None:
+            return self.initial_timeout
+        return self.max_timeout
+    
+    def record_latency(self, latency: float) -> None:
+        """
+        Record the latency of a successful call.
+        
+        Args:
+            latency: The latency in seconds.
+        """
+        self.latency.record(latency)
+        self._samples_since_refresh += 1
+    
+    def record_timeout(self, timeout: float) -> None:
+        """
+        Record a call that timed out.
+        
+        Args:
+            timeout: The timeout in seconds that was exceeded.
+        """
+        self.timeouts += 1
+        self.latency.record(timeout)
+        self._samples_since_refresh += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current timeout and the observed latencies.
+        
+        Returns:
+            A dictionary with the timeout, the number of timed out calls and
+            a snapshot of the latency histogram.
+        """
+        return {
+            "timeout": self.get_timeout(),
+            "timeouts": self.timeouts,
+            "latency": self.latency.snapshot(),
+        }
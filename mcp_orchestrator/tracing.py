@@ -0,0 +1,366 @@
+"""
+Tracing for the MCP Orchestrator framework.
+
+This module contains the spans recorded for each gather, MCP call and
+combine step, and tracers receiving them: a no-op base tracer whose start
+and end hooks can be overridden, an in-memory tracer for tests and an
+adapter to OpenTelemetry, which is only needed when the adapter is used.
+
+The span of the current operation is kept in a context variable, so that
+the MCP calls started within a gather become children of its span.
+"""
+
+import contextlib
+import contextvars
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    """
+    A timed operation within a trace.
+    
+    Spans of the same trace share a trace ID, and each span but the root
+    one refers to the span it was started in through its parent ID.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        trace_id: int,
+        span_id: int,
+        parent_id: Optional[int] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the Span.
+        
+        Args:
+            name: The name of the operation.
+            trace_id: The ID of the trace the span belongs to.
+            span_id: The ID of the span.
+            parent_id: Optional ID of the parent span.
+            attributes: Optional attributes describing the operation.
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self.handle: Any = None
+    
+    @property
+    def duration(self) -> Optional[float]:
+        """The duration of the span in seconds, or None if it has not ended."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+        
+        Args:
+            key: The name of the attribute.
+            value: The value of the attribute.
+        """
+        self.attributes[key] = value
+    
+    def __repr__(self) -> str:
+        return (
+            f"Span({self.name!r}, span_id={self.span_id}, "
+            f"parent_id={self.parent_id})"
+        )
+
+
+class SpanScope:
+    """
+    A context manager running a block of code within a span.
+    
+    The span is started and made current when the block is entered, and
+    ended with the block's error, if any, when it is left.
+    """
+    
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        activate: bool = True,
+    ):
+        """
+        Initialize the SpanScope.
+        
+        Args:
+            tracer: The tracer recording the span.
+            name: The name of the operation.
+            attributes: Optional attributes describing the operation.
+            activate: Whether the span becomes the current span within the
+                      block. Async generators, which may be resumed from
+                      other contexts, should not activate their span.
+        """
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.activate = activate
+        self.span: Optional[Span] = None
+        self._token: Optional[contextvars.Token] = None
+    
+    def __enter__(self) -> Span:
+        self.span = self.tracer.start_span(self.name, self.attributes)
+        if self.activate:
+            self._token = current_span.set(self.span)
+        return self.span
+    
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        if self._token is not None:
+            current_span.reset(self._token)
+            self._token = None
+        self.tracer.end_span(self.span, exc)
+
+
+class Tracer:
+    """
+    A tracer that records nothing.
+    
+    Subclasses receive every span through the on_start and on_end hooks.
+    Spans are started as children of the current span, and ended with an
+    outcome attribute of "ok", "error" or "cancelled".
+    """
+    
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[Span] = None,
+    ) -> Span:
+        """
+        Start a span.
+        
+        Args:
+            name: The name of the operation.
+            attributes: Optional attributes describing the operation.
+            parent: Optional parent span. Defaults to the current span.
+        
+        Returns:
+            The started span.
+        """
+        if parent is None:
+            parent = current_span.get()
+        span = Span(
+            name,
+            trace_id=random.getrandbits(128) if parent is None else parent.trace_id,
+            span_id=random.getrandbits(64),
+            parent_id=None if parent is None else parent.span_id,
+            attributes=attributes,
+        )
+        self.on_start(span, parent)
+        return span
+    
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """
+        End a span.
+        
+        Args:
+            span: The span to end.
+            error: Optional error that ended the operation.
+        """
+        span.end_time = time.time()
+        span.error = error
+        if error is None:
+            span.attributes["outcome"] = "ok"
+        elif isinstance(error, Exception):
+            span.attributes["outcome"] = "error"
+            span.attributes["error.type"] = type(error).__name__
+        else:
+            span.attributes["outcome"] = "cancelled"
+        self.on_end(span)
+    
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        activate: bool = True,
+    ) -> SpanScope:
+        """
+        Run a block of code within a span.
+        
+        Args:
+            name: The name of the operation.
+            attributes: Optional attributes describing the operation.
+            activate: Whether the span becomes the current span within the
+                      block.
+        
+        Returns:
+            A context manager yielding the span.
+        """
+        return SpanScope(self, name, attributes, activate)
+    
+    def on_start(self, span: Span, parent: Optional[Span]) -> None:
+        """
+        Handle a span that started.
+        
+        Args:
+            span: The span that started.
+            parent: The parent span, if any.
+        """
+    
+    def on_end(self, span: Span) -> None:
+        """
+        Handle a span that ended.
+        
+        Args:
+            span: The span that ended.
+        """
+
+
+class InMemoryTracer(Tracer):
+    """A tracer keeping the spans that ended in memory, for tests."""
+    
+    def __init__(self):
+        """Initialize the InMemoryTracer."""
+        self.spans: List[Span] = []
+    
+    def on_end(self, span: Span) -> None:
+        """
+        Keep a span that ended.
+        
+        Args:
+            span: The span that ended.
+        """
+        self.spans.append(span)
+    
+    def get_spans(self, name: Optional[str] = None) -> List[Span]:
+        """
+        Get the spans that ended, in the order they ended.
+        
+        Args:
+            name: Optional name of the spans to get.
+        
+        Returns:
+            The spans, all of them or those with the given name.
+        """
+        if name is None:
+            return list(self.spans)
+        return [span for span in self.spans if span.name == name]
+    
+    def clear(self) -> None:
+        """Forget the spans that ended."""
+        self.spans.clear()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    A tracer forwarding spans to OpenTelemetry.
+    
+    Each span is mirrored by an OpenTelemetry span, started as a child of
+    the mirror of its parent, with the same name and attributes.
+    """
+    
+    def __init__(self, tracer: Any = None):
+        """
+        Initialize the OpenTelemetryTracer.
+        
+        Args:
+            tracer: Optional OpenTelemetry tracer. Defaults to the tracer of
+                    the global tracer provider for this package.
+        
+        Raises:
+            ImportError: If OpenTelemetry is not installed.
+        """
+        if otel_trace is None:
+            raise ImportError(
+                "OpenTelemetryTracer requires the opentelemetry-api package"
+            )
+        self.tracer = tracer if tracer is not None else otel_trace.get_tracer(
+            "mcp_orchestrator"
+        )
+    
+    def on_start(self, span: Span, parent: Optional[Span]) -> None:
+        """
+        Start the OpenTelemetry mirror of a span.
+        
+        Args:
+            span: The span that started.
+            parent: The parent span, if any.
+        """
+        context = None
+        if parent is not None and parent.handle is not None:
+            context = otel_trace.set_span_in_context(parent.handle)
+        span.handle = self.tracer.start_span(
+            span.name,
+            context=context,
+            attributes=_to_otel_attributes(span.attributes),
+        )
+    
+    def on_end(self, span: Span) -> None:
+        """
+        End the OpenTelemetry mirror of a span.
+        
+        Args:
+            span: The span that ended.
+        """
+        handle = span.handle
+        handle.set_attributes(_to_otel_attributes(span.attributes))
+        if isinstance(span.error, Exception):
+            handle.record_exception(span.error)
+            handle.set_status(
+                otel_trace.Status(otel_trace.StatusCode.ERROR, str(span.error))
+            )
+        handle.end()
+
+
+def _to_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert attribute values to types supported by OpenTelemetry."""
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else repr(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+@contextlib.contextmanager
+def use_span(span: Optional[Span]) -> Iterator[Optional[Span]]:
+    """
+    Make a span the current span within a block of code.
+    
+    Args:
+        span: The span to make current.
+    
+    Yields:
+        The span.
+    """
+    token = current_span.set(span)
+    try:
+        yield span
+    finally:
+        current_span.reset(token)
+
+
+def payload_size(payload: Any) -> Optional[int]:
+    """
+    Estimate the size of a payload cheaply, for span attributes.
+    
+    Args:
+        payload: The query, context or response.
+    
+    Returns:
+        The length of strings, bytes and collections, or None for other
+        values.
+    """
+    if isinstance(payload, (str, bytes, list, tuple, dict, set)):
+        return len(payload)
+    return None
@@ -0,0 +1,209 @@
+"""
+Background context updates for the MCP Orchestrator framework.
+
+This module contains a bounded write-behind queue that takes context
+updates off the request path: updates are queued, coalesced by key, and
+delivered to the MCP in batches by a background worker.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from mcp_orchestrator.exceptions import McpOrchestratorError, McpQueueFullError
+
+
+class UpdateQueue:
+    """
+    A bounded queue of context updates delivered in the background.
+    
+    Updates with the same key are coalesced while they wait: by default the
+    latest update replaces the earlier one, or a merge function combines
+    them. When the queue is full, callers wait for room, or are rejected
+    if the queue does not block. Delivery failures are logged and counted,
+    and the failed updates are dropped.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_batch: int = 100,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+        block: bool = True,
+        linger: float = 0.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the UpdateQueue.
+        
+        Args:
+            max_size: The maximum number of waiting updates.
+            max_batch: The maximum number of updates delivered at once.
+            key: Optional function giving the key of an update. Waiting
+                 updates with the same key are coalesced. By default
+                 updates are never coalesced.
+            merge: Optional function combining a waiting update with a
+                   newer one of the same key. By default the newer update
+                   replaces the waiting one.
+            block: Whether callers wait for room when the queue is full,
+                   instead of being rejected.
+            linger: The time in seconds the worker waits after the first
+                    update of a batch, to let more updates join it.
+            logger: Optional logger for delivery errors.
+        
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+        if linger < 0:
+            raise ValueError("linger must not be negative")
+        
+        self.max_size = max_size
+        self.max_batch = max_batch
+        self.key = key
+        self.merge = merge
+        self.block = block
+        self.linger = linger
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self.enqueued = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.failed = 0
+        self.batches = 0
+        self.closed = False
+        self._updates: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sequence = 0
+        self._delivering = 0
+        self._deliver: Optional[Callable[[List[Any]], Awaitable[None]]] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._changed: Optional[asyncio.Condition] = None
+    
+    @property
+    def size(self) -> int:
+        """The number of updates waiting for delivery."""
+        return len(self._updates)
+    
+    def bind(self, deliver: Callable[[List[Any]], Awaitable[None]]) -> None:
+        """
+        Set the function delivering batches of updates to the MCP.
+        
+        Args:
+            deliver: A function delivering a batch of updates, oldest first.
+        """
+        self._deliver = deliver
+    
+    async def put(self, update: Any) -> None:
+        """
+        Queue an update for delivery.
+        
+        Args:
+            update: The response data of the update.
+        
+        Raises:
+            McpQueueFullError: If the queue is full and does not block.
+            McpOrchestratorError: If the queue is closed.
+        """
+        changed = self._get_condition()
+        async with changed:
+            while True:
+                if self.closed:
+                    raise McpOrchestratorError("Update queue is closed")
+                
+                if self.key is not None:
+                    key = self.key(update)
+                    if key in self._updates:
+                        previous = self._updates.pop(key)
+                        if self.merge is not None:
+                            update = self.merge(previous, update)
+                        self._updates[key] = update
+                        self.coalesced += 1
+                        return
+                
+                if len(self._updates) < self.max_size:
+                    break
+                if not self.block:
+                    raise McpQueueFullError(self.max_size)
+                await changed.wait()
+            
+            if self.key is None:
+                key = self._sequence
+                self._sequence += 1
+            self._updates[key] = update
+            self.enqueued += 1
+            changed.notify_all()
+        
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._run())
+    
+    async def flush(self) -> None:
+        """Wait until every queued update has been delivered."""
+        changed = self._get_condition()
+        async with changed:
+            await changed.wait_for(lambda: not self._updates and not self._delivering)
+    
+    async def aclose(self) -> None:
+        """Stop accepting updates, deliver the queued ones and stop the worker."""
+        changed = self._get_condition()
+        async with changed:
+            self.closed = True
+            changed.notify_all()
+        await self.flush()
+        if self._worker is not None:
+            await self._worker
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current size and counters of the queue.
+        
+        Returns:
+            A dictionary with the queue size and update counters.
+        """
+        return {
+            "size": len(self._updates),
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+    
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily, within the running event loop."""
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+    
+    async def _run(self) -> None:
+        """Deliver queued updates in batches until the queue is empty."""
+        changed = self._get_condition()
+        while True:
+            if self.linger and not self.closed:
+                await asyncio.sleep(self.linger)
+            
+            async with changed:
+                if not self._updates:
+                    return
+                batch = []
+                while self._updates and len(batch) < self.max_batch:
+                    batch.append(self._updates.popitem(last=False)[1])
+                self._delivering += 1
+                changed.notify_all()
+            
+            try:
+                await self._deliver(batch)
+                self.delivered += len(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                self.logger.error("Error delivering %d updates: %s", len(batch), e)
+            finally:
+                self.batches += 1
+                async with changed:
+                    self._delivering -= 1
+                    changed.notify_all()
@@ -0,0 +1,97 @@
+"""Tests for admission control of queries."""
+
+import asyncio
+
+import pytest
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.admission import AdmissionController
+from mcp_orchestrator.exceptions import McpOverloadedError
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class CountingMCP:
+    """An MCP recording the highest number of concurrent calls."""
+    
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+    
+    async def get_context(self, query_data):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return "ok"
+
+
+async def gather(orchestrator, count, **kwargs):
+    return await asyncio.gather(
+        *(orchestrator.gather_and_combine_context(i, **kwargs) for i in range(count)),
+        return_exceptions=True,
+    )
+
+
+def test_queries_beyond_limit_wait():
+    async def main():
+        mcp = CountingMCP()
+        controller = AdmissionController(max_in_flight=2)
+        orchestrator = McpOrchestrator(
+            [mcp], SimpleConcatenationStrategy(), admission_control=controller
+        )
+        
+        assert await gather(orchestrator, 6) == ["ok"] * 6
+        assert mcp.max_active == 2
+        assert controller.stats()["admitted"] == 6
+        assert controller.stats()["in_flight"] == 0
+    
+    asyncio.run(main())
+
+
+def test_queries_beyond_queue_are_shed():
+    async def main():
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        orchestrator = McpOrchestrator(
+            [CountingMCP()], SimpleConcatenationStrategy(), admission_control=controller
+        )
+        
+        results = await gather(orchestrator, 4)
+        assert results.count("ok") == 2
+        assert sum(isinstance(r, McpOverloadedError) for r in results) == 2
+        assert controller.stats()["rejected"]["queue_full"] == 2
+    
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def main():
+        controller = AdmissionController(max_in_flight=1)
+        orchestrator = McpOrchestrator(
+            [CountingMCP()], SimpleConcatenationStrategy(), admission_control=controller
+        )
+        
+        first = asyncio.ensure_future(orchestrator.gather_and_combine_context(1))
+        second = asyncio.ensure_future(orchestrator.gather_and_combine_context(2))
+        await asyncio.sleep(0.001)
+        second.cancel()
+        assert await first == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert controller.stats()["in_flight"] == 0
+        assert controller.queue_depth == 0
+    
+    asyncio.run(main())
+
+
+def test_queries_without_admission_control_are_not_limited():
+    async def main():
+        mcp = CountingMCP()
+        orchestrator = McpOrchestrator([mcp], SimpleConcatenationStrategy())
+        
+        assert await gather(orchestrator, 6) == ["ok"] * 6
+        assert mcp.max_active == 6
+    
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""Tests for circuit breakers and their integration with the orchestrator."""
+
+import asyncio
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.circuit import CircuitBreaker, CircuitState
+from mcp_orchestrator.limits import ConcurrencyLimiter
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class FlakyMCP:
+    """An MCP failing while fail is set, counting its calls."""
+    
+    def __init__(self, delay=0.01, fail=True):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+    
+    async def get_context(self, query_data):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("down")
+        return "ok"
+
+
+def make_orchestrator(mcp, breaker, **kwargs):
+    return McpOrchestrator(
+        [mcp], SimpleConcatenationStrategy(","), circuit_breakers={0: breaker}, **kwargs
+    )
+
+
+async def gather(orchestrator, query, count=1):
+    return await asyncio.gather(
+        *(orchestrator.gather_and_combine_context(query) for _ in range(count)),
+        return_exceptions=True,
+    )
+
+
+def test_opens_after_consecutive_failures_and_recovers():
+    async def main():
+        mcp = FlakyMCP()
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05)
+        orchestrator = make_orchestrator(mcp, breaker)
+        for i in range(5):
+            await gather(orchestrator, i)
+        assert breaker.state is CircuitState.OPEN
+        assert mcp.calls == 3
+        assert breaker.rejected == 2
+        
+        await asyncio.sleep(0.06)
+        mcp.fail = False
+        assert await orchestrator.gather_and_combine_context("q") == "ok"
+        assert breaker.state is CircuitState.CLOSED
+    
+    asyncio.run(main())
+
+
+def test_error_rate_threshold():
+    breaker = CircuitBreaker(
+        failure_threshold=None, error_rate_threshold=0.5, window_size=10, min_calls=4
+    )
+    for failed in (False, True, False):
+        breaker.record_failure(ValueError()) if failed else breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure(ValueError())
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_coalesced_failure_is_recorded_once():
+    async def main():
+        mcp = FlakyMCP(delay=0.05)
+        breaker = CircuitBreaker(failure_threshold=5)
+        orchestrator = make_orchestrator(mcp, breaker, coalesce=True)
+        await gather(orchestrator, "q", count=5)
+        assert mcp.calls == 1
+        assert breaker.consecutive_failures == 1
+        assert breaker.state is CircuitState.CLOSED
+    
+    asyncio.run(main())
+
+
+def test_queue_wait_timeouts_do_not_open_breaker():
+    async def main():
+        mcp = FlakyMCP(delay=0.03, fail=False)
+        breaker = CircuitBreaker(failure_threshold=5)
+        orchestrator = make_orchestrator(
+            mcp, breaker,
+            concurrency_limiters={0: ConcurrencyLimiter(1)},
+            mcp_timeouts={0: 0.1},
+        )
+        await gather(orchestrator, "q", count=20)
+        assert 0 < mcp.calls < 20
+        assert breaker.consecutive_failures == 0
+        assert breaker.state is CircuitState.CLOSED
+        assert await orchestrator.gather_and_combine_context("q") == "ok"
+    
+    asyncio.run(main())
+
+
+def test_timeout_of_running_call_counts_as_failure():
+    async def main():
+        mcp = FlakyMCP(delay=1.0, fail=False)
+        breaker = CircuitBreaker(failure_threshold=2)
+        orchestrator = make_orchestrator(mcp, breaker, mcp_timeouts={0: 0.02})
+        for i in range(2):
+            await gather(orchestrator, i)
+        assert breaker.state is CircuitState.OPEN
+    
+    asyncio.run(main())
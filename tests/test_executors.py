@@ -0,0 +1,59 @@
+"""Tests for the executor adapter of synchronous MCPs."""
+
+import asyncio
+import time
+
+import pytest
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.exceptions import McpQueueFullError
+from mcp_orchestrator.executors import run_in_executor
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class SyncMCP:
+    """A synchronous MCP blocking for a while, counting its calls."""
+    
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+    
+    def get_context(self, query_data):
+        self.calls += 1
+        time.sleep(self.delay)
+        return "ok"
+
+
+def test_calls_run_in_executor():
+    async def main():
+        mcp = run_in_executor(SyncMCP(0.01), max_workers=2)
+        try:
+            results = await asyncio.gather(*(mcp.get_context(i) for i in range(4)))
+        finally:
+            mcp.close()
+        assert results == ["ok"] * 4
+    
+    asyncio.run(main())
+
+
+def test_slot_is_held_until_worker_finishes():
+    async def main():
+        sync = SyncMCP(0.2)
+        mcp = run_in_executor(sync, max_workers=1, max_queue=0)
+        orchestrator = McpOrchestrator([mcp], SimpleConcatenationStrategy(), timeout=0.05)
+        try:
+            await orchestrator.gather_and_combine_context("q")
+            
+            # The timed-out call still occupies the only worker
+            assert mcp.limiter.in_flight == 1
+            with pytest.raises(McpQueueFullError):
+                await mcp.get_context("q")
+            
+            await asyncio.sleep(0.25)
+            assert mcp.limiter.in_flight == 0
+            assert await mcp.get_context("q") == "ok"
+            assert sync.calls == 2
+        finally:
+            mcp.close()
+    
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""Tests for hedged calls."""
+
+import asyncio
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.circuit import CircuitBreaker
+from mcp_orchestrator.hedging import HedgePolicy
+from mcp_orchestrator.limits import ConcurrencyLimiter
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class SlowMCP:
+    """An MCP answering its name after a delay, counting its calls."""
+    
+    def __init__(self, name, delay, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+    
+    async def get_context(self, query_data):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ConnectionError(self.name)
+        return self.name
+
+
+def test_slow_primary_is_hedged_to_replica():
+    async def main():
+        primary = SlowMCP("primary", 0.5)
+        replica = SlowMCP("replica", 0.01)
+        policy = HedgePolicy(delay=0.05, max_hedge_ratio=1.0, replicas=[replica])
+        orchestrator = McpOrchestrator(
+            [primary], SimpleConcatenationStrategy(), hedge_policies={0: policy}
+        )
+        
+        assert await orchestrator.gather_and_combine_context("q") == "replica"
+        assert primary.cancelled == 1
+        assert policy.stats()["hedge_wins"] == 1
+    
+    asyncio.run(main())
+
+
+def test_hedge_to_replica_bypasses_primary_limiter_and_breaker():
+    async def main():
+        primary = SlowMCP("primary", 0.5)
+        replica = SlowMCP("replica", 0.01, fail=True)
+        breaker = CircuitBreaker(failure_threshold=1)
+        orchestrator = McpOrchestrator(
+            [primary], SimpleConcatenationStrategy(),
+            concurrency_limiters={0: ConcurrencyLimiter(1)},
+            circuit_breakers={0: breaker},
+            hedge_policies={0: HedgePolicy(
+                delay=0.05, max_hedge_ratio=1.0, replicas=[replica]
+            )},
+        )
+        
+        # Failures of the replica are not charged to the primary's breaker
+        await orchestrator.gather_and_combine_context("q")
+        assert breaker.stats()["consecutive_failures"] == 0
+        
+        replica.fail = False
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await orchestrator.gather_and_combine_context("q") == "replica"
+        assert loop.time() - start < 0.3
+    
+    asyncio.run(main())
+
+
+def test_hedge_ratio_caps_hedges():
+    async def main():
+        primary = SlowMCP("primary", 0.03)
+        replica = SlowMCP("replica", 0.001)
+        policy = HedgePolicy(delay=0.01, max_hedge_ratio=0.0, replicas=[replica])
+        orchestrator = McpOrchestrator(
+            [primary], SimpleConcatenationStrategy(), hedge_policies={0: policy}
+        )
+        
+        assert await orchestrator.gather_and_combine_context("q") == "primary"
+        assert replica.calls == 0
+    
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""Tests for concurrency limiters."""
+
+import asyncio
+
+import pytest
+
+from mcp_orchestrator.exceptions import McpQueueFullError
+from mcp_orchestrator.limits import ConcurrencyLimiter
+
+
+def test_waiters_are_admitted_in_order():
+    async def main():
+        limiter = ConcurrencyLimiter(2)
+        order = []
+        
+        async def call(n):
+            async with limiter:
+                order.append(n)
+                assert limiter.in_flight <= 2
+                await asyncio.sleep(0.005)
+        
+        await asyncio.gather(*(call(n) for n in range(6)))
+        assert order == list(range(6))
+        assert limiter.stats()["in_flight"] == 0
+    
+    asyncio.run(main())
+
+
+def test_full_queue_rejects_calls():
+    async def main():
+        limiter = ConcurrencyLimiter(1, max_queue=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        
+        with pytest.raises(McpQueueFullError):
+            await limiter.acquire()
+        assert limiter.rejected == 1
+        
+        limiter.release()
+        await waiter
+        limiter.release()
+        assert limiter.in_flight == 0
+    
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def main():
+        limiter = ConcurrencyLimiter(1)
+        await limiter.acquire()
+        cancelled = asyncio.ensure_future(limiter.acquire())
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+        limiter.release()
+        await waiting
+        assert limiter.in_flight == 1
+        assert limiter.queue_depth == 0
+    
+    asyncio.run(main())
+
+
+def test_raising_the_limit_admits_waiters():
+    async def main():
+        limiter = ConcurrencyLimiter(1)
+        await limiter.acquire()
+        waiters = [asyncio.ensure_future(limiter.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        
+        limiter.set_limit(3)
+        await asyncio.gather(*waiters)
+        assert limiter.in_flight == 3
+    
+    asyncio.run(main())
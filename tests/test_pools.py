@@ -0,0 +1,113 @@
+"""Tests for replica pools and their load balancers."""
+
+import asyncio
+
+from mcp_orchestrator.pools import PooledMCP, RoundRobinBalancer
+
+
+class ReplicaMCP:
+    """A replica answering after a delay, failing or hanging, counting its calls."""
+    
+    def __init__(self, name, delay=0.001, fail=False, hang=False, healthy=True):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.hang = hang
+        self.healthy = healthy
+        self.calls = 0
+    
+    async def get_context(self, query_data):
+        self.calls += 1
+        if self.hang:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(self.name)
+        return self.name
+    
+    async def health_check(self):
+        return self.healthy
+
+
+async def call_batches(pool, batches, size, timeout=None):
+    results = []
+    for _ in range(batches):
+        results += await asyncio.gather(
+            *(asyncio.wait_for(pool.get_context("q"), timeout) for _ in range(size)),
+            return_exceptions=True,
+        )
+    return results
+
+
+def test_round_robin_spreads_calls():
+    async def main():
+        replicas = [ReplicaMCP(str(i)) for i in range(3)]
+        pool = PooledMCP(replicas, balancer=RoundRobinBalancer())
+        await call_batches(pool, 3, 3)
+        assert [replica.calls for replica in replicas] == [3, 3, 3]
+    
+    asyncio.run(main())
+
+
+def test_failing_replica_is_ejected():
+    async def main():
+        good, dead = ReplicaMCP("good"), ReplicaMCP("dead", fail=True)
+        pool = PooledMCP([good, dead], failure_threshold=3)
+        results = await call_batches(pool, 20, 5)
+        
+        assert dead.calls <= 10
+        assert pool.replicas[1].ejected
+        assert results.count("good") == len(results) - dead.calls
+    
+    asyncio.run(main())
+
+
+def test_hung_replica_times_out_and_is_ejected():
+    async def main():
+        good, hung = ReplicaMCP("good"), ReplicaMCP("hung", hang=True)
+        pool = PooledMCP([good, hung], failure_threshold=3)
+        await call_batches(pool, 6, 10, timeout=0.05)
+        
+        stats = pool.stats()[1]
+        assert stats["errors"] == hung.calls
+        assert stats["ejected"]
+        assert stats["outstanding"] == 0
+        assert hung.calls <= 10
+    
+    asyncio.run(main())
+
+
+def test_replica_in_flight_for_long_is_avoided():
+    async def main():
+        steady, fast = ReplicaMCP("steady", delay=0.005), ReplicaMCP("fast")
+        pool = PooledMCP([steady, fast], failure_threshold=None)
+        await call_batches(pool, 5, 2)
+        
+        # Once measured as the faster one, a replica that starts hanging must
+        # not keep attracting traffic while its calls are in progress
+        fast.hang = True
+        stuck = [asyncio.ensure_future(pool.get_context("q")) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        calls = fast.calls
+        await call_batches(pool, 10, 1, timeout=0.1)
+        assert fast.calls == calls
+        
+        for task in stuck:
+            task.cancel()
+        await asyncio.gather(*stuck, return_exceptions=True)
+    
+    asyncio.run(main())
+
+
+def test_health_check_ejects_and_readmits():
+    async def main():
+        first, second = ReplicaMCP("first"), ReplicaMCP("second", healthy=False)
+        pool = PooledMCP([first, second])
+        assert await pool.health_check()
+        assert pool.replicas[1].ejected
+        
+        second.healthy = True
+        await pool.health_check()
+        assert not pool.replicas[1].ejected
+    
+    asyncio.run(main())
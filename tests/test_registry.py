@@ -0,0 +1,95 @@
+"""Tests for adding and removing MCPs while the orchestrator runs."""
+
+import asyncio
+
+import pytest
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.circuit import CircuitBreaker
+from mcp_orchestrator.exceptions import McpOrchestratorError
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class LifecycleMCP:
+    """An MCP recording its lifecycle hooks."""
+    
+    def __init__(self, name, start_delay=0.0):
+        self.name = name
+        self.start_delay = start_delay
+        self.started = False
+        self.closed = False
+    
+    async def start(self):
+        await asyncio.sleep(self.start_delay)
+        self.started = True
+    
+    async def aclose(self):
+        self.closed = True
+    
+    async def get_context(self, query_data):
+        return self.name
+
+
+def test_added_mcp_is_started_and_called():
+    async def main():
+        async with McpOrchestrator(
+            [LifecycleMCP("a")], SimpleConcatenationStrategy(",")
+        ) as orchestrator:
+            mcp = LifecycleMCP("b")
+            index = await orchestrator.add_mcp(mcp, name="b")
+            assert mcp.started
+            assert index == 1
+            assert await orchestrator.gather_and_combine_context("q") == "a,b"
+            
+            await orchestrator.remove_mcp("b")
+            assert mcp.closed
+            assert await orchestrator.gather_and_combine_context("q") == "a"
+            # Indexes are not reused
+            assert await orchestrator.add_mcp(LifecycleMCP("c")) == 2
+    
+    asyncio.run(main())
+
+
+def test_mcp_failing_registration_is_closed():
+    async def main():
+        base = LifecycleMCP("base")
+        async with McpOrchestrator([base], SimpleConcatenationStrategy(",")) as orchestrator:
+            first = LifecycleMCP("first", start_delay=0.01)
+            second = LifecycleMCP("second", start_delay=0.02)
+            breaker = CircuitBreaker()
+            results = await asyncio.gather(
+                orchestrator.add_mcp(first, name="dup"),
+                orchestrator.add_mcp(second, name="dup", circuit_breaker=breaker),
+                return_exceptions=True,
+            )
+            
+            assert results[0] == 1
+            assert isinstance(results[1], ValueError)
+            assert second.started and second.closed
+            assert not first.closed
+            assert 2 not in orchestrator.circuit_breakers
+            assert orchestrator.mcps == (base, first)
+    
+    asyncio.run(main())
+
+
+def test_mcps_are_replaced_only_before_start():
+    async def main():
+        breakers = {0: CircuitBreaker(), 1: CircuitBreaker()}
+        orchestrator = McpOrchestrator(
+            [LifecycleMCP("a"), LifecycleMCP("b")], SimpleConcatenationStrategy(","),
+            circuit_breakers=breakers,
+        )
+        replacement = LifecycleMCP("c")
+        orchestrator.mcps = [replacement]
+        assert orchestrator.mcps == (replacement,)
+        assert list(orchestrator.circuit_breakers) == [0]
+        
+        async with orchestrator:
+            assert replacement.started
+            assert await orchestrator.gather_and_combine_context("q") == "c"
+            with pytest.raises(McpOrchestratorError):
+                orchestrator.mcps = [LifecycleMCP("d")]
+            assert orchestrator.mcps == (replacement,)
+    
+    asyncio.run(main())
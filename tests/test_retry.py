@@ -0,0 +1,75 @@
+"""Tests for retry policies and retry budgets."""
+
+import asyncio
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.retry import RetryBudget, RetryPolicy
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class FailingMCP:
+    """An MCP failing its first calls, counting its calls."""
+    
+    def __init__(self, failures, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+    
+    async def get_context(self, query_data):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("down")
+        return "ok"
+
+
+def make_orchestrator(mcp, policy, **kwargs):
+    return McpOrchestrator(
+        [mcp], SimpleConcatenationStrategy(), retry_policies={0: policy}, **kwargs
+    )
+
+
+def test_transient_failures_are_retried():
+    async def main():
+        mcp = FailingMCP(2)
+        policy = RetryPolicy(max_attempts=3, initial_backoff=0.001)
+        orchestrator = make_orchestrator(mcp, policy)
+        
+        assert await orchestrator.gather_and_combine_context("q") == "ok"
+        assert mcp.calls == 3
+        assert policy.retries == 2
+    
+    asyncio.run(main())
+
+
+def test_non_retryable_errors_are_not_retried():
+    async def main():
+        mcp = FailingMCP(1, error=ValueError)
+        orchestrator = make_orchestrator(mcp, RetryPolicy(initial_backoff=0.001))
+        
+        assert await orchestrator.gather_and_combine_context("q") is None
+        assert mcp.calls == 1
+    
+    asyncio.run(main())
+
+
+def test_budget_caps_retries_to_a_fraction_of_calls():
+    async def main():
+        mcp = FailingMCP(1000)
+        budget = RetryBudget(ratio=0.2, min_retries_per_second=0)
+        policy = RetryPolicy(max_attempts=3, initial_backoff=0.001, budget=budget)
+        orchestrator = make_orchestrator(mcp, policy)
+        
+        for _ in range(20):
+            await orchestrator.gather_and_combine_context("q")
+        assert policy.retries == 4
+        assert mcp.calls == 24
+        assert budget.exhausted > 0
+    
+    asyncio.run(main())
+
+
+def test_retry_is_not_scheduled_past_the_deadline():
+    policy = RetryPolicy(initial_backoff=1.0, jitter=False)
+    assert policy.next_delay(1, ConnectionError(), remaining=0.5) is None
+    assert policy.next_delay(1, ConnectionError(), remaining=2.0) == 1.0
+    assert policy.next_delay(3, ConnectionError()) is None
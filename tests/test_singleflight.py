@@ -0,0 +1,66 @@
+"""Tests for coalescing identical in-flight calls."""
+
+import asyncio
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.singleflight import SingleFlight
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+
+
+class EchoMCP:
+    """An MCP echoing its query after a delay, counting its calls."""
+    
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = 0
+    
+    async def get_context(self, query_data):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return str(query_data)
+
+
+def test_identical_queries_share_one_call():
+    async def main():
+        mcp = EchoMCP()
+        orchestrator = McpOrchestrator([mcp], SimpleConcatenationStrategy(), coalesce=True)
+        
+        results = await asyncio.gather(
+            *(orchestrator.gather_and_combine_context({"q": 1}) for _ in range(10)),
+            orchestrator.gather_and_combine_context({"q": 2}),
+        )
+        assert results == ["{'q': 1}"] * 10 + ["{'q': 2}"]
+        assert mcp.calls == 2
+        assert orchestrator.single_flight.coalesced == 9
+        assert orchestrator.single_flight.in_flight == 0
+    
+    asyncio.run(main())
+
+
+def test_shared_call_survives_until_every_caller_leaves():
+    async def main():
+        group = SingleFlight()
+        started = []
+        
+        async def call():
+            started.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+        
+        first = asyncio.ensure_future(group.do("key", call))
+        second = asyncio.ensure_future(group.do("key", call))
+        await asyncio.sleep(0.01)
+        
+        first.cancel()
+        assert await second == "done"
+        assert len(started) == 1
+        
+        third = asyncio.ensure_future(group.do("key", call))
+        await asyncio.sleep(0.01)
+        third.cancel()
+        await asyncio.gather(third, return_exceptions=True)
+        await asyncio.sleep(0)
+        # The call nobody waits for any more is cancelled and forgotten
+        assert group.in_flight == 0
+    
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Tests for queued delivery of context updates."""
+
+import asyncio
+
+import pytest
+
+from mcp_orchestrator import McpOrchestrator
+from mcp_orchestrator.exceptions import McpQueueFullError
+from mcp_orchestrator.strategies import SimpleConcatenationStrategy
+from mcp_orchestrator.updates import UpdateQueue
+
+
+class UpdatableMCP:
+    """An MCP recording the updates it receives."""
+    
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.updates = []
+    
+    async def get_context(self, query_data):
+        return "ok"
+    
+    async def update_context(self, response_data):
+        if self.fail:
+            raise ConnectionError("down")
+        self.updates.append(response_data)
+
+
+def test_queued_updates_are_coalesced_by_key():
+    async def main():
+        mcp = UpdatableMCP()
+        queue = UpdateQueue(key=lambda update: update["id"], linger=0.01)
+        orchestrator = McpOrchestrator(
+            [mcp], SimpleConcatenationStrategy(), update_queues={0: queue}
+        )
+        
+        for version in range(3):
+            for key in ("a", "b"):
+                await orchestrator.propagate_update({"id": key, "version": version})
+        await orchestrator.flush_updates()
+        
+        assert mcp.updates == [{"id": "a", "version": 2}, {"id": "b", "version": 2}]
+        assert queue.stats()["coalesced"] == 4
+        assert queue.stats()["delivered"] == 2
+        await orchestrator.drain_updates()
+    
+    asyncio.run(main())
+
+
+def test_full_queue_rejects_when_not_blocking():
+    async def main():
+        queue = UpdateQueue(max_size=2, block=False)
+        delivered = []
+        
+        async def deliver(updates):
+            delivered.extend(updates)
+        
+        queue.bind(deliver)
+        await queue.put(1)
+        await queue.put(2)
+        with pytest.raises(McpQueueFullError):
+            await queue.put(3)
+        
+        await queue.aclose()
+        assert delivered == [1, 2]
+    
+    asyncio.run(main())
+
+
+def test_failed_deliveries_are_counted_and_dropped():
+    async def main():
+        mcp = UpdatableMCP(fail=True)
+        queue = UpdateQueue()
+        orchestrator = McpOrchestrator(
+            [mcp], SimpleConcatenationStrategy(), update_queues={0: queue}
+        )
+        
+        await orchestrator.propagate_update("first")
+        await orchestrator.flush_updates()
+        assert queue.stats()["failed"] == 1
+        assert queue.size == 0
+        
+        mcp.fail = False
+        await orchestrator.propagate_update("second")
+        await orchestrator.drain_updates()
+        assert mcp.updates == ["second"]
+    
+    asyncio.run(main())